@@ -16,6 +16,7 @@ from app.tasks import orm_models as tasks_orm  # noqa: F401
 from app.evaluations import orm_models as evaluations_orm  # noqa: F401
 from app.scheduling import orm_models as scheduling_orm  # noqa: F401
 from app.calendar import orm_models as calendar_orm  # noqa: F401
+from app.membership import orm_models as membership_orm  # noqa: F401
 
 
 settings = get_settings()
@@ -64,6 +65,19 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Skip the full-text search objects the ORM models don't map.
+
+    They are created by DDL hooks in ``app.tasks.orm_models``.
+    """
+    if type_ == "column" and name == "search_vector":
+        return False
+    if type_ == "index" and name.endswith("_search_vector"):
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -91,6 +105,7 @@ def run_migrations_offline() -> None:
         compare_type=True,
         compare_server_default=True,
         include_schemas=settings.use_schema,
+        include_object=include_object,
         version_table_schema=VERSION_TABLE_SCHEMA,
     )
 
@@ -105,6 +120,7 @@ def do_run_migrations(connection: Connection) -> None:
         compare_type=True,
         compare_server_default=True,
         include_schemas=settings.use_schema,
+        include_object=include_object,
         version_table_schema=VERSION_TABLE_SCHEMA,
     )
 
@@ -0,0 +1,53 @@
+"""drop tasks_member and scheduling_member
+
+Membership is read from the shared ``membership`` read model; nothing
+writes these per-context copies any more.
+
+Revision ID: a7e1c4d8b352
+Revises: f6d9a3b5c247
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e1c4d8b352'
+down_revision: Union[str, Sequence[str], None] = 'f6d9a3b5c247'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_table('tasks_member', schema='tasks')
+    op.drop_table('scheduling_member', schema='scheduling')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table('scheduling_member',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('is_manager', sa.Boolean(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_dttm', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_dttm', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['scheduling.scheduling_team.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['scheduling.scheduling_user.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    schema='scheduling'
+    )
+    op.create_table('tasks_member',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['tasks.tasks_teams.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['tasks.tasks_user.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    schema='tasks'
+    )
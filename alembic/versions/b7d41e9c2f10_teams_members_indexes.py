@@ -0,0 +1,31 @@
+"""teams_members indexes for member listings
+
+Revision ID: b7d41e9c2f10
+Revises: aa29cbb73f73
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e9c2f10'
+down_revision: Union[str, Sequence[str], None] = 'aa29cbb73f73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_teams_members_team_id_id', 'teams_members', ['team_id', 'id'], unique=False, schema='teams')
+    op.create_index('ix_teams_members_team_id_role', 'teams_members', ['team_id', 'role'], unique=False, schema='teams')
+    op.create_index('ix_teams_members_user_id_team_id', 'teams_members', ['user_id', 'team_id'], unique=False, schema='teams')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_teams_members_user_id_team_id', table_name='teams_members', schema='teams')
+    op.drop_index('ix_teams_members_team_id_role', table_name='teams_members', schema='teams')
+    op.drop_index('ix_teams_members_team_id_id', table_name='teams_members', schema='teams')
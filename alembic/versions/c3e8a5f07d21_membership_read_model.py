@@ -0,0 +1,46 @@
+"""shared membership read model
+
+Revision ID: c3e8a5f07d21
+Revises: b7d41e9c2f10
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8a5f07d21'
+down_revision: Union[str, Sequence[str], None] = 'b7d41e9c2f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SCHEMA IF NOT EXISTS membership")
+    op.create_table('membership',
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('roles', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('team_id', 'user_id'),
+    schema='membership'
+    )
+    op.create_index('ix_membership_user_id', 'membership', ['user_id'], unique=False, schema='membership')
+    # Role bits as in app.membership.models.RoleMask.
+    op.execute(
+        "INSERT INTO membership.membership (team_id, user_id, roles) "
+        "SELECT team_id, user_id, SUM(DISTINCT CASE role "
+        "WHEN 'member' THEN 1 WHEN 'manager' THEN 2 WHEN 'admin' THEN 4 "
+        "ELSE 0 END) "
+        "FROM teams.teams_members GROUP BY team_id, user_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_membership_user_id', table_name='membership', schema='membership')
+    op.drop_table('membership', schema='membership')
+    op.execute("DROP SCHEMA IF EXISTS membership")
@@ -0,0 +1,47 @@
+"""tasks and comments full-text search
+
+Revision ID: c9f2d4a6b813
+Revises: c3e8a5f07d21
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f2d4a6b813'
+down_revision: Union[str, Sequence[str], None] = 'c3e8a5f07d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same documents as app.tasks.orm_models._SEARCH_DOCUMENTS.
+TASK_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+COMMENT_DOCUMENT = "to_tsvector('simple', coalesce(text, ''))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "ALTER TABLE tasks.tasks ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({TASK_DOCUMENT}) STORED"
+    )
+    op.execute(
+        "ALTER TABLE tasks.tasks_comment ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({COMMENT_DOCUMENT}) STORED"
+    )
+    op.create_index('ix_tasks_search_vector', 'tasks', ['search_vector'], unique=False, schema='tasks', postgresql_using='gin')
+    op.create_index('ix_tasks_comment_search_vector', 'tasks_comment', ['search_vector'], unique=False, schema='tasks', postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_comment_search_vector', table_name='tasks_comment', schema='tasks')
+    op.drop_index('ix_tasks_search_vector', table_name='tasks', schema='tasks')
+    op.drop_column('tasks_comment', 'search_vector', schema='tasks')
+    op.drop_column('tasks', 'search_vector', schema='tasks')
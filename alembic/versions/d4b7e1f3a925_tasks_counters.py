@@ -0,0 +1,45 @@
+"""tasks counters read model and overdue index
+
+Revision ID: d4b7e1f3a925
+Revises: c9f2d4a6b813
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b7e1f3a925'
+down_revision: Union[str, Sequence[str], None] = 'c9f2d4a6b813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tasks_counters',
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('executor_id', sa.Integer(), nullable=False),
+    sa.Column('status', postgresql.ENUM('OPEN', 'IN_PROGRESS', 'DONE', name='tasks_status', create_type=False), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('team_id', 'executor_id', 'status'),
+    schema='tasks'
+    )
+    op.create_index('ix_tasks_team_id_deadline_unfinished', 'tasks', ['team_id', 'deadline'], unique=False, schema='tasks', postgresql_where=sa.text("NOT deleted AND status <> 'DONE'"))
+    # Executor 0 stands for unassigned, as in app.tasks.orm_models.TaskCounterOrm.
+    op.execute(
+        "INSERT INTO tasks.tasks_counters (team_id, executor_id, status, count) "
+        "SELECT team_id, coalesce(executor_id, 0), status, count(*) "
+        "FROM tasks.tasks WHERE NOT deleted AND team_id IS NOT NULL "
+        "GROUP BY team_id, coalesce(executor_id, 0), status"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_team_id_deadline_unfinished', table_name='tasks', schema='tasks')
+    op.drop_table('tasks_counters', schema='tasks')
@@ -0,0 +1,36 @@
+"""tasks deadline timers
+
+Revision ID: e5c8f2a4b136
+Revises: d4b7e1f3a925
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c8f2a4b136'
+down_revision: Union[str, Sequence[str], None] = 'd4b7e1f3a925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tasks_deadline_timers',
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=16), nullable=False),
+    sa.Column('deadline', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('task_id', 'kind', 'deadline'),
+    schema='tasks'
+    )
+    op.create_index('ix_tasks_deadline_unfinished', 'tasks', ['deadline'], unique=False, schema='tasks', postgresql_where=sa.text("NOT deleted AND status <> 'DONE'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_deadline_unfinished', table_name='tasks', schema='tasks')
+    op.drop_table('tasks_deadline_timers', schema='tasks')
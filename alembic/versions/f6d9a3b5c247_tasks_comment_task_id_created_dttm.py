@@ -0,0 +1,27 @@
+"""tasks_comment index for paginated comment listings
+
+Revision ID: f6d9a3b5c247
+Revises: e5c8f2a4b136
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6d9a3b5c247'
+down_revision: Union[str, Sequence[str], None] = 'e5c8f2a4b136'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_comment_task_id_created_dttm', 'tasks_comment', ['task_id', 'created_dttm'], unique=False, schema='tasks')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_comment_task_id_created_dttm', table_name='tasks_comment', schema='tasks')
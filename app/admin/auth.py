@@ -1,12 +1,16 @@
 """Authentication backend for sqladmin."""
 
-from pwdlib import PasswordHash
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqladmin.authentication import AuthenticationBackend
 from starlette.requests import Request
 
+from app.core.infrastructure.cache import TTLCache
 from app.identity.orm_models import UserORM
+from app.identity.password import AsyncPasswordHasher
+
+
+AdminCache = TTLCache[int, bool]
 
 
 class AdminAuthBackend(AuthenticationBackend):
@@ -16,10 +20,13 @@ class AdminAuthBackend(AuthenticationBackend):
             self,
             secret_key: str,
             session_factory: async_sessionmaker[AsyncSession],
+            password_hasher: AsyncPasswordHasher,
+            cache: AdminCache | None = None,
     ):
         super().__init__(secret_key=secret_key)
-        self._password_hasher = PasswordHash.recommended()
+        self._password_hasher = password_hasher
         self._session_factory = session_factory
+        self._cache = cache
 
     async def login(self, request: Request) -> bool:
         """Logs in superuser by email and password."""
@@ -38,7 +45,10 @@ class AdminAuthBackend(AuthenticationBackend):
         if user is None or not user.is_superuser or user.deleted:
             return False
 
-        if not self._password_hasher.verify(password, user.hashed_password):
+        verified, _ = await self._password_hasher.verify_and_update(
+            password, user.hashed_password
+        )
+        if not verified:
             return False
 
         request.session.update(
@@ -47,6 +57,8 @@ class AdminAuthBackend(AuthenticationBackend):
                 "admin_email": user.email,
             }
         )
+        if self._cache is not None:
+            self._cache.set(int(user.id), True)
         return True
 
     async def logout(self, request: Request) -> bool:
@@ -55,15 +67,27 @@ class AdminAuthBackend(AuthenticationBackend):
         return True
 
     async def authenticate(self, request: Request) -> bool:
-        """Validates existing admin session."""
+        """Validates existing admin session.
+
+        Validity is cached per admin_user_id for a short TTL and dropped
+        on UserUpdated/UserDeleted and on user edits in the admin itself.
+        """
         admin_user_id = request.session.get("admin_user_id")
         if not admin_user_id:
             return False
 
+        if self._cache is not None:
+            is_valid = self._cache.get(int(admin_user_id))
+            if is_valid is not None:
+                return is_valid
+
         async with self._session_factory() as session:
             result = await session.execute(
                 select(UserORM).filter_by(id=int(admin_user_id))
             )
             user = result.scalar_one_or_none()
 
-        return bool(user and user.is_superuser and not user.deleted)
+        is_valid = bool(user and user.is_superuser and not user.deleted)
+        if self._cache is not None:
+            self._cache.set(int(admin_user_id), is_valid)
+        return is_valid
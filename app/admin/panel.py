@@ -18,16 +18,18 @@ def setup_admin(app: FastAPI, engine: AsyncEngine) -> Admin:
         authentication_backend=AdminAuthBackend(
             secret_key=settings.secret_key,
             session_factory=app.state.async_session,
+            password_hasher=app.state.password_hasher,
+            cache=getattr(app.state, "admin_cache", None),
         ),
     )
     admin.add_view(views.UserAdmin)
     admin.add_view(views.TeamAdmin)
     admin.add_view(views.TeamMemberAdmin)
     admin.add_view(views.TeamUserAdmin)
+    admin.add_view(views.MembershipAdmin)
     admin.add_view(views.TaskAdmin)
     admin.add_view(views.TaskCommentAdmin)
     admin.add_view(views.TaskTeamAdmin)
-    admin.add_view(views.TaskMemberAdmin)
     admin.add_view(views.TaskUserAdmin)
     admin.add_view(views.EvaluationAdmin)
     admin.add_view(views.EvaluationTaskAdmin)
@@ -35,7 +37,6 @@ def setup_admin(app: FastAPI, engine: AsyncEngine) -> Admin:
     admin.add_view(views.SchedulingMeetingAdmin)
     admin.add_view(views.SchedulingParticipantAdmin)
     admin.add_view(views.SchedulingTeamAdmin)
-    admin.add_view(views.SchedulingMemberAdmin)
     admin.add_view(views.SchedulingUserAdmin)
     admin.add_view(views.CalendarEventAdmin)
     admin.add_view(views.CalendarUserAdmin)
@@ -1,18 +1,19 @@
 """sqladmin model views."""
 
 from sqladmin import ModelView
+from starlette.requests import Request
 
 from app.calendar.orm_models import CalendarEventOrm, CalendarUserOrm
 from app.evaluations.orm_models import EvaluationOrm, EvaluationTaskOrm, EvaluationUserOrm
 from app.identity.orm_models import UserORM
+from app.membership.orm_models import MembershipOrm
 from app.scheduling.orm_models import (
     SchedulingMeetingOrm,
     SchedulingMeetingParticipantOrm,
-    SchedulingMemberOrm,
     SchedulingTeamOrm,
     SchedulingUserOrm,
 )
-from app.tasks.orm_models import CommentOrm, TaskMemberOrm, TaskOrm, TaskTeamOrm, TaskUserOrm
+from app.tasks.orm_models import CommentOrm, TaskOrm, TaskTeamOrm, TaskUserOrm
 from app.teams.orm_models import MemberOrm, TeamOrm, TeamUserOrm
 
 IDENTITY_CATEGORY = "Identity"
@@ -42,6 +43,19 @@ class UserAdmin(ModelView, model=UserORM):
     can_edit = True
     can_delete = False
 
+    async def after_model_change(
+            self, data: dict, model: UserORM, is_created: bool,
+            request: Request,
+    ) -> None:
+        """Drop cached auth state: admin edits bypass domain events."""
+        state = request.app.state
+        admin_cache = getattr(state, "admin_cache", None)
+        if admin_cache is not None:
+            admin_cache.invalidate(model.id)
+        user_cache = getattr(state, "user_cache", None)
+        if user_cache is not None:
+            user_cache.invalidate_where(lambda key: key[0] == model.id)
+
 
 class TeamAdmin(ModelView, model=TeamOrm):
     """Admin view for teams."""
@@ -79,6 +93,17 @@ class TeamUserAdmin(ModelView, model=TeamUserOrm):
     can_delete = False
 
 
+class MembershipAdmin(ModelView, model=MembershipOrm):
+    """Read-only view of the shared membership read model."""
+
+    category = TEAMS_CATEGORY
+    column_list = [MembershipOrm.team_id, MembershipOrm.user_id, MembershipOrm.roles]
+    column_sortable_list = [MembershipOrm.team_id, MembershipOrm.user_id]
+    can_create = False
+    can_edit = False
+    can_delete = False
+
+
 class TaskAdmin(ModelView, model=TaskOrm):
     """Admin view for tasks."""
 
@@ -123,18 +148,6 @@ class TaskTeamAdmin(ModelView, model=TaskTeamOrm):
     can_delete = False
 
 
-class TaskMemberAdmin(ModelView, model=TaskMemberOrm):
-    """Admin view for task members."""
-
-    category = TASKS_CATEGORY
-    column_list = [TaskMemberOrm.id, TaskMemberOrm.team_id, TaskMemberOrm.user_id, TaskMemberOrm.role]
-    column_searchable_list = [TaskMemberOrm.role]
-    column_sortable_list = [TaskMemberOrm.id, TaskMemberOrm.team_id, TaskMemberOrm.user_id]
-    can_create = False
-    can_edit = False
-    can_delete = False
-
-
 class TaskUserAdmin(ModelView, model=TaskUserOrm):
     """Admin view for task users."""
 
@@ -232,22 +245,6 @@ class SchedulingTeamAdmin(ModelView, model=SchedulingTeamOrm):
     can_delete = False
 
 
-class SchedulingMemberAdmin(ModelView, model=SchedulingMemberOrm):
-    """Admin view for scheduling members."""
-
-    category = SCHEDULING_CATEGORY
-    column_list = [
-        SchedulingMemberOrm.id,
-        SchedulingMemberOrm.team_id,
-        SchedulingMemberOrm.user_id,
-        SchedulingMemberOrm.is_manager,
-    ]
-    column_sortable_list = [SchedulingMemberOrm.id, SchedulingMemberOrm.team_id, SchedulingMemberOrm.user_id]
-    can_create = False
-    can_edit = False
-    can_delete = False
-
-
 class SchedulingUserAdmin(ModelView, model=SchedulingUserOrm):
     """Admin view for scheduling users."""
 
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Sequence
 
 from app.calendar import models
 from app.core.custom_types import calendar_type, ids
@@ -70,35 +71,47 @@ class CalendarTaskCreatedHandler(EventHandler[task_event.TaskCreated]):
         self.uow = uow
 
     async def handle(self, event: task_event.TaskCreated) -> None:
+        await self.handle_many([event])
+
+    async def handle_many(
+        self, events: Sequence[task_event.TaskCreated]
+    ) -> None:
+        """Apply the batch in one transaction."""
         async with self.uow as uow:
-            deadline = event.deadline
-            if deadline is None:
-                return
-            if deadline.tzinfo is None:
-                deadline = deadline.replace(tzinfo=timezone.utc)
-            target_user_ids = [event.supervisor_id]
-            if event.executor_id is not None:
-                target_user_ids.append(event.executor_id)
-            for user_id in target_user_ids:
-                user = await uow.repos.user.get_by_id(user_id)
-                if user is None:
-                    await uow.repos.user.save(
-                        models.CalendarUser(
-                            id=ids.UserId(user_id),
-                            username="",
-                        )
+            for event in events:
+                await self._apply(uow, event)
+            await uow.commit()
+
+    async def _apply(
+        self, uow: CalendarHandlerUnitOfWork, event: task_event.TaskCreated
+    ) -> None:
+        deadline = event.deadline
+        if deadline is None:
+            return
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+        target_user_ids = [event.supervisor_id]
+        if event.executor_id is not None:
+            target_user_ids.append(event.executor_id)
+        for user_id in target_user_ids:
+            user = await uow.repos.user.get_by_id(user_id)
+            if user is None:
+                await uow.repos.user.save(
+                    models.CalendarUser(
+                        id=ids.UserId(user_id),
+                        username="",
                     )
-                calendar_event = _build_calendar_event(
-                    user_id=user_id,
-                    event_type=calendar_type.CalendarEventType.TASK,
-                    reference_id=event.task_id,
-                    title=event.title or f"Task #{event.task_id}",
-                    description=event.description or "",
-                    time=deadline,
-                    cancelled=event.deleted,
                 )
-                await uow.repos.event.save(calendar_event)
-            await uow.commit()
+            calendar_event = _build_calendar_event(
+                user_id=user_id,
+                event_type=calendar_type.CalendarEventType.TASK,
+                reference_id=event.task_id,
+                title=event.title or f"Task #{event.task_id}",
+                description=event.description or "",
+                time=deadline,
+                cancelled=event.deleted,
+            )
+            await uow.repos.event.save(calendar_event)
 
 
 class CalendarTaskUpdatedHandler(EventHandler[task_event.TaskUpdated]):
@@ -108,58 +121,70 @@ class CalendarTaskUpdatedHandler(EventHandler[task_event.TaskUpdated]):
         self.uow = uow
 
     async def handle(self, event: task_event.TaskUpdated) -> None:
+        await self.handle_many([event])
+
+    async def handle_many(
+        self, events: Sequence[task_event.TaskUpdated]
+    ) -> None:
+        """Apply the batch in one transaction."""
         async with self.uow as uow:
-            deadline = event.deadline
-            if deadline is None:
-                return
-            if deadline.tzinfo is None:
-                deadline = deadline.replace(tzinfo=timezone.utc)
-
-            if (
-                event.previous_executor_id is not None
-                and event.executor_id != event.previous_executor_id
-            ):
-                previous_executor_event = await uow.repos.event.get_by_user_and_reference(
-                    user_id=event.previous_executor_id,
-                    event_type=calendar_type.CalendarEventType.TASK,
-                    reference_id=event.task_id,
-                )
-                if previous_executor_event is not None:
-                    previous_executor_event.mark_cancelled()
-                    await uow.repos.event.save(previous_executor_event)
-
-            target_user_ids = [event.supervisor_id]
-            if event.executor_id is not None:
-                target_user_ids.append(event.executor_id)
-            for user_id in target_user_ids:
-                user = await uow.repos.user.get_by_id(user_id)
-                if user is None:
-                    await uow.repos.user.save(
-                        models.CalendarUser(
-                            id=ids.UserId(user_id),
-                            username="",
-                        )
-                    )
-                calendar_event = _build_calendar_event(
-                    user_id=user_id,
-                    event_type=calendar_type.CalendarEventType.TASK,
-                    reference_id=event.task_id,
-                    title=event.title or f"Task #{event.task_id}",
-                    description=event.description or "",
-                    time=deadline,
-                    cancelled=event.deleted,
-                )
-                await uow.repos.event.save(calendar_event)
+            for event in events:
+                await self._apply(uow, event)
+            await uow.commit()
 
-            if event.deleted:
-                events = await uow.repos.event.get_by_reference(
-                    event_type=calendar_type.CalendarEventType.TASK,
-                    reference_id=event.task_id,
+    async def _apply(
+        self, uow: CalendarHandlerUnitOfWork, event: task_event.TaskUpdated
+    ) -> None:
+        deadline = event.deadline
+        if deadline is None:
+            return
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+
+        if (
+            event.previous_executor_id is not None
+            and event.executor_id != event.previous_executor_id
+        ):
+            previous_executor_event = await uow.repos.event.get_by_user_and_reference(
+                user_id=event.previous_executor_id,
+                event_type=calendar_type.CalendarEventType.TASK,
+                reference_id=event.task_id,
+            )
+            if previous_executor_event is not None:
+                previous_executor_event.mark_cancelled()
+                await uow.repos.event.save(previous_executor_event)
+
+        target_user_ids = [event.supervisor_id]
+        if event.executor_id is not None:
+            target_user_ids.append(event.executor_id)
+        for user_id in target_user_ids:
+            user = await uow.repos.user.get_by_id(user_id)
+            if user is None:
+                await uow.repos.user.save(
+                    models.CalendarUser(
+                        id=ids.UserId(user_id),
+                        username="",
+                    )
                 )
-                for item in events:
-                    item.mark_cancelled()
-                    await uow.repos.event.save(item)
-            await uow.commit()
+            calendar_event = _build_calendar_event(
+                user_id=user_id,
+                event_type=calendar_type.CalendarEventType.TASK,
+                reference_id=event.task_id,
+                title=event.title or f"Task #{event.task_id}",
+                description=event.description or "",
+                time=deadline,
+                cancelled=event.deleted,
+            )
+            await uow.repos.event.save(calendar_event)
+
+        if event.deleted:
+            events = await uow.repos.event.get_by_reference(
+                event_type=calendar_type.CalendarEventType.TASK,
+                reference_id=event.task_id,
+            )
+            for item in events:
+                item.mark_cancelled()
+                await uow.repos.event.save(item)
 
 
 class CalendarMeetingCreatedHandler(EventHandler[meeting_event.MeetingCreated]):
@@ -6,11 +6,15 @@ from datetime import datetime
 
 
 class CalendarUser(BaseUser):
-    ...
+    __slots__ = ()
 
 
 class CalendarEvent(Entity):
     """Represents one user calendar event."""
+    __slots__ = (
+        "_user_id", "_id", "_type", "_title", "_description", "_time",
+        "_reference_id", "_cancelled",
+    )
 
     def __init__(
         self,
@@ -70,6 +74,7 @@ class CalendarEvent(Entity):
 
 class Calendar(Entity):
     """Stores and filters user calendar events."""
+    __slots__ = ("_user_id", "_calendar_events")
 
     def __init__(
         self, user_id: ids.UserId,
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 
 from app.calendar import dto, models
 from app.core.custom_types import ids
+from app.core.infrastructure.tracing import traced
 from app.core.uow.calendar import CalendarUnitOfWork
 
 
@@ -26,6 +27,7 @@ class CalendarEventsForDayUseCase:
     def __init__(self, uow: CalendarUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, user_id: int, day: date) -> dto.CalendarEventsDTO:
         day_start = datetime.combine(day, time.min).replace(tzinfo=timezone.utc)
         day_end = day_start + timedelta(days=1)
@@ -48,6 +50,7 @@ class CalendarEventsForMonthUseCase:
     def __init__(self, uow: CalendarUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
             self,
             user_id: int,
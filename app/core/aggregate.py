@@ -3,6 +3,7 @@ from app.core.infrastructure.event import DomainEvent
 
 class AggregateRoot:
     """Base class for aggregate roots that record domain events."""
+    __slots__ = ("_events",)
 
     def __init__(self):
         """Initialize the aggregate with an empty event list."""
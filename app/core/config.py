@@ -8,8 +8,26 @@ class Settings(BaseSettings):
     database_name: str | None = None
     database_host: str | None = None
     database_port: int | None = None
+    database_url: str | None = None
+    database_echo: bool = True
     test: bool | None = None
     secret_key: str = ""
+    debug: bool = False
+    query_repeat_threshold: int = 10
+    slow_query_threshold_ms: float = 200.0
+    slow_query_top_n: int = 20
+    tracing_exporter: str | None = None
+    tracing_json_path: str | None = None
+    auth_cache_ttl_seconds: float = 30.0
+    auth_cache_max_size: int = 10_000
+    password_hash_workers: int = 4
+    admin_auth_cache_ttl_seconds: float = 10.0
+    capability_cache_ttl_seconds: float = 30.0
+    capability_cache_max_size: int = 50_000
+    deadline_scheduler_enabled: bool = True
+    deadline_reminder_seconds: float = 86_400.0
+    deadline_horizon_seconds: float = 3_600.0
+    deadline_catch_up_seconds: float = 86_400.0
     model_config = SettingsConfigDict(env_file="././.env")
 
     @property
@@ -17,3 +35,16 @@ class Settings(BaseSettings):
         """Use database schema
         (False for SQLite in tests, True for PostgreSQL in prod)"""
         return not self.test
+
+    @property
+    def database_dsn(self) -> str:
+        """SQLAlchemy URL: ``database_url`` if set, else the PostgreSQL
+        URL built from the ``database_*`` parts."""
+        if self.database_url:
+            return self.database_url
+        return (
+            f"postgresql+asyncpg://{self.database_user}:"
+            f"{self.database_password}@"
+            f"{self.database_host}:{self.database_port}/"
+            f"{self.database_name}"
+        )
@@ -0,0 +1,5 @@
+from enum import Enum
+
+class DeadlineKind(str, Enum):
+    APPROACHING = "approaching"
+    OVERDUE = "overdue"
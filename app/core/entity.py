@@ -10,7 +10,10 @@ class Entity(ABC):
 
     Entities are compared by identity, not by their attributes.
     Each entity instance must define a unique `id`.
+    Subclasses declare ``__slots__`` so loaded entities carry no
+    per-instance ``__dict__``.
     """
+    __slots__ = ()
     id = 0  # Must be set for each instance (identity of the entity)
 
     def __repr__(self):
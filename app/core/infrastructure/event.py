@@ -1,4 +1,4 @@
-from typing import Type, TypeVar, Generic
+from typing import Sequence, Type, TypeVar, Generic
 from abc import ABC, abstractmethod
 
 
@@ -18,6 +18,14 @@ class EventHandler(ABC, Generic[TEvent]):
         """Handle domain event."""
         ...
 
+    async def handle_many(self, events: Sequence[TEvent]) -> None:
+        """Handle a batch of events of one type, in order.
+
+        Handlers that can do the work of a batch at once override this.
+        """
+        for event in events:
+            await self.handle(event)
+
 
 class EventBus(ABC):
     """Protocol for event bus."""
@@ -30,6 +38,11 @@ class EventBus(ABC):
         """Publish event to all subscribers."""
         ...
 
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """Publish events in order; see ``MemoryEventBus.publish_many``."""
+        for event in events:
+            await self.publish(event)
+
     @abstractmethod
     async def subscribe(
         self,
@@ -1,6 +1,10 @@
+import time
 from collections import defaultdict
-from typing import Type
+from itertools import groupby
+from typing import Sequence, Type
 
+from app.core.infrastructure import metrics, tracing
+from app.core.infrastructure.query_counter import query_scope
 from app.core.infrastructure.event import (
     DomainEvent,
     EventHandler,
@@ -28,6 +32,42 @@ class MemoryEventBus(EventBus):
 
     async def publish(self, event: DomainEvent) -> None:
         """Publish event to all registered handlers."""
-        for handler in self._handlers[type(event)]:
-            await handler.handle(event)
+        await self._dispatch(type(event), [event])
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """Publish events, batching runs of the same event type.
+
+        Each run goes to every handler's ``handle_many`` at once, so the
+        overall order of events is kept.
+        """
+        for event_type, run in groupby(events, key=type):
+            await self._dispatch(event_type, list(run))
+
+    async def _dispatch(
+        self, event_type: Type[DomainEvent], events: list[DomainEvent]
+    ) -> None:
+        event_name = event_type.__name__
+        metrics.events_published_total.inc(len(events), event=event_name)
+        for handler in self._handlers[event_type]:
+            handler_name = type(handler).__name__
+            started = time.perf_counter()
+            try:
+                with (
+                    query_scope(handler_name),
+                    tracing.span(
+                        f"{handler_name}.handle",
+                        event=event_name,
+                    ),
+                ):
+                    if len(events) == 1:
+                        await handler.handle(events[0])
+                    else:
+                        await handler.handle_many(events)
+            except Exception:
+                metrics.event_handler_failures_total.inc(handler=handler_name)
+                raise
+            finally:
+                metrics.event_handler_duration_seconds.observe(
+                    time.perf_counter() - started, handler=handler_name
+                )
 
@@ -0,0 +1,357 @@
+"""Dependency-free metrics registry with Prometheus text exposition.
+
+Updates are plain attribute increments on per-label-set children, which
+is safe for the single event-loop thread and cheap enough to leave on.
+"""
+
+import bisect
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, TypeVar, cast
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+LabelValues = tuple[str, ...]
+M = TypeVar("M", bound="_Metric")
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric(ABC):
+    type_name = ""
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Iterable[str] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, "
+                f"got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """Return the exposition lines of every child."""
+        ...
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} "
+            f"{_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be read from a callback."""
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelValues, float] = {}
+        self._functions: dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float], **labels) -> None:
+        """Evaluate ``function`` at scrape time instead of storing a value."""
+        self._functions[self._key(labels)] = function
+
+    def value(self, **labels: str) -> float:
+        key = self._key(labels)
+        if key in self._functions:
+            return float(self._functions[key]())
+        return self._values.get(key, 0.0)
+
+    def samples(self) -> list[str]:
+        values = dict(self._values)
+        for key, function in self._functions.items():
+            values[key] = float(function())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} "
+            f"{_format_value(value)}"
+            for key, value in values.items()
+        ]
+
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets."""
+    type_name = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Iterable[str] = (),
+            buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def samples(self) -> list[str]:
+        lines = []
+        bucket_labels = self.labelnames + ("le",)
+        for key, counts in self._counts.items():
+            cumulative = 0
+            for bound, bucket_count in zip(
+                    self.buckets + (math.inf,), counts
+            ):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    bucket_labels, key + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(
+                f"{self.name}_sum{labels} {_format_value(self._sums[key])}"
+            )
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str,
+                labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str,
+              labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str,
+                  labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(
+            Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ("method", "route"),
+)
+db_pool_connections = registry.gauge(
+    "db_pool_connections",
+    "Database pool connections by state.",
+    ("state",),
+)
+events_published_total = registry.counter(
+    "events_published_total",
+    "Domain events published on the event bus.",
+    ("event",),
+)
+event_handler_duration_seconds = registry.histogram(
+    "event_handler_duration_seconds",
+    "Event handler latency.",
+    ("handler",),
+)
+event_handler_failures_total = registry.counter(
+    "event_handler_failures_total",
+    "Event handlers that raised.",
+    ("handler",),
+)
+tasks_created_total = registry.counter(
+    "tasks_created_total", "Tasks created."
+)
+tasks_deadline_approaching_total = registry.counter(
+    "tasks_deadline_approaching_total", "Task deadline reminders fired."
+)
+tasks_overdue_total = registry.counter(
+    "tasks_overdue_total", "Tasks that went overdue."
+)
+meetings_created_total = registry.counter(
+    "meetings_created_total", "Meetings created."
+)
+evaluations_recorded_total = registry.counter(
+    "evaluations_recorded_total", "Evaluations recorded."
+)
+
+
+def register_pool_metrics(engine) -> None:
+    """Expose pool usage of an engine as scrape-time gauges."""
+    pool = getattr(engine, "sync_engine", engine).pool
+    for state, attr in (
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("checked_in", "checkedin"),
+        ("overflow", "overflow"),
+    ):
+        reader = getattr(pool, attr, None)
+        if callable(reader):
+            # Pools that track connections report them as int counts.
+            db_pool_connections.set_function(
+                cast(Callable[[], int], reader), state=state
+            )
+
+
+def route_template(scope: Scope) -> str:
+    """Full path template of the matched route, e.g. ``/api/v1/teams/{team_id}``.
+
+    Included routers only know their own path, so the prefix is recovered
+    by rendering the template with the matched params and stripping it
+    from the request path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(
+        route, "path", None
+    )
+    if not template:
+        return "unmatched"
+    try:
+        rendered = template.format(
+            **{k: str(v) for k, v in scope.get("path_params", {}).items()}
+        )
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope["path"]
+    if rendered and path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class MetricsMiddleware:
+    """Records per-route latency and status of HTTP requests.
+
+    The route label is the matched path template, so path parameters do
+    not blow up label cardinality; unmatched requests share one label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+            self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route_path = route_template(scope)
+            method = scope["method"]
+            http_requests_total.inc(
+                method=method, route=route_path, status=str(status_code)
+            )
+            http_request_duration_seconds.observe(
+                time.perf_counter() - started,
+                method=method,
+                route=route_path,
+            )
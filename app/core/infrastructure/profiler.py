@@ -0,0 +1,148 @@
+"""Sampling profiler that can be switched on for a live process.
+
+A daemon thread snapshots the event loop thread's stack with
+``sys._current_frames()`` at a fixed interval and aggregates the frames
+that belong to the ``app`` package into collapsed stacks
+(``frame;frame;frame count``), the input format of flamegraph.pl and
+speedscope. Suspended coroutines are not on the stack, so this is an
+on-CPU profile of the loop thread.
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profiling session is already running."""
+
+
+class SamplingProfiler:
+    """Timer-thread stack sampler limited by time and/or request count."""
+
+    def __init__(self, package: str = "app"):
+        self.package = package
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._interval = 0.005
+        self._deadline: float | None = None
+        self._max_requests: int | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+            self,
+            *,
+            seconds: float | None = None,
+            requests: int | None = None,
+            interval: float = 0.005,
+    ) -> None:
+        """Start sampling the calling thread (the event loop).
+
+        Stops after ``seconds`` or ``requests`` completed requests,
+        whichever comes first; at least one limit is required.
+        """
+        if seconds is None and requests is None:
+            raise ValueError("seconds or requests is required")
+        with self._lock:
+            if self.running:
+                raise ProfilerBusyError("Profiler is already running")
+            self.stacks = Counter()
+            self.samples = 0
+            self.requests = 0
+            self._interval = interval
+            self._deadline = (
+                time.monotonic() + seconds if seconds is not None else None
+            )
+            self._max_requests = requests
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(threading.get_ident(),),
+                name="sampling-profiler",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def request_finished(self) -> None:
+        """Count a served request; stop once the request budget is spent."""
+        if not self.running:
+            return
+        self.requests += 1
+        if self._max_requests is not None and (
+                self.requests >= self._max_requests
+        ):
+            self._stop.set()
+
+    def collapsed(self) -> str:
+        """Aggregated stacks in collapsed (folded) format."""
+        with self._lock:
+            return "".join(
+                f"{stack} {count}\n"
+                for stack, count in self.stacks.most_common()
+            )
+
+    def _run(self, target_thread_id: int) -> None:
+        while not self._stop.wait(self._interval):
+            if self._deadline is not None and (
+                    time.monotonic() >= self._deadline
+            ):
+                break
+            frame = sys._current_frames().get(target_thread_id)
+            if frame is None:
+                continue
+            stack = self._collapse(frame)
+            with self._lock:
+                self.samples += 1
+                if stack:
+                    self.stacks[stack] += 1
+        self._stop.set()
+
+    def _collapse(self, frame: FrameType | None) -> str:
+        names = []
+        prefix = self.package + "."
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module == self.package or module.startswith(prefix):
+                names.append(f"{module}:{frame.f_code.co_qualname}")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+class ProfilerMiddleware:
+    """Feeds completed HTTP requests into the request budget of the
+    profiler stored on ``app.state.profiler``."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+            self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        profiler = None
+        if scope["type"] == "http":
+            profiler = getattr(scope["app"].state, "profiler", None)
+        if profiler is None or not profiler.running:
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.request_finished()
@@ -0,0 +1,169 @@
+"""Per-request / per-handler SQL statement counting and N+1 detection.
+
+Statements are attributed to every active scope, so a request scope also
+includes the queries of the event handlers it triggers, while each
+handler additionally gets its own scope.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+logger = logging.getLogger(__name__)
+
+_scopes: ContextVar[tuple["QueryStats", ...]] = ContextVar(
+    "query_scopes", default=()
+)
+_repeat_threshold = 10
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(
+    r"\((?:\s*(?:\?|\$\d+|%s|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|\$\d+|%s|%\(\w+\)s|:\w+)\s*\)"
+)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_NUMBERED_PARAM = re.compile(r"\$\d+|%\(\w+\)s|:\w+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so that repeats differing only in literal
+    values, placeholder numbering or IN-list length compare equal."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _STRING.sub("?", shape)
+    shape = _NUMBERED_PARAM.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return shape
+
+
+@dataclass
+class QueryStats:
+    """Statements executed inside one scope."""
+    label: str
+    count: int = 0
+    total_seconds: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed more than ``threshold`` times."""
+        return [
+            (shape, times)
+            for shape, times in self.shapes.most_common()
+            if times > threshold
+        ]
+
+
+def current_scope_label() -> str | None:
+    """Label of the innermost active scope (route or event handler)."""
+    scopes = _scopes.get()
+    return scopes[-1].label if scopes else None
+
+
+@contextmanager
+def query_scope(label: str) -> Iterator[QueryStats]:
+    """Count statements executed in this context; warn on repeats."""
+    stats = QueryStats(label)
+    token = _scopes.set(_scopes.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _scopes.reset(token)
+        for shape, times in stats.repeated(_repeat_threshold):
+            logger.warning(
+                "Possible N+1 in %s: statement executed %d times: %s",
+                label, times, shape,
+            )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context,
+                           executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+    for stats in _scopes.get():
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def instrument_engine(
+        engine: AsyncEngine | Engine,
+        repeat_threshold: int = 10,
+) -> None:
+    """Attach the counting listeners to an engine (idempotent)."""
+    global _repeat_threshold
+    _repeat_threshold = repeat_threshold
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(
+            sync_engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        event.listen(
+            sync_engine, "before_cursor_execute", _before_cursor_execute
+        )
+        event.listen(
+            sync_engine, "after_cursor_execute", _after_cursor_execute
+        )
+        event.listen(sync_engine, "handle_error", _handle_error)
+
+
+class QueryCountMiddleware:
+    """Wraps every HTTP request in a query scope.
+
+    With ``expose_headers`` the statement count and total DB time are
+    returned as ``X-DB-Query-Count`` / ``X-DB-Query-Time-Ms`` headers.
+    """
+
+    def __init__(self, app: ASGIApp, expose_headers: bool = False):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(
+            self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope['method']} {scope['path']}"
+        with query_scope(label) as stats:
+            async def send_with_headers(message: Message) -> None:
+                if (
+                    self.expose_headers
+                    and message["type"] == "http.response.start"
+                ):
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (b"x-db-query-count", str(stats.count).encode())
+                    )
+                    headers.append((
+                        b"x-db-query-time-ms",
+                        f"{stats.total_seconds * 1000:.2f}".encode(),
+                    ))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,135 @@
+"""Engine-level slow query log aggregated by statement fingerprint."""
+
+import hashlib
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.infrastructure.query_counter import (
+    current_scope_label,
+    statement_shape,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(statement: str) -> str:
+    """Short stable id of a normalized statement."""
+    return hashlib.sha1(
+        statement_shape(statement).encode()
+    ).hexdigest()[:12]
+
+
+@dataclass
+class SlowQueryEntry:
+    """Aggregated slow executions of one statement shape.
+
+    ``rows`` sums the rows affected by writes; it stays None for reads,
+    for which the DBAPI reports no row count.
+    """
+    fingerprint: str
+    statement: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int | None = None
+    origins: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class SlowQueryLog:
+    """Records statements slower than a threshold, grouped by fingerprint.
+
+    At most ``max_entries`` fingerprints are kept; when full, the entry
+    with the smallest total time is dropped to make room.
+    """
+
+    def __init__(
+            self,
+            threshold_ms: float,
+            top_n: int = 20,
+            max_entries: int = 500,
+    ):
+        self.threshold_ms = threshold_ms
+        self.top_n = top_n
+        self.max_entries = max_entries
+        self._entries: dict[str, SlowQueryEntry] = {}
+
+    def record(
+            self,
+            statement: str,
+            duration_ms: float,
+            rowcount: int | None = None,
+            origin: str | None = None,
+    ) -> None:
+        """Aggregate one execution if it crossed the threshold."""
+        if duration_ms < self.threshold_ms:
+            return
+        key = fingerprint(statement)
+        entry = self._entries.get(key)
+        if entry is None:
+            if len(self._entries) >= self.max_entries:
+                smallest = min(
+                    self._entries.values(), key=lambda e: e.total_ms
+                )
+                del self._entries[smallest.fingerprint]
+            entry = SlowQueryEntry(key, statement_shape(statement))
+            self._entries[key] = entry
+        entry.count += 1
+        entry.total_ms += duration_ms
+        entry.max_ms = max(entry.max_ms, duration_ms)
+        if rowcount is not None and rowcount >= 0:
+            entry.rows = (entry.rows or 0) + rowcount
+        entry.origins[origin or "unknown"] += 1
+        logger.warning(
+            "Slow query %s (%.1f ms) from %s: %s",
+            key, duration_ms, origin or "unknown", entry.statement,
+        )
+
+    def top(self, limit: int | None = None) -> list[SlowQueryEntry]:
+        """Fingerprints ordered by total time spent, slowest first."""
+        return sorted(
+            self._entries.values(),
+            key=lambda e: e.total_ms,
+            reverse=True,
+        )[:self.top_n if limit is None else limit]
+
+    def reset(self) -> None:
+        self._entries.clear()
+
+    def instrument(self, engine: AsyncEngine | Engine) -> None:
+        """Attach timing listeners to an engine."""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+        event.listen(sync_engine, "handle_error", self._on_error)
+
+    def _before(self, conn, cursor, statement, parameters, context,
+                executemany):
+        conn.info.setdefault("slow_query_started", []).append(
+            time.perf_counter()
+        )
+
+    def _after(self, conn, cursor, statement, parameters, context,
+               executemany):
+        started = conn.info["slow_query_started"].pop()
+        self.record(
+            statement,
+            (time.perf_counter() - started) * 1000,
+            rowcount=getattr(cursor, "rowcount", None),
+            origin=current_scope_label(),
+        )
+
+    def _on_error(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("slow_query_started"):
+            conn.info["slow_query_started"].pop()
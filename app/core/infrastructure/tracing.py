@@ -0,0 +1,346 @@
+"""Lightweight in-process tracing.
+
+Spans are tracked in a context variable, so nested use case, repository,
+unit of work and event handler calls made while serving a request share
+its trace id. Finished spans go to the configured exporter: local JSON
+lines by default, OpenTelemetry optionally. With no exporter configured
+``span`` is a near no-op.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    Protocol,
+    TypeVar,
+)
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import SpanProcessor
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_HEX = re.compile("[0-9a-fA-F]+")
+
+
+@dataclass
+class Span:
+    """A timed operation inside a trace."""
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+    start_time_ns: int
+    end_time_ns: int | None = None
+    status: str = "ok"
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_time_ns or time.time_ns()
+        return (end - self.start_time_ns) / 1_000_000
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["duration_ms"] = round(self.duration_ms, 3)
+        return data
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None:
+        ...
+
+
+class JSONSpanExporter:
+    """Writes finished spans as JSON lines and keeps the latest in memory.
+
+    Without a path, lines go to the ``app.core.infrastructure.tracing``
+    logger at DEBUG level.
+    """
+
+    def __init__(self, path: str | None = None, keep: int = 1000):
+        self.path = path
+        self.spans: deque[Span] = deque(maxlen=keep)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+        line = json.dumps(span.to_dict(), default=str)
+        if self.path is None:
+            logger.debug(line)
+            return
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + os.linesep)
+
+    def trace(self, trace_id: str) -> list[Span]:
+        """Kept spans of one trace, in start order."""
+        return sorted(
+            (s for s in self.spans if s.trace_id == trace_id),
+            key=lambda s: s.start_time_ns,
+        )
+
+
+class OpenTelemetrySpanExporter:
+    """Hands finished spans to an OpenTelemetry SDK span processor.
+
+    Spans keep their trace, span and parent ids, so the collector links
+    them as they were recorded. Without a ``processor`` they are batched
+    to OTLP over HTTP, configured by the standard ``OTEL_EXPORTER_OTLP_*``
+    variables. Requires ``opentelemetry-sdk`` (and
+    ``opentelemetry-exporter-otlp-proto-http`` for the default).
+    """
+
+    def __init__(
+            self,
+            service_name: str = "team_manager",
+            processor: "SpanProcessor | None" = None,
+    ):
+        try:
+            from opentelemetry import trace
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import ReadableSpan
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.sdk.util.instrumentation import (
+                InstrumentationScope,
+            )
+        except ImportError as exc:
+            raise RuntimeError(
+                "OpenTelemetry exporter requires the opentelemetry-sdk "
+                "package"
+            ) from exc
+        if processor is None:
+            try:
+                from opentelemetry.exporter.otlp.proto.http.trace_exporter \
+                    import OTLPSpanExporter
+            except ImportError as exc:
+                raise RuntimeError(
+                    "OpenTelemetry exporter requires the "
+                    "opentelemetry-exporter-otlp-proto-http package"
+                ) from exc
+            processor = BatchSpanProcessor(OTLPSpanExporter())
+        self._trace = trace
+        self._readable_span = ReadableSpan
+        self._processor = processor
+        self._resource = Resource.create({"service.name": service_name})
+        self._scope = InstrumentationScope(__name__)
+
+    def _context(self, trace_id: str, span_id: str, remote: bool):
+        trace = self._trace
+        return trace.SpanContext(
+            trace_id=int(trace_id, 16),
+            span_id=int(span_id, 16),
+            is_remote=remote,
+            trace_flags=trace.TraceFlags(trace.TraceFlags.SAMPLED),
+        )
+
+    def export(self, span: Span) -> None:
+        trace = self._trace
+        parent = None
+        if span.parent_id is not None:
+            parent = self._context(span.trace_id, span.parent_id, False)
+        status = trace.Status(
+            trace.StatusCode.OK if span.status == "ok"
+            else trace.StatusCode.ERROR
+        )
+        self._processor.on_end(self._readable_span(
+            span.name,
+            context=self._context(span.trace_id, span.span_id, False),
+            parent=parent,
+            resource=self._resource,
+            attributes={k: str(v) for k, v in span.attributes.items()},
+            status=status,
+            start_time=span.start_time_ns,
+            end_time=span.end_time_ns,
+            instrumentation_scope=self._scope,
+        ))
+
+    def shutdown(self) -> None:
+        """Flush pending spans and stop the processor."""
+        self._processor.shutdown()
+
+
+_exporter: SpanExporter | None = None
+_current_span: ContextVar[Span | None] = ContextVar(
+    "current_span", default=None
+)
+
+
+def configure(exporter: SpanExporter | None) -> None:
+    """Install the process-wide exporter (None disables tracing)."""
+    global _exporter
+    _exporter = exporter
+
+
+def get_exporter() -> SpanExporter | None:
+    return _exporter
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def current_trace_id() -> str | None:
+    active = _current_span.get()
+    return active.trace_id if active else None
+
+
+def _new_trace_id() -> str:
+    return secrets.token_hex(16)
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+@contextmanager
+def span(
+        name: str,
+        *,
+        trace_id: str | None = None,
+        parent_id: str | None = None,
+        **attributes: Any,
+) -> Iterator[Span | None]:
+    """Time a block as a child of the current span."""
+    exporter = _exporter
+    if exporter is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(
+        trace_id=trace_id or (parent.trace_id if parent else _new_trace_id()),
+        span_id=_new_span_id(),
+        parent_id=parent_id or (parent.span_id if parent else None),
+        name=name,
+        start_time_ns=time.time_ns(),
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.status = "error"
+        current.attributes["error"] = type(exc).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end_time_ns = time.time_ns()
+        try:
+            exporter.export(current)
+        except Exception:
+            logger.exception("Failed to export span %s", name)
+
+
+def traced(
+        function: Callable[..., Awaitable[T]] | None = None,
+        *,
+        name: str | None = None,
+) -> Any:
+    """Decorator running an async function inside a span.
+
+    The span is named after the function's qualified name, e.g.
+    ``AddParticipantUseCase.execute``.
+    """
+    def decorate(func: Callable[..., Awaitable[T]]):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            if _exporter is None:
+                return await func(*args, **kwargs)
+            with span(span_name):
+                return await func(*args, **kwargs)
+
+        wrapper.__traced__ = True  # type: ignore[attr-defined]
+        return wrapper
+
+    if function is not None:
+        return decorate(function)
+    return decorate
+
+
+def trace_public_coroutines(cls: type) -> None:
+    """Wrap the public async methods defined on ``cls`` in spans."""
+    for attr, value in list(vars(cls).items()):
+        if (
+            attr.startswith("_")
+            or not inspect.iscoroutinefunction(value)
+            or getattr(value, "__traced__", False)
+        ):
+            continue
+        setattr(cls, attr, traced(value, name=f"{cls.__name__}.{attr}"))
+
+
+def _parse_traceparent(value: str) -> tuple[str, str] | None:
+    """Extract (trace_id, parent span id) from a W3C traceparent."""
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, parent_id = parts[1], parts[2]
+    if not (_HEX.fullmatch(trace_id) and _HEX.fullmatch(parent_id)):
+        return None
+    return trace_id, parent_id
+
+
+class TracingMiddleware:
+    """Opens the root span of each HTTP request.
+
+    A W3C ``traceparent`` header continues the caller's trace; the trace
+    id is returned in ``X-Trace-Id``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+            self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http" or _exporter is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        incoming = _parse_traceparent(
+            headers.get(b"traceparent", b"").decode("latin-1")
+        )
+        trace_id, parent_id = incoming if incoming else (None, None)
+        with span(
+            f"{scope['method']} {scope['path']}",
+            trace_id=trace_id,
+            parent_id=parent_id,
+            method=scope["method"],
+            path=scope["path"],
+        ) as root:
+            async def send_with_trace_id(message: Message) -> None:
+                if message["type"] == "http.response.start" and root:
+                    root.attributes["status"] = message["status"]
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"x-trace-id", root.trace_id.encode()),
+                        ],
+                    }
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace_id)
@@ -7,18 +7,30 @@ from app.core.shared.events import teams as team_event
 from app.core.shared.events import identity as user_event
 from app.core.shared.events import meetings as meeting_event
 from app.core.shared.events import tasks as task_event
+from app.core.infrastructure.cache import TTLCache
+from app.core.infrastructure import metrics
 from app.core.infrastructure.event import EventBus
+from app.core.shared.handlers.metrics import CountEventHandler
+from app.identity import (
+    authentication as identity_auth,
+    handlers as identity_handlers,
+)
 from app.evaluations import (
     handlers as evaluations_handlers,
     models as evaluations_models,
     unit_of_work as evaluations_uow,
 )
+from app.membership import (
+    handlers as membership_handlers,
+    unit_of_work as membership_uow,
+)
 from app.scheduling import (
     handlers as scheduling_handlers,
     models as scheduling_models,
     unit_of_work as scheduling_uow,
 )
 from app.tasks import (
+    deadlines as tasks_deadlines,
     handlers as tasks_handlers,
     unit_of_work as tasks_uow
 )
@@ -34,7 +46,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 async def register_event_handlers(
         bus: EventBus,
-        session_factory: async_sessionmaker[AsyncSession]
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        user_cache: identity_auth.UserCache | None = None,
+        admin_cache: TTLCache[int, bool] | None = None,
+        capability_cache: teams_handlers.CapabilityCache | None = None,
+        deadline_scheduler: tasks_deadlines.DeadlineScheduler | None = None,
 ):
     """
     Register all domain event handlers to the given EventBus.
@@ -44,10 +61,27 @@ async def register_event_handlers(
 
     Args:
         EventBus: The event bus instance where handlers will be subscribed.
+        user_cache: Authenticated-user cache to invalidate on user changes.
+        admin_cache: Admin-session cache to invalidate on user changes.
+        capability_cache: Team capability cache to invalidate on
+            membership changes and user deletion.
+        deadline_scheduler: Deadline timers to re-arm on task changes.
 
     Usage:
         await register_event_handlers(app.state.bus, app.state.async_session)
     """
+    project_membership = membership_handlers.MembershipProjectionHandler(
+        membership_uow.MembershipSQLAlchemyUnitOfWork(
+            session_factory, bus, membership_uow.MembershipRepositoryProvider
+        ),
+    )
+
+    count_tasks = tasks_handlers.TaskCountersHandler(
+        tasks_uow.TaskSQLAlchemyUnitOfWork(
+            session_factory, bus, tasks_uow.TaskRepositoryProvider
+        ),
+    )
+
     handlers_map = {
 
         user_event.UserRegistered: [
@@ -181,55 +215,13 @@ async def register_event_handlers(
                     session_factory, bus, scheduling_uow.SchedulingRepositoryProvider
                 ),
             ),
-
-        ],
-
-        team_event.MemberAddTeam: [
-
-            tasks_handlers.MemberAddTeamHandler(
-                tasks_uow.TaskSQLAlchemyUnitOfWork(
-                    session_factory, bus, tasks_uow.TaskRepositoryProvider
-                ),
-            ),
-            scheduling_handlers.SchedulingMemberAddHandler(
-                scheduling_uow.SchedulingSQLAlchemyUnitOfWork(
-                    session_factory, bus, scheduling_uow.SchedulingRepositoryProvider
-                ),
-            ),
-
-        ],
-
-        team_event.MemberRemoveTeam: [
-
-            tasks_handlers.MemberRemoveTeamHandler(
-                tasks_uow.TaskSQLAlchemyUnitOfWork(
-                    session_factory, bus, tasks_uow.TaskRepositoryProvider
-                ),
-            ),
-            scheduling_handlers.SchedulingMemberRemoveHandler(
-                scheduling_uow.SchedulingSQLAlchemyUnitOfWork(
-                    session_factory, bus, scheduling_uow.SchedulingRepositoryProvider
-                ),
-            ),
-
-        ],
-
-        team_event.MemberChangeRole: [
-
-            tasks_handlers.MemberChangeRoleHandler(
-                tasks_uow.TaskSQLAlchemyUnitOfWork(
-                    session_factory, bus, tasks_uow.TaskRepositoryProvider
-                ),
-            ),
-            scheduling_handlers.SchedulingMemberChangeRoleHandler(
-                scheduling_uow.SchedulingSQLAlchemyUnitOfWork(
-                    session_factory, bus, scheduling_uow.SchedulingRepositoryProvider
-                ),
-            ),
+            project_membership,
 
         ],
 
         task_event.TaskCreated: [
+            CountEventHandler(metrics.tasks_created_total),
+            count_tasks,
             evaluations_handlers.EvaluationTaskCreatedHandler(
                 evaluations_uow.EvaluationSQLAlchemyUnitOfWork(
                     session_factory,
@@ -247,6 +239,7 @@ async def register_event_handlers(
         ],
 
         task_event.TaskUpdated: [
+            count_tasks,
             evaluations_handlers.EvaluationTaskUpdatedHandler(
                 evaluations_uow.EvaluationSQLAlchemyUnitOfWork(
                     session_factory,
@@ -263,7 +256,16 @@ async def register_event_handlers(
             ),
         ],
 
+        task_event.TaskDeadlineApproaching: [
+            CountEventHandler(metrics.tasks_deadline_approaching_total),
+        ],
+
+        task_event.TaskOverdue: [
+            CountEventHandler(metrics.tasks_overdue_total),
+        ],
+
         meeting_event.MeetingCreated: [
+            CountEventHandler(metrics.meetings_created_total),
             calendar_handlers.CalendarMeetingCreatedHandler(
                 calendar_uow.CalendarSQLAlchemyUnitOfWork(
                     session_factory,
@@ -296,6 +298,56 @@ async def register_event_handlers(
 
     }
 
+    for event_type in (
+        team_event.MemberAddTeam,
+        team_event.MembersAddTeam,
+        team_event.MemberRemoveTeam,
+        team_event.MemberChangeRole,
+        team_event.AdminAddTeam,
+        team_event.AdminRemoveTeam,
+    ):
+        handlers_map[event_type] = [project_membership]
+
+    if user_cache is not None:
+        invalidate_user = identity_handlers.UserCacheInvalidationHandler(
+            user_cache
+        )
+        handlers_map[user_event.UserUpdated].append(invalidate_user)
+        handlers_map[user_event.UserDeleted].append(invalidate_user)
+
+    if admin_cache is not None:
+        invalidate_admin = identity_handlers.AdminSessionInvalidationHandler(
+            admin_cache
+        )
+        handlers_map[user_event.UserUpdated].append(invalidate_admin)
+        handlers_map[user_event.UserDeleted].append(invalidate_admin)
+
+    if capability_cache is not None:
+        invalidate_capabilities = (
+            teams_handlers.CapabilityCacheInvalidationHandler(
+                capability_cache
+            )
+        )
+        for event_type in (
+            team_event.MemberAddTeam,
+            team_event.MembersAddTeam,
+            team_event.MemberRemoveTeam,
+            team_event.MemberChangeRole,
+            team_event.AdminAddTeam,
+            team_event.AdminRemoveTeam,
+            user_event.UserDeleted,
+        ):
+            handlers_map.setdefault(event_type, []).append(
+                invalidate_capabilities
+            )
+
+    if deadline_scheduler is not None:
+        rearm_deadlines = tasks_handlers.DeadlineTimerHandler(
+            deadline_scheduler
+        )
+        handlers_map[task_event.TaskCreated].append(rearm_deadlines)
+        handlers_map[task_event.TaskUpdated].append(rearm_deadlines)
+
     for event_type, handlers in handlers_map.items():
         for handler in handlers:
             await bus.subscribe(event_type, handler)
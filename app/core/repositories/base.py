@@ -1,17 +1,30 @@
 from typing import Generic, TypeVar
 from abc import ABC, abstractmethod
 
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.infrastructure.tracing import trace_public_coroutines
 from app.core.unit_of_work import AbstractUnitOfWork
 
 
 DomainModel = TypeVar("DomainModel")
 
+# Dialect ``insert`` constructs, for ``ON CONFLICT`` upserts.
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
 
 class AbstractRepository(ABC, Generic[DomainModel]):
     """Abstract repository"""
 
+    def __init_subclass__(cls, **kwargs):
+        """Trace public async methods of every concrete repository."""
+        super().__init_subclass__(**kwargs)
+        trace_public_coroutines(cls)
+
     def __init__(self, uow: AbstractUnitOfWork):
         self.uow = uow
 
@@ -20,6 +33,11 @@ class AbstractRepository(ABC, Generic[DomainModel]):
         """Access session through UnitOfWork."""
         return self.uow.session
 
+    def _insert(self, model):
+        """``insert(model)`` of the session's dialect, for upserts."""
+        dialect = self.session.get_bind().dialect.name
+        return _INSERTS[dialect](model)
+
     @abstractmethod
     async def save(self, domain: DomainModel) -> None:
         ...
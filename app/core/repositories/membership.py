@@ -0,0 +1,43 @@
+from typing import Iterable, Protocol, runtime_checkable
+
+from app.membership.models import Membership, RoleMask
+
+
+@runtime_checkable
+class MembershipProtocol(Protocol):
+    """Protocol shared membership read model's repository"""
+
+    async def get_roles(self, team_id: int, user_id: int) -> RoleMask:
+        ...
+
+    async def get_by_team(self, team_id: int) -> list[Membership]:
+        ...
+
+    async def grant(
+        self,
+        team_id: int,
+        grants: Iterable[tuple[int, RoleMask]],
+    ) -> None:
+        ...
+
+    async def revoke(
+        self, team_id: int, user_id: int, mask: RoleMask
+    ) -> None:
+        ...
+
+    async def change(
+        self,
+        team_id: int,
+        user_id: int,
+        old: RoleMask,
+        new: RoleMask,
+    ) -> None:
+        ...
+
+    async def save(self, domain: Membership) -> None:
+        ...
+
+
+@runtime_checkable
+class MembershipRepos(Protocol):
+    membership: MembershipProtocol
@@ -1,6 +1,6 @@
-from typing import Protocol, runtime_checkable
+from typing import Iterable, Protocol, runtime_checkable
 
-from app.scheduling.models import Meeting, MemberTeam, Team, User
+from app.scheduling.models import Meeting, Team, User
 
 
 @runtime_checkable
@@ -10,6 +10,9 @@ class SchedulingUserProtocol(Protocol):
     async def get_by_id(self, id: int) -> User | None:
         ...
 
+    async def get_existing_ids(self, user_ids: Iterable[int]) -> set[int]:
+        ...
+
     async def save(self, domain: User) -> None:
         ...
 
@@ -25,24 +28,6 @@ class SchedulingTeamProtocol(Protocol):
         ...
 
 
-@runtime_checkable
-class SchedulingMemberProtocol(Protocol):
-    """Protocol member's repository"""
-
-    async def get_by_user_and_team(
-        self,
-        user_id: int,
-        team_id: int
-    ) -> MemberTeam | None:
-        ...
-
-    async def save(self, domain: MemberTeam) -> None:
-        ...
-
-    async def delete(self, user_id: int, team_id: int) -> None:
-        ...
-
-
 @runtime_checkable
 class SchedulingMeetingProtocol(Protocol):
     """Protocol meeting's repository"""
@@ -61,5 +46,4 @@ class SchedulingMeetingProtocol(Protocol):
 class SchedulingRepos(Protocol):
     user: SchedulingUserProtocol
     team: SchedulingTeamProtocol
-    member: SchedulingMemberProtocol
     meeting: SchedulingMeetingProtocol
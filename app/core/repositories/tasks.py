@@ -1,7 +1,13 @@
-from typing import Protocol, runtime_checkable
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Protocol, runtime_checkable
 
+from app.core.repositories.membership import MembershipProtocol
+
+from app.core.custom_types.ids import TaskId
+from app.core.custom_types.task_status import TaskStatus
 from app.tasks.models import (
-    MemberTask,
+    TaskCounter,
+    DeadlineTimer,
     TaskUser,
     Task,
     Team,
@@ -20,25 +26,6 @@ class TaskUserProtocol(Protocol):
         ...
 
 
-@runtime_checkable
-class TaskMemberProtocol(Protocol):
-
-    async def get_by_user(
-        self, user_id: int
-    ) -> list[MemberTask]:
-        ...
-
-    async def get_by_user_and_team(
-        self,
-        user_id: int,
-        team_id: int,
-    ) -> list[MemberTask]:
-        ...
-
-    async def save(self, member: MemberTask) -> None:
-        ...
-
-
 @runtime_checkable
 class TaskTeamProtocol(Protocol):
 
@@ -52,7 +39,20 @@ class TaskTeamProtocol(Protocol):
 @runtime_checkable
 class TaskCommentProtocol(Protocol):
 
-    async def get_by_task_id(self, task_id: int) ->  list[Comment]:
+    async def get_page_by_task(
+        self,
+        task_id: int,
+        *,
+        limit: int,
+        after_id: int | None = None,
+        since: datetime | None = None,
+    ) -> list[Comment]:
+        ...
+
+    async def has_comment(self, task_id: int, comment_id: int) -> bool:
+        ...
+
+    def stream_by_team(self, team_id: int) -> AsyncIterator[dict]:
         ...
 
     async def save(self, comment: Comment) -> Comment:
@@ -74,14 +74,78 @@ class TaskProtocol(Protocol):
     async def get_by_executor(self, id: int) -> list[Task]:
         ...
 
+    async def search(
+        self,
+        user_id: int,
+        query: str,
+        *,
+        team_id: int | None = None,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[list[tuple[Task, float]], int]:
+        ...
+
+    async def count_overdue(
+        self,
+        team_id: int,
+        *,
+        executor_id: int | None = None,
+        now: datetime,
+    ) -> int:
+        ...
+
+    async def get_by_ids(self, task_ids: Iterable[int]) -> list[Task]:
+        ...
+
+    def stream_by_team(self, team_id: int) -> AsyncIterator[dict]:
+        ...
+
+    async def add_many(self, tasks: list[Task]) -> None:
+        ...
+
+    async def update_many(self, tasks: list[Task]) -> None:
+        ...
+
+    async def get_deadlines(
+        self, since: datetime, until: datetime
+    ) -> list[tuple[TaskId, datetime]]:
+        ...
+
     async def save(self, task: Task) -> None:
         ...
 
 
+@runtime_checkable
+class TaskDeadlineTimerProtocol(Protocol):
+
+    async def claim(self, timer: DeadlineTimer) -> bool:
+        ...
+
+    async def save(self, timer: DeadlineTimer) -> None:
+        ...
+
+
+@runtime_checkable
+class TaskCounterProtocol(Protocol):
+
+    async def get_counts(
+        self, team_id: int, executor_id: int | None = None
+    ) -> dict[TaskStatus, int]:
+        ...
+
+    async def add(self, deltas: Iterable[TaskCounter]) -> None:
+        ...
+
+    async def save(self, counter: TaskCounter) -> None:
+        ...
+
+
 @runtime_checkable
 class TaskRepos(Protocol):
     user: TaskUserProtocol
-    member: TaskMemberProtocol
     team: TaskTeamProtocol
     comment: TaskCommentProtocol
     task: TaskProtocol
+    counter: TaskCounterProtocol
+    timer: TaskDeadlineTimerProtocol
+    membership: MembershipProtocol
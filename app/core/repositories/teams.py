@@ -1,5 +1,7 @@
-from typing import Protocol, runtime_checkable
+from typing import Iterable, Protocol, runtime_checkable
 
+from app.core.custom_types.role import UserRole
+from app.teams.dto import TeamMemberItemDTO, TeamReadDTO
 from app.teams.models import Team, Member, User
 
 
@@ -13,6 +15,9 @@ class TeamUserProtocol(Protocol):
     async def get_by_id(self, id: int) -> User | None:
         ...
 
+    async def get_existing_ids(self, user_ids: Iterable[int]) -> set[int]:
+        ...
+
 
 @runtime_checkable
 class TeamRepositoryProtocol(Protocol):
@@ -21,9 +26,29 @@ class TeamRepositoryProtocol(Protocol):
     async def get_by_id(self, team_id: int) -> Team | None:
         ...
 
+    async def exists(self, team_id: int) -> bool:
+        ...
+
+    async def get_summary(self, team_id: int) -> TeamReadDTO | None:
+        ...
+
+    async def get_page_by_user(
+        self,
+        user_id: int,
+        *,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[list[TeamReadDTO], int]:
+        ...
+
     async def save(self, team: Team) -> Team:
         ...
 
+    async def save_new_members(
+        self, team: Team, members: list[Member]
+    ) -> None:
+        ...
+
 
 @runtime_checkable
 class MemberRepositoryProtocol(Protocol):
@@ -41,6 +66,20 @@ class MemberRepositoryProtocol(Protocol):
     ) -> Member | None:
         ...
 
+    async def get_roles(self, user_id: int, team_id: int) -> list[str]:
+        ...
+
+    async def get_page_by_team(
+        self,
+        team_id: int,
+        *,
+        limit: int,
+        after_id: int | None = None,
+        role: UserRole | None = None,
+        search: str | None = None,
+    ) -> list[TeamMemberItemDTO]:
+        ...
+
     async def save(self, member: Member) -> Member:
         ...
 
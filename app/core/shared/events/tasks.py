@@ -29,3 +29,23 @@ class TaskUpdated(DomainEvent):
     description: str = ""
     deadline: datetime | None = None
     deleted: bool = False
+    previous_status: str | None = None
+    previous_deleted: bool | None = None
+
+
+@dataclass(frozen=True)
+class TaskDeadlineApproaching(DomainEvent):
+    task_id: int
+    team_id: int
+    supervisor_id: int
+    executor_id: int | None
+    deadline: datetime
+
+
+@dataclass(frozen=True)
+class TaskOverdue(DomainEvent):
+    task_id: int
+    team_id: int
+    supervisor_id: int
+    executor_id: int | None
+    deadline: datetime
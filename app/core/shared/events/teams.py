@@ -22,6 +22,16 @@ class MemberAddTeam(MemberEvent):
     role: str
 
 
+@dataclass(frozen=True)
+class MembersAddTeam(MemberEvent):
+    """Event: Several members added at once in Team context.
+
+    ``members`` holds ``(user_id, role)`` pairs.
+    """
+    team_id: int
+    members: tuple[tuple[int, str], ...]
+
+
 @dataclass(frozen=True)
 class MemberRemoveTeam(MemberEvent):
     """Event: Member remove in Team context."""
@@ -37,3 +47,21 @@ class MemberChangeRole(MemberEvent):
     user_id: int
     new_role: str
     old_role: str
+
+
+@dataclass(frozen=True)
+class AdminAddTeam(MemberEvent):
+    """Event: Admin add in Team context.
+
+    Admins are not projected into other contexts, so this is kept apart
+    from ``MemberAddTeam``.
+    """
+    team_id: int
+    user_id: int
+
+
+@dataclass(frozen=True)
+class AdminRemoveTeam(MemberEvent):
+    """Event: Admin remove in Team context."""
+    team_id: int
+    user_id: int
@@ -0,0 +1,19 @@
+from typing import Sequence
+
+from app.core.infrastructure.event import DomainEvent, EventHandler
+from app.core.infrastructure.metrics import Counter
+
+
+class CountEventHandler(EventHandler[DomainEvent]):
+    """Increments a domain counter for every handled event."""
+
+    def __init__(self, counter: Counter):
+        self.counter = counter
+
+    async def handle(self, event: DomainEvent) -> None:
+        """Count the event."""
+        self.counter.inc()
+
+    async def handle_many(self, events: Sequence[DomainEvent]) -> None:
+        """Count the batch."""
+        self.counter.inc(len(events))
@@ -5,6 +5,7 @@ from abc import ABC
 
 
 class BaseUser(Entity, ABC):
+    __slots__ = ("id", "username")
 
     def __init__(self, id: ids.UserId, username: str = ""):
         self.id = id
@@ -3,6 +3,7 @@ from typing import Generic, Type, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.infrastructure import tracing
 from app.core.infrastructure.event import EventBus
 from app.core.aggregate import AggregateRoot
 
@@ -37,8 +38,9 @@ class AbstractUnitOfWork(ABC):
 
     async def commit(self) -> None:
         """Commit the transaction and publish domain events."""
-        await self._commit()
-        await self._publish_events()
+        with tracing.span(f"{type(self).__name__}.commit"):
+            await self._commit()
+            await self._publish_events()
 
     @abstractmethod
     async def _publish_events(self) -> None:
@@ -70,33 +72,54 @@ class SQLAlchemyUnitOfWork(Generic[TProvider], AbstractUnitOfWork, ABC):
         self,
         session_factory: async_sessionmaker[AsyncSession],
         bus: EventBus,
-        provider_cls: Type[TProvider]
+        provider_cls: Type[TProvider],
+        session: AsyncSession | None = None,
     ):
         """Initialize the UoW with a session factory,
-        event bus, and repo provider."""
+        event bus, and repo provider.
+
+        If ``session`` is given (e.g. the request-scoped session shared
+        with the fastapi-users user database), the UoW borrows it instead
+        of opening a new one: it still owns the transaction boundary
+        (commit/rollback), but closing the session is left to its owner.
+        """
         super().__init__()
         self._session_factory = session_factory
+        self._external_session = session
         self.bus = bus
         self.provider_cls = provider_cls
         self.repos: TProvider
 
     async def __aenter__(self) -> "SQLAlchemyUnitOfWork[TProvider]":
         """Enter async context: create session and repositories."""
-        self._session = self._session_factory()
+        if self._external_session is not None:
+            self._session = self._external_session
+        else:
+            self._session = self._session_factory()
         self.repos = self.provider_cls(self)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        """Exit async context: rollback on error and close session."""
+        """Exit async context: rollback on error and close owned session."""
         if exc:
             await self.session.rollback()
-        await self.session.close()
+        if self._external_session is None:
+            await self.session.close()
 
     async def _publish_events(self) -> None:
-        """Publish all events from seen aggregates via the event bus."""
-        for aggregate in self._seen:
-            for event in aggregate.pull_events():
-                await self.bus.publish(event)
+        """Publish all events from seen aggregates via the event bus.
+
+        The aggregates are forgotten afterwards, so a UoW committing many
+        times (e.g. a chunked import) does not keep them all alive.
+        """
+        events = [
+            event
+            for aggregate in self._seen
+            for event in aggregate.pull_events()
+        ]
+        self._seen.clear()
+        if events:
+            await self.bus.publish_many(events)
 
     async def _commit(self) -> None:
         """Commit the current session."""
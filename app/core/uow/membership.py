@@ -0,0 +1,10 @@
+from typing import Protocol, runtime_checkable
+
+from app.core.repositories.membership import MembershipRepos
+from app.core.uow.handlers import HandlerUnitOfWork
+
+
+@runtime_checkable
+class MembershipHandlerUnitOfWork(HandlerUnitOfWork, Protocol):
+    @property
+    def repos(self) -> MembershipRepos: ...
@@ -6,6 +6,8 @@ from fastapi import Request
 
 from app.core import config
 from app.core.infrastructure import event
+from app.core.infrastructure.profiler import SamplingProfiler
+from app.core.infrastructure.slow_query import SlowQueryLog
 
 
 @lru_cache
@@ -14,6 +16,13 @@ def get_settings():
 
 
 async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Request-scoped session.
+
+    FastAPI caches dependencies per request, so the fastapi-users user
+    database and the context UoWs receive the same session (one pool
+    checkout per request). The UoW owns commit/rollback; the session
+    is closed here once the response is sent.
+    """
     async with request.app.state.async_session() as session:
         yield session
 
@@ -26,3 +35,11 @@ async def get_session_factory(
 
 async def get_bus(request: Request) -> event.EventBus:
     return request.app.state.bus
+
+
+async def get_slow_query_log(request: Request) -> SlowQueryLog:
+    return request.app.state.slow_query_log
+
+
+async def get_profiler(request: Request) -> SamplingProfiler:
+    return request.app.state.profiler
@@ -6,21 +6,24 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.calendar.unit_of_work import CalendarRepositoryProvider, CalendarSQLAlchemyUnitOfWork
 from app.core.infrastructure.event import EventBus
 from app.core.unit_of_work import SQLAlchemyUnitOfWork
-from app.deps.base import get_bus, get_session_factory
+from app.deps.base import get_bus, get_session, get_session_factory
 
 
 SessionFactory = Annotated[
     async_sessionmaker[AsyncSession], Depends(get_session_factory)
 ]
 Bus = Annotated[EventBus, Depends(get_bus)]
+Session = Annotated[AsyncSession, Depends(get_session)]
 
 
 async def calendar_uow_factory(
     async_session_factory: SessionFactory,
+    session: Session,
     event_bus: Bus,
 ) -> CalendarSQLAlchemyUnitOfWork:
     return CalendarSQLAlchemyUnitOfWork(
         session_factory=async_session_factory,
+        session=session,
         bus=event_bus,
         provider_cls=CalendarRepositoryProvider,
     )
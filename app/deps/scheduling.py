@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.infrastructure.event import EventBus
 from app.core.unit_of_work import SQLAlchemyUnitOfWork
-from app.deps.base import get_bus, get_session_factory
+from app.deps.base import get_bus, get_session, get_session_factory
 from app.scheduling.unit_of_work import (
     SchedulingRepositoryProvider,
     SchedulingSQLAlchemyUnitOfWork,
@@ -16,14 +16,17 @@ SessionFactory = Annotated[
     async_sessionmaker[AsyncSession], Depends(get_session_factory)
 ]
 Bus = Annotated[EventBus, Depends(get_bus)]
+Session = Annotated[AsyncSession, Depends(get_session)]
 
 
 async def scheduling_uow_factory(
     async_session_factory: SessionFactory,
+    session: Session,
     event_bus: Bus,
 ) -> SchedulingSQLAlchemyUnitOfWork:
     return SchedulingSQLAlchemyUnitOfWork(
         session_factory=async_session_factory,
+        session=session,
         bus=event_bus,
         provider_cls=SchedulingRepositoryProvider,
     )
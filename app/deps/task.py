@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.infrastructure.event import EventBus
 from app.core.unit_of_work import SQLAlchemyUnitOfWork
-from app.deps.base import get_bus, get_session_factory
+from app.deps.base import get_bus, get_session, get_session_factory
 from app.tasks.unit_of_work import TaskRepositoryProvider, TaskSQLAlchemyUnitOfWork
 
 
@@ -13,14 +13,17 @@ SessionFactory = Annotated[
     async_sessionmaker[AsyncSession], Depends(get_session_factory)
 ]
 Bus = Annotated[EventBus, Depends(get_bus)]
+Session = Annotated[AsyncSession, Depends(get_session)]
 
 
 async def task_uow_factory(
     async_session_factory: SessionFactory,
+    session: Session,
     event_bus: Bus,
 ) -> TaskSQLAlchemyUnitOfWork:
     return TaskSQLAlchemyUnitOfWork(
         session_factory=async_session_factory,
+        session=session,
         bus=event_bus,
         provider_cls=TaskRepositoryProvider,
     )
@@ -34,3 +37,20 @@ async def task_uow(
 
 
 TaskUoW = Annotated[TaskSQLAlchemyUnitOfWork, Depends(task_uow)]
+
+
+async def task_export_uow(
+    async_session_factory: SessionFactory,
+    event_bus: Bus,
+) -> TaskSQLAlchemyUnitOfWork:
+    """Unentered UoW with a session of its own, for streamed responses
+    that outlive the request-scoped session."""
+    return TaskSQLAlchemyUnitOfWork(
+        session_factory=async_session_factory,
+        bus=event_bus,
+        provider_cls=TaskRepositoryProvider,
+    )
+
+
+TaskExportUoW = Annotated[TaskSQLAlchemyUnitOfWork, Depends(task_export_uow)]
+
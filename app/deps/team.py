@@ -1,8 +1,9 @@
 from typing import AsyncGenerator, Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.teams.handlers import CapabilityCache
 from app.teams.unit_of_work import (
     TeamSQLAlchemyUnitOfWork,
     TeamRepositoryProvider
@@ -24,15 +25,18 @@ SessionFactory = Annotated[
     async_sessionmaker[AsyncSession], Depends(get_session_factory)
 ]
 Bus = Annotated[EventBus, Depends(get_bus)]
+Session = Annotated[AsyncSession, Depends(get_session)]
 
 
 async def team_uow_factory(
         async_session_factory: SessionFactory,
+        session: Session,
         event_bus: Bus,
 ) -> TeamSQLAlchemyUnitOfWork:
     """Factory for Team UnitOfWork."""
     return TeamSQLAlchemyUnitOfWork(
         session_factory=async_session_factory,
+        session=session,
         bus=event_bus,
         provider_cls=TeamRepositoryProvider,
     )
@@ -51,3 +55,13 @@ async def team_uow(
 TeamUoW = Annotated[
     TeamSQLAlchemyUnitOfWork, Depends(team_uow)
 ]
+
+
+def get_capability_cache(request: Request) -> CapabilityCache | None:
+    """App-wide team capability cache, if the app configured one."""
+    return getattr(request.app.state, "capability_cache", None)
+
+
+TeamCapabilityCache = Annotated[
+    CapabilityCache | None, Depends(get_capability_cache)
+]
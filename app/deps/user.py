@@ -1,16 +1,17 @@
 from typing import AsyncGenerator, Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 from fastapi_users import FastAPIUsers
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
-    JWTStrategy,
 )
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.identity.authentication import CachedJWTStrategy, UserPrincipal
 from app.identity.orm_models import UserORM
+from app.identity.password import AsyncPasswordHasher
 from app.identity.user_manager import UserManager
 from app.identity.unit_of_work import (
     IdentitySQLAlchemyUnitOfWork,
@@ -33,15 +34,18 @@ SessionFactory = Annotated[
     async_sessionmaker[AsyncSession], Depends(get_session_factory)
 ]
 Bus = Annotated[EventBus, Depends(get_bus)]
+Session = Annotated[AsyncSession, Depends(get_session)]
 
 
 async def user_uow_factory(
         async_session_factory: SessionFactory,
+        session: Session,
         event_bus: Bus,
 ) -> IdentitySQLAlchemyUnitOfWork:
     """Factory for Identity UnitOfWork."""
     return IdentitySQLAlchemyUnitOfWork(
         session_factory=async_session_factory,
+        session=session,
         bus=event_bus,
         provider_cls=IdentityRepositoryProvider,
     )
@@ -69,18 +73,26 @@ async def get_user_db(
     yield SQLAlchemyUserDatabase(session, UserORM)
 
 
+def get_password_hasher(request: Request) -> AsyncPasswordHasher:
+    """Provide the app-wide off-loop password hasher."""
+    return request.app.state.password_hasher
+
+
 async def get_user_manager(
         user_db: Annotated[SQLAlchemyUserDatabase, Depends(get_user_db)],
         bus: Bus,
+        hasher: Annotated[AsyncPasswordHasher, Depends(get_password_hasher)],
 ):
     """Provide UserManager for fastapi-users."""
-    yield UserManager(user_db, bus)
+    yield UserManager(user_db, bus, hasher)
 
 
-def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(
+def get_jwt_strategy(request: Request) -> CachedJWTStrategy:
+    """JWT strategy backed by the app-wide authenticated-user cache."""
+    return CachedJWTStrategy(
         secret=settings.secret_key,
         lifetime_seconds=3600,
+        cache=getattr(request.app.state, "user_cache", None),
     )
 
 
@@ -98,7 +110,9 @@ fastapi_users = FastAPIUsers[UserORM, int](
 )
 
 current_active_user = fastapi_users.current_user(active=True)
+current_superuser = fastapi_users.current_user(active=True, superuser=True)
 # optional_user = fastapi_users.current_user(active=True, optional=True)
 # current_verified_user = fastapi_users.current_user(active=True, verified=True)
 
-UserDepend = Annotated[UserORM, Depends(current_active_user)]
+UserDepend = Annotated[UserPrincipal, Depends(current_active_user)]
+SuperUserDepend = Annotated[UserPrincipal, Depends(current_superuser)]
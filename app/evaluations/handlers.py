@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from app.core.custom_types import ids, task_status
 from app.core.infrastructure.event import EventHandler
 from app.core.shared.events import tasks as task_event
@@ -33,30 +35,50 @@ class EvaluationTaskCreatedHandler(EventHandler[task_event.TaskCreated]):
         self.uow = uow
 
     async def handle(self, event: task_event.TaskCreated) -> None:
+        await self.handle_many([event])
+
+    async def handle_many(
+        self, events: Sequence[task_event.TaskCreated]
+    ) -> None:
+        """Save the batch's tasks in one transaction."""
         async with self.uow as uow:
-            task = Task(
-                id=ids.TaskId(event.task_id),
-                team_id=ids.TeamId(event.team_id),
-                supervisor_id=ids.UserId(event.supervisor_id),
-                executor_id=ids.UserId(event.executor_id or 0),
-                status=task_status.TaskStatus(event.status),
-            )
-            await uow.repos.task.save(task)
+            for event in events:
+                await uow.repos.task.save(self._task(event))
             await uow.commit()
 
+    @staticmethod
+    def _task(event: task_event.TaskCreated) -> Task:
+        return Task(
+            id=ids.TaskId(event.task_id),
+            team_id=ids.TeamId(event.team_id),
+            supervisor_id=ids.UserId(event.supervisor_id),
+            executor_id=ids.UserId(event.executor_id or 0),
+            status=task_status.TaskStatus(event.status),
+        )
+
 
 class EvaluationTaskUpdatedHandler(EventHandler[task_event.TaskUpdated]):
     def __init__(self, uow: EvaluationHandlerUnitOfWork):
         self.uow = uow
 
     async def handle(self, event: task_event.TaskUpdated) -> None:
+        await self.handle_many([event])
+
+    async def handle_many(
+        self, events: Sequence[task_event.TaskUpdated]
+    ) -> None:
+        """Save the batch's tasks in one transaction."""
         async with self.uow as uow:
-            task = Task(
-                id=ids.TaskId(event.task_id),
-                team_id=ids.TeamId(event.team_id),
-                supervisor_id=ids.UserId(event.supervisor_id),
-                executor_id=ids.UserId(event.executor_id or 0),
-                status=task_status.TaskStatus(event.status),
-            )
-            await uow.repos.task.save(task)
+            for event in events:
+                await uow.repos.task.save(self._task(event))
             await uow.commit()
+
+    @staticmethod
+    def _task(event: task_event.TaskUpdated) -> Task:
+        return Task(
+            id=ids.TaskId(event.task_id),
+            team_id=ids.TeamId(event.team_id),
+            supervisor_id=ids.UserId(event.supervisor_id),
+            executor_id=ids.UserId(event.executor_id or 0),
+            status=task_status.TaskStatus(event.status),
+        )
@@ -7,7 +7,7 @@ from app.evaluations import custom_exception
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Evaluation:
     user_id: ids.UserId
     team_id: ids.TeamId
@@ -32,6 +32,7 @@ class Evaluation:
 
 
 class User(BaseUser):
+    __slots__ = ("_evaluations",)
 
     def __init__(
             self,
@@ -82,6 +83,9 @@ class User(BaseUser):
 
 
 class Task(Entity):
+    __slots__ = (
+        "_id", "_team_id", "_supervisor_id", "_executor_id", "_status"
+    )
 
     def __init__(
         self,
@@ -3,6 +3,8 @@ from datetime import datetime
 from fastapi import HTTPException
 
 from app.core.custom_types import ids
+from app.core.infrastructure import metrics
+from app.core.infrastructure.tracing import traced
 from app.core.uow.evaluations import EvaluationUnitOfWork
 from app.evaluations import custom_exception, dto, management
 from app.evaluations.models import Evaluation
@@ -34,6 +36,7 @@ class CreateEvaluationUseCase:
     def __init__(self, uow: EvaluationUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
         self,
         command: dto.CreateEvaluationCommand,
@@ -54,6 +57,7 @@ class CreateEvaluationUseCase:
         )
         await self.uow.repos.evaluation.save(evaluation)
         await self.uow.commit()
+        metrics.evaluations_recorded_total.inc()
         return _to_evaluation_dto(evaluation)
 
 
@@ -61,6 +65,7 @@ class ListMyEvaluationUseCase:
     def __init__(self, uow: EvaluationUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
         self,
         user_id: int,
@@ -82,6 +87,7 @@ class GetAverageEvaluationUseCase:
     def __init__(self, uow: EvaluationUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
         self,
         user_id: int,
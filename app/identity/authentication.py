@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+
+import jwt
+from fastapi_users import exceptions
+from fastapi_users.authentication import JWTStrategy
+from fastapi_users.jwt import decode_jwt
+from fastapi_users.manager import BaseUserManager
+
+from app.core.infrastructure.cache import TTLCache
+from app.identity.orm_models import UserORM
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """Minimal, session-independent view of the authenticated user."""
+    id: int
+    email: str
+    username: str
+    is_active: bool
+    is_superuser: bool
+    is_verified: bool
+    deleted: bool
+
+    @classmethod
+    def from_orm(cls, user: UserORM) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            is_verified=user.is_verified,
+            deleted=user.deleted,
+        )
+
+
+UserCache = TTLCache[tuple[int, str], UserPrincipal]
+
+
+class CachedJWTStrategy(JWTStrategy):
+    """JWT strategy that caches the resolved principal per (user, token).
+
+    The token signature and expiry are verified on every call; only the
+    user lookup is served from the cache. Entries are dropped by the
+    identity event handlers when the user is updated or deleted.
+    """
+
+    def __init__(self, *args, cache: UserCache | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = cache
+
+    async def read_token(
+            self,
+            token: str | None,
+            user_manager: BaseUserManager,
+    ) -> UserPrincipal | None:
+        if token is None:
+            return None
+
+        try:
+            data = decode_jwt(
+                token,
+                self.decode_key,
+                self.token_audience,
+                algorithms=[self.algorithm],
+            )
+            user_id = data.get("sub")
+            if user_id is None:
+                return None
+            parsed_id = user_manager.parse_id(user_id)
+        except (jwt.PyJWTError, exceptions.InvalidID):
+            return None
+
+        key = (parsed_id, token)
+        if self._cache is not None:
+            principal = self._cache.get(key)
+            if principal is not None:
+                return principal
+
+        try:
+            user = await user_manager.get(parsed_id)
+        except exceptions.UserNotExists:
+            return None
+
+        principal = UserPrincipal.from_orm(user)
+        if self._cache is not None:
+            self._cache.set(key, principal)
+        return principal
@@ -0,0 +1,27 @@
+from app.core.infrastructure.event import EventHandler
+from app.core.shared.events import identity as user_event
+from app.core.infrastructure.cache import TTLCache
+from app.identity.authentication import UserCache
+
+
+class UserCacheInvalidationHandler(EventHandler[user_event.UserEvent]):
+    """Drops cached principals of a user that was updated or deleted."""
+
+    def __init__(self, cache: UserCache):
+        self.cache = cache
+
+    async def handle(self, event: user_event.UserEvent) -> None:
+        """Invalidate every cached token of the user."""
+        user_id = getattr(event, "user_id")
+        self.cache.invalidate_where(lambda key: key[0] == user_id)
+
+
+class AdminSessionInvalidationHandler(EventHandler[user_event.UserEvent]):
+    """Drops cached admin-session validity of an updated or deleted user."""
+
+    def __init__(self, cache: TTLCache[int, bool]):
+        self.cache = cache
+
+    async def handle(self, event: user_event.UserEvent) -> None:
+        """Invalidate the user's admin session entry."""
+        self.cache.invalidate(getattr(event, "user_id"))
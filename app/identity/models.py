@@ -11,6 +11,7 @@ class User(Entity, AggregateRoot):
     Domain user aggregate with email, username,
     deletion state, and email validation.
     """
+    __slots__ = ("id", "email", "username", "deleted")
 
     def __init__(
             self, id: ids.UserId,
@@ -0,0 +1,50 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi_users.password import PasswordHelper, PasswordHelperProtocol
+
+
+class AsyncPasswordHasher:
+    """Runs password hashing and verification off the event loop.
+
+    Argon2 takes tens to hundreds of milliseconds per call; running it
+    on the loop thread stalls every other request. Calls are executed
+    in a bounded thread pool, so at most ``max_workers`` hashes run at
+    once and the rest queue up without blocking the loop.
+    """
+
+    def __init__(
+            self,
+            max_workers: int,
+            helper: PasswordHelperProtocol | None = None,
+    ):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self.helper = helper or PasswordHelper()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hash",
+        )
+
+    async def hash(self, password: str) -> str:
+        """Hash a password."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.helper.hash, password
+        )
+
+    async def verify_and_update(
+            self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verify a password and return an upgraded hash if needed."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            self.helper.verify_and_update,
+            plain_password,
+            hashed_password,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,3 +1,4 @@
+from app.core.infrastructure.tracing import traced
 from app.core.uow.identity import IdentityUnitOfWork
 from app.identity.custom_exception import UserNotFoundException
 from app.identity import dto
@@ -12,6 +13,7 @@ class DeleteUserUseCase:
         """Initialize with Unit of Work."""
         self.uow = uow
 
+    @traced
     async def execute(self, command: dto.DeleteUserCommand) -> None:
         """
         Mark user as deleted and persist the change.
@@ -37,6 +39,7 @@ class UpdateUserUseCase:
         """Initialize with Unit of Work."""
         self.uow = uow
 
+    @traced
     async def execute(
             self, command: dto.UpdateUserCommand
     ) -> dto.UpdateUserResult:
@@ -1,10 +1,17 @@
 from fastapi import Request
-from fastapi_users import BaseUserManager, IntegerIDMixin
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import (
+    BaseUserManager,
+    IntegerIDMixin,
+    exceptions,
+    schemas,
+)
 
 from app.core.infrastructure.event import EventBus
 from app.core.shared.events import identity as identity_event
 from app.deps.base import get_settings
 from app.identity.orm_models import UserORM
+from app.identity.password import AsyncPasswordHasher
 
 
 settings = get_settings()
@@ -14,9 +21,57 @@ class UserManager(IntegerIDMixin, BaseUserManager[UserORM, int]):
     reset_password_token_secret = settings.secret_key
     verification_token_secret = settings.secret_key
 
-    def __init__(self, user_db, bus: EventBus):
-        super().__init__(user_db)
+    def __init__(self, user_db, bus: EventBus, hasher: AsyncPasswordHasher):
+        super().__init__(user_db, password_helper=hasher.helper)
         self._bus = bus
+        self._hasher = hasher
+
+    async def create(
+        self,
+        user_create: schemas.BaseUserCreate,
+        safe: bool = False,
+        request: Request | None = None,
+    ) -> UserORM:
+        """Create a user, hashing the password off the event loop."""
+        await self.validate_password(user_create.password, user_create)
+
+        existing_user = await self.user_db.get_by_email(user_create.email)
+        if existing_user is not None:
+            raise exceptions.UserAlreadyExists()
+
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        password = user_dict.pop("password")
+        user_dict["hashed_password"] = await self._hasher.hash(password)
+
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+        return created_user
+
+    async def authenticate(
+        self, credentials: OAuth2PasswordRequestForm
+    ) -> UserORM | None:
+        """Verify credentials, running the hasher off the event loop."""
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Still hash to keep timing equal for unknown emails
+            await self._hasher.hash(credentials.password)
+            return None
+
+        verified, updated_password_hash = await self._hasher.verify_and_update(
+            credentials.password, user.hashed_password
+        )
+        if not verified:
+            return None
+        if updated_password_hash is not None:
+            await self.user_db.update(
+                user, {"hashed_password": updated_password_hash}
+            )
+        return user
 
     async def on_after_register(
         self, user: UserORM, request: Request | None = None
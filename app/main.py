@@ -1,4 +1,5 @@
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -10,9 +11,29 @@ from starlette.middleware.sessions import SessionMiddleware
 from app.admin.panel import setup_admin
 from app.deps import base as base_deps
 from app.core.infrastructure import event_bus
+from app.core.infrastructure import tracing
+from app.core.infrastructure.cache import TTLCache
+from app.core.infrastructure.profiler import (
+    ProfilerMiddleware,
+    SamplingProfiler,
+)
+from app.core.infrastructure.metrics import (
+    MetricsMiddleware,
+    register_pool_metrics,
+)
+from app.core.infrastructure.slow_query import SlowQueryLog
+from app.core.infrastructure.query_counter import (
+    QueryCountMiddleware,
+    instrument_engine,
+)
 from app.core.register_handlers import register_event_handlers
+from app.identity.password import AsyncPasswordHasher
+from app.tasks import unit_of_work as tasks_uow
+from app.tasks.deadlines import DeadlineScheduler
 from app.routers import (
     calendar as calendar_router,
+    debug as debug_router,
+    metrics as metrics_router,
     evaluations as evaluations_router,
     identity as identity_router,
     scheduling as scheduling_router,
@@ -26,28 +47,96 @@ async def lifespan(app: FastAPI):
     settings = base_deps.get_settings()
 
     engine = create_async_engine(
-        f"postgresql+asyncpg://{settings.database_user}:"
-        f"{settings.database_password}@"
-        f"{settings.database_host}:{settings.database_port}/"
-        f"{settings.database_name}",
-        echo=True
+        settings.database_dsn,
+        echo=settings.database_echo,
+    )
+    instrument_engine(
+        engine, repeat_threshold=settings.query_repeat_threshold
     )
+    app.state.slow_query_log = SlowQueryLog(
+        threshold_ms=settings.slow_query_threshold_ms,
+        top_n=settings.slow_query_top_n,
+    )
+    app.state.slow_query_log.instrument(engine)
+    register_pool_metrics(engine)
+    app.state.profiler = SamplingProfiler()
+    if settings.tracing_exporter == "json":
+        tracing.configure(
+            tracing.JSONSpanExporter(path=settings.tracing_json_path)
+        )
+    elif settings.tracing_exporter == "otel":
+        tracing.configure(
+            tracing.OpenTelemetrySpanExporter(
+                settings.app_name or "team_manager"
+            )
+        )
 
     app.state.async_session = async_sessionmaker(
         engine, expire_on_commit=False
     )
     app.state.engine = engine
     app.state.bus = event_bus.MemoryEventBus()
+    app.state.user_cache = TTLCache(
+        max_size=settings.auth_cache_max_size,
+        ttl_seconds=settings.auth_cache_ttl_seconds,
+    )
+    app.state.admin_cache = TTLCache(
+        max_size=1_000,
+        ttl_seconds=settings.admin_auth_cache_ttl_seconds,
+    )
+    app.state.capability_cache = TTLCache(
+        max_size=settings.capability_cache_max_size,
+        ttl_seconds=settings.capability_cache_ttl_seconds,
+    )
+    app.state.password_hasher = AsyncPasswordHasher(
+        max_workers=settings.password_hash_workers,
+    )
     app.state.admin = setup_admin(app, engine)
-
-    await register_event_handlers(app.state.bus, app.state.async_session)
+    app.state.deadline_scheduler = None
+    if settings.deadline_scheduler_enabled:
+        app.state.deadline_scheduler = DeadlineScheduler(
+            tasks_uow.TaskSQLAlchemyUnitOfWork(
+                app.state.async_session,
+                app.state.bus,
+                tasks_uow.TaskRepositoryProvider,
+            ),
+            lead=timedelta(seconds=settings.deadline_reminder_seconds),
+            horizon=timedelta(seconds=settings.deadline_horizon_seconds),
+            catch_up=timedelta(seconds=settings.deadline_catch_up_seconds),
+        )
+
+    await register_event_handlers(
+        app.state.bus,
+        app.state.async_session,
+        user_cache=app.state.user_cache,
+        admin_cache=app.state.admin_cache,
+        capability_cache=app.state.capability_cache,
+        deadline_scheduler=app.state.deadline_scheduler,
+    )
+    if app.state.deadline_scheduler is not None:
+        app.state.deadline_scheduler.start()
 
     yield
 
+    if app.state.deadline_scheduler is not None:
+        await app.state.deadline_scheduler.stop()
+    app.state.profiler.stop()
+    exporter = tracing.get_exporter()
+    tracing.configure(None)
+    if isinstance(exporter, tracing.OpenTelemetrySpanExporter):
+        exporter.shutdown()
+    app.state.password_hasher.shutdown()
     await engine.dispose()
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(
+    QueryCountMiddleware,
+    expose_headers=base_deps.get_settings().debug,
+)
+app.add_middleware(tracing.TracingMiddleware)
+app.add_middleware(ProfilerMiddleware)
 app.add_middleware(
     SessionMiddleware,
     secret_key=base_deps.get_settings().secret_key,
@@ -70,3 +159,5 @@ app.include_router(tasks_router.tasks_router, prefix=PREFIX)
 app.include_router(evaluations_router.evaluations_router, prefix=PREFIX)
 app.include_router(scheduling_router.scheduling_router, prefix=PREFIX)
 app.include_router(calendar_router.calendar_router, prefix=PREFIX)
+app.include_router(debug_router.debug_router, prefix=PREFIX)
+app.include_router(metrics_router.metrics_router)
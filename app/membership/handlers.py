@@ -0,0 +1,50 @@
+from app.core.infrastructure.event import DomainEvent, EventHandler
+from app.core.shared.events import teams as team_event
+from app.core.uow.membership import MembershipHandlerUnitOfWork
+from app.membership.models import RoleMask
+
+
+class MembershipProjectionHandler(EventHandler[DomainEvent]):
+    """Keeps the shared membership read model in step with teams.
+
+    The only writer of ``membership``: each team membership event turns
+    into one upsert (or update) of the affected (team, user) rows.
+    """
+
+    def __init__(self, uow: MembershipHandlerUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, event: DomainEvent) -> None:
+        async with self.uow as uow:
+            repo = uow.repos.membership
+            if isinstance(event, team_event.MembersAddTeam):
+                await repo.grant(event.team_id, [
+                    (user_id, RoleMask.of(member_role))
+                    for user_id, member_role in event.members
+                ])
+            elif isinstance(event, team_event.MemberAddTeam):
+                await repo.grant(
+                    event.team_id, [(event.user_id, RoleMask.of(event.role))]
+                )
+            elif isinstance(
+                event, (team_event.TeamCreated, team_event.AdminAddTeam)
+            ):
+                await repo.grant(
+                    event.team_id, [(event.user_id, RoleMask.ADMIN)]
+                )
+            elif isinstance(event, team_event.MemberRemoveTeam):
+                await repo.revoke(
+                    event.team_id, event.user_id, RoleMask.of(event.role)
+                )
+            elif isinstance(event, team_event.AdminRemoveTeam):
+                await repo.revoke(event.team_id, event.user_id, RoleMask.ADMIN)
+            elif isinstance(event, team_event.MemberChangeRole):
+                await repo.change(
+                    event.team_id,
+                    event.user_id,
+                    RoleMask.of(event.old_role),
+                    RoleMask.of(event.new_role),
+                )
+            else:
+                return
+            await uow.commit()
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from enum import IntFlag
+
+from app.core.custom_types import ids, role
+
+
+class RoleMask(IntFlag):
+    """Team roles of one user packed into a single integer."""
+    MEMBER = 1
+    MANAGER = 2
+    ADMIN = 4
+
+    @classmethod
+    def of(cls, user_role: str) -> "RoleMask":
+        """Bit of a team role value (``"member"``, ``"manager"``...)."""
+        return _ROLE_BITS[role.UserRole(user_role)]
+
+    def roles(self) -> list[str]:
+        """Role values set in the mask, lowest bit first."""
+        return [
+            user_role.value
+            for user_role, bit in _ROLE_BITS.items()
+            if bit in self
+        ]
+
+
+_ROLE_BITS: dict[role.UserRole, RoleMask] = {
+    role.UserRole.MEMBER: RoleMask.MEMBER,
+    role.UserRole.MANAGER: RoleMask.MANAGER,
+    role.UserRole.ADMIN: RoleMask.ADMIN,
+}
+
+NO_ROLES = RoleMask(0)
+
+# Roles the tasks and scheduling contexts see; admins only manage the team.
+PROJECTED = RoleMask.MEMBER | RoleMask.MANAGER
+
+
+@dataclass(frozen=True, slots=True)
+class Membership:
+    """Every role a user holds in a team."""
+    team_id: ids.TeamId
+    user_id: ids.UserId
+    roles: RoleMask
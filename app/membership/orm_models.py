@@ -0,0 +1,28 @@
+from sqlalchemy import Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.deps.base import get_settings
+
+
+settings = get_settings()
+
+SCHEMA = "membership"
+TABLE_ARGS = {"schema": SCHEMA} if settings.use_schema else {}
+
+
+class MembershipOrm(Base):
+    """One row per (team, user) with the user's roles as a bitmask.
+
+    Shared read model of ``teams_members`` used by the tasks and
+    scheduling permission checks; see ``app.membership.models.RoleMask``.
+    """
+    __tablename__ = "membership"
+    __table_args__ = (
+        Index("ix_membership_user_id", "user_id"),
+        *(() if not TABLE_ARGS else (TABLE_ARGS,)),
+    )
+
+    team_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    roles: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,112 @@
+from typing import Iterable
+
+from sqlalchemy import delete, select, update
+
+from app.core.custom_types import ids
+from app.core.repositories.base import AbstractRepository
+from app.membership import models, orm_models
+
+
+Membership = orm_models.MembershipOrm
+
+
+class SQLAlchemyMembershipRepository(AbstractRepository[models.Membership]):
+    """Implementing the shared membership read model.
+
+    Writes are single upserts/updates keyed by (team_id, user_id); no
+    write ever loads or rewrites the rest of the team.
+    """
+
+    async def get_roles(self, team_id: int, user_id: int) -> models.RoleMask:
+        roles = await self.session.scalar(
+            select(Membership.roles).where(
+                Membership.team_id == team_id,
+                Membership.user_id == user_id,
+            )
+        )
+        return models.RoleMask(roles or 0)
+
+    async def get_by_team(self, team_id: int) -> list[models.Membership]:
+        result = await self.session.execute(
+            select(Membership.user_id, Membership.roles)
+            .where(Membership.team_id == team_id)
+            .order_by(Membership.user_id)
+        )
+        return [
+            models.Membership(
+                ids.TeamId(team_id),
+                ids.UserId(user_id),
+                models.RoleMask(roles),
+            )
+            for user_id, roles in result.all()
+        ]
+
+    async def grant(
+            self,
+            team_id: int,
+            grants: Iterable[tuple[int, models.RoleMask]],
+    ) -> None:
+        """Add role bits for several users in one multi-row upsert."""
+        merged: dict[int, int] = {}
+        for user_id, mask in grants:
+            merged[user_id] = merged.get(user_id, 0) | int(mask)
+        if not merged:
+            return
+        stmt = self._insert(Membership).values([
+            {"team_id": team_id, "user_id": user_id, "roles": mask}
+            for user_id, mask in merged.items()
+        ])
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=[Membership.team_id, Membership.user_id],
+            set_={"roles": Membership.roles.op("|")(stmt.excluded.roles)},
+        ))
+
+    async def revoke(
+            self, team_id: int, user_id: int, mask: models.RoleMask
+    ) -> None:
+        """Clear role bits; the row goes once no role is left."""
+        key = (Membership.team_id == team_id, Membership.user_id == user_id)
+        await self.session.execute(
+            update(Membership)
+            .where(*key)
+            .values(roles=Membership.roles.op("&")(int(~mask)))
+        )
+        await self.session.execute(
+            delete(Membership).where(*key, Membership.roles == 0)
+        )
+
+    async def change(
+            self,
+            team_id: int,
+            user_id: int,
+            old: models.RoleMask,
+            new: models.RoleMask,
+    ) -> None:
+        """Swap one role bit for another in a single upsert."""
+        stmt = self._insert(Membership).values(
+            team_id=team_id, user_id=user_id, roles=int(new)
+        )
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=[Membership.team_id, Membership.user_id],
+            set_={
+                "roles": Membership.roles.op("&")(int(~old))
+                .op("|")(int(new))
+            },
+        ))
+
+    async def save(self, domain: models.Membership) -> None:
+        if not domain.roles:
+            await self.session.execute(delete(Membership).where(
+                Membership.team_id == domain.team_id,
+                Membership.user_id == domain.user_id,
+            ))
+            return
+        stmt = self._insert(Membership).values(
+            team_id=domain.team_id,
+            user_id=domain.user_id,
+            roles=int(domain.roles),
+        )
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=[Membership.team_id, Membership.user_id],
+            set_={"roles": stmt.excluded.roles},
+        ))
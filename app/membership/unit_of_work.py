@@ -0,0 +1,23 @@
+from typing import TYPE_CHECKING
+
+from app.core.repositories.descriptor import LazyRepo
+from app.core.repositories.membership import MembershipProtocol
+from app.core.unit_of_work import (
+    AbstractSqlRepositoryProvider,
+    SQLAlchemyUnitOfWork,
+)
+from app.membership import repository as repo
+
+
+class MembershipRepositoryProvider(AbstractSqlRepositoryProvider):
+    """Membership read model's interface for SQL repository providers."""
+    if TYPE_CHECKING:
+        membership: MembershipProtocol
+    else:
+        membership = LazyRepo(repo.SQLAlchemyMembershipRepository)
+
+
+class MembershipSQLAlchemyUnitOfWork(
+    SQLAlchemyUnitOfWork[MembershipRepositoryProvider]
+):
+    ...
@@ -0,0 +1,96 @@
+import asyncio
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.infrastructure.profiler import (
+    ProfilerBusyError,
+    SamplingProfiler,
+)
+from app.core.infrastructure.slow_query import SlowQueryLog
+from app.deps.base import get_profiler, get_slow_query_log
+from app.deps.user import SuperUserDepend
+
+
+debug_router = APIRouter(
+    prefix="/debug",
+    tags=["debug"],
+)
+
+SlowQueries = Annotated[SlowQueryLog, Depends(get_slow_query_log)]
+Profiler = Annotated[SamplingProfiler, Depends(get_profiler)]
+
+
+@debug_router.get("/slow-queries")
+async def list_slow_queries(
+        user: SuperUserDepend,
+        slow_queries: SlowQueries,
+        limit: Annotated[int | None, Query(ge=0)] = None,
+):
+    return [
+        {
+            "fingerprint": entry.fingerprint,
+            "statement": entry.statement,
+            "count": entry.count,
+            "total_ms": round(entry.total_ms, 3),
+            "avg_ms": round(entry.avg_ms, 3),
+            "max_ms": round(entry.max_ms, 3),
+            "rows": entry.rows,
+            "origins": dict(entry.origins.most_common()),
+        }
+        for entry in slow_queries.top(limit)
+    ]
+
+
+@debug_router.delete(
+    "/slow-queries", status_code=status.HTTP_204_NO_CONTENT
+)
+async def reset_slow_queries(
+        user: SuperUserDepend,
+        slow_queries: SlowQueries,
+):
+    slow_queries.reset()
+
+
+@debug_router.post(
+    "/profiler/start", status_code=status.HTTP_202_ACCEPTED
+)
+async def start_profiler(
+        user: SuperUserDepend,
+        profiler: Profiler,
+        seconds: Annotated[float | None, Query(gt=0, le=600)] = None,
+        requests: Annotated[int | None, Query(gt=0, le=100_000)] = None,
+        interval_ms: Annotated[float, Query(ge=1, le=1000)] = 5,
+):
+    if seconds is None and requests is None:
+        raise HTTPException(400, "seconds or requests is required")
+    try:
+        profiler.start(
+            seconds=seconds,
+            requests=requests,
+            interval=interval_ms / 1000,
+        )
+    except ProfilerBusyError as exc:
+        raise HTTPException(409, str(exc))
+    return {"running": True, "seconds": seconds, "requests": requests}
+
+
+@debug_router.post("/profiler/stop")
+async def stop_profiler(user: SuperUserDepend, profiler: Profiler):
+    # Joining the sampler thread would block the event loop.
+    await asyncio.to_thread(profiler.stop)
+    return {"running": False, "samples": profiler.samples}
+
+
+@debug_router.get("/profiler", response_class=PlainTextResponse)
+async def read_profile(user: SuperUserDepend, profiler: Profiler):
+    """Collapsed stacks, ready for flamegraph.pl or speedscope."""
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={
+            "X-Profiler-Running": str(profiler.running).lower(),
+            "X-Profiler-Samples": str(profiler.samples),
+            "X-Profiler-Requests": str(profiler.requests),
+        },
+    )
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Query, status
+from datetime import datetime
+from typing import Literal
 
-from app.deps.task import TaskUoW
+from fastapi import APIRouter, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.deps.task import TaskExportUoW, TaskUoW
 from app.deps.user import UserDepend
-from app.tasks import dto, use_cases
+from app.tasks import dto, export, importer, use_cases
 
 
 tasks_router = APIRouter(
@@ -24,6 +28,118 @@ async def create_task(
         raise use_cases.map_task_exception(exc)
 
 
+@tasks_router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    command_body: dto.BulkCreateTasksCommand,
+    user: UserDepend,
+    uow: TaskUoW,
+):
+    command = command_body.model_copy(update={"actor_user_id": user.id})
+    try:
+        return await use_cases.BulkCreateTaskUseCase(uow).execute(command)
+    except Exception as exc:
+        raise use_cases.map_task_exception(exc)
+
+
+@tasks_router.patch("/bulk")
+async def update_tasks_bulk(
+    command_body: dto.BulkUpdateTasksCommand,
+    user: UserDepend,
+    uow: TaskUoW,
+):
+    command = command_body.model_copy(update={"actor_user_id": user.id})
+    try:
+        return await use_cases.BulkUpdateTaskUseCase(uow).execute(command)
+    except Exception as exc:
+        raise use_cases.map_task_exception(exc)
+
+
+@tasks_router.post(
+    "/import",
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"text/csv": {"schema": {"type": "string"}}},
+    }},
+)
+async def import_tasks(
+    request: Request,
+    user: UserDepend,
+    uow: TaskUoW,
+):
+    try:
+        return await use_cases.ImportTaskUseCase(uow).execute(
+            actor_user_id=user.id,
+            rows=importer.csv_rows(request.stream()),
+        )
+    except Exception as exc:
+        raise use_cases.map_task_exception(exc)
+
+
+@tasks_router.get("/search")
+async def search_tasks(
+    user: UserDepend,
+    uow: TaskUoW,
+    q: str = Query(..., min_length=1, max_length=200),
+    team_id: int | None = Query(default=None, gt=0),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+):
+    try:
+        return await use_cases.SearchTaskUseCase(uow).execute(
+            actor_user_id=user.id,
+            query=q,
+            team_id=team_id,
+            limit=limit,
+            offset=offset,
+        )
+    except Exception as exc:
+        raise use_cases.map_task_exception(exc)
+
+
+@tasks_router.get("/stats")
+async def task_stats(
+    user: UserDepend,
+    uow: TaskUoW,
+    team_id: int = Query(..., gt=0),
+    executor_id: int | None = Query(default=None, gt=0),
+):
+    try:
+        return await use_cases.TaskStatsUseCase(uow).execute(
+            actor_user_id=user.id,
+            team_id=team_id,
+            executor_id=executor_id,
+        )
+    except Exception as exc:
+        raise use_cases.map_task_exception(exc)
+
+
+@tasks_router.get("/export")
+async def export_tasks(
+    user: UserDepend,
+    uow: TaskUoW,
+    export_uow: TaskExportUoW,
+    team_id: int = Query(..., gt=0),
+    format: Literal["csv", "ndjson"] = Query(default="csv"),
+):
+    try:
+        chunks = await use_cases.ExportTaskUseCase(uow).execute(
+            actor_user_id=user.id,
+            team_id=team_id,
+            export_format=format,
+            export_uow=export_uow,
+        )
+    except Exception as exc:
+        raise use_cases.map_task_exception(exc)
+    return StreamingResponse(
+        chunks,
+        media_type=export.MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition":
+                f'attachment; filename="team-{team_id}-tasks.{format}"',
+        },
+    )
+
+
 @tasks_router.get("/{task_id}")
 async def get_task(
     task_id: int,
@@ -112,8 +228,17 @@ async def list_comments(
     task_id: int,
     user: UserDepend,
     uow: TaskUoW,
+    cursor: int | None = Query(default=None, ge=0),
+    since: datetime | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
 ):
     try:
-        return await use_cases.ListCommentUseCase(uow).execute(task_id, user.id)
+        return await use_cases.ListCommentUseCase(uow).execute(
+            task_id,
+            user.id,
+            limit=limit,
+            cursor=cursor,
+            since=since,
+        )
     except Exception as exc:
         raise use_cases.map_task_exception(exc)
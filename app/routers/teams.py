@@ -1,11 +1,13 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
 from app.deps.user import (
     UserDepend
 )
 from app.deps.team import (
+    TeamCapabilityCache,
     TeamUoW
 )
+from app.core.custom_types.role import UserRole
 from app.teams import dto, use_cases
 
 
@@ -44,10 +46,37 @@ async def get_team(
 @teams_router.get("")
 async def list_my_teams(
         user: UserDepend,
-        uow: TeamUoW
+        uow: TeamUoW,
+        limit: int = Query(default=50, ge=1, le=200),
+        offset: int = Query(default=0, ge=0),
 ):
     try:
-        return await use_cases.ListMyTeamsUseCase(uow).execute(user.id)
+        return await use_cases.ListMyTeamsUseCase(uow).execute(
+            user.id, limit=limit, offset=offset
+        )
+    except Exception as exc:
+        raise use_cases.map_team_exception(exc)
+
+
+@teams_router.get("/{team_id}/members")
+async def list_members(
+        team_id: int,
+        user: UserDepend,
+        uow: TeamUoW,
+        role: UserRole | None = Query(default=None),
+        search: str | None = Query(default=None, min_length=1, max_length=100),
+        cursor: int | None = Query(default=None, ge=0),
+        limit: int = Query(default=50, ge=1, le=200),
+):
+    try:
+        return await use_cases.ListTeamMembersUseCase(uow).execute(
+            actor_user_id=user.id,
+            team_id=team_id,
+            limit=limit,
+            cursor=cursor,
+            role=role,
+            search=search,
+        )
     except Exception as exc:
         raise use_cases.map_team_exception(exc)
 
@@ -68,6 +97,22 @@ async def add_member(
         raise use_cases.map_team_exception(exc)
 
 
+@teams_router.post("/{team_id}/members/bulk")
+async def bulk_add_members(
+        team_id: int,
+        command_body: dto.BulkAddMembersCommand,
+        user: UserDepend,
+        uow: TeamUoW
+):
+    command = command_body.model_copy(
+        update={"team_id": team_id, "actor_user_id": user.id}
+    )
+    try:
+        return await use_cases.BulkAddMembersUseCase(uow).execute(command)
+    except Exception as exc:
+        raise use_cases.map_team_exception(exc)
+
+
 @teams_router.delete("/{team_id}/members/{member_id}")
 async def remove_member(
         team_id: int,
@@ -114,9 +159,10 @@ async def my_team_capabilities(
         team_id: int,
         user: UserDepend,
         uow: TeamUoW,
+        cache: TeamCapabilityCache,
 ):
     try:
-        return await use_cases.TeamCapabilitiesUseCase(uow).execute(
+        return await use_cases.TeamCapabilitiesUseCase(uow, cache).execute(
             team_id=team_id,
             user_id=user.id,
         )
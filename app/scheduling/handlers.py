@@ -1,4 +1,4 @@
-from app.core.custom_types import ids, role
+from app.core.custom_types import ids
 from app.core.infrastructure.event import EventHandler
 from app.core.shared.events import teams as team_event
 from app.core.shared.handlers.users import (
@@ -10,10 +10,6 @@ from app.core.uow.scheduling import SchedulingHandlerUnitOfWork
 from app.scheduling.models import Team, User
 
 
-def _is_manager_role(user_role: str) -> bool:
-    return user_role == role.UserRole.MANAGER
-
-
 class SchedulingUserCreatedHandler(
     UserCreatedHandler[SchedulingHandlerUnitOfWork, type[User]]
 ):
@@ -41,61 +37,3 @@ class SchedulingTeamCreatedHandler(EventHandler[team_event.TeamCreated]):
             team = Team(id=ids.TeamId(event.team_id), members=[])
             await uow.repos.team.save(team)
             await uow.commit()
-
-
-class SchedulingMemberAddHandler(EventHandler[team_event.MemberAddTeam]):
-    def __init__(self, uow: SchedulingHandlerUnitOfWork):
-        self.uow = uow
-
-    async def handle(self, event: team_event.MemberAddTeam) -> None:
-        async with self.uow as uow:
-            team = await uow.repos.team.get_by_id(event.team_id)
-            if team is None:
-                team = Team(id=ids.TeamId(event.team_id), members=[])
-            user = await uow.repos.user.get_by_id(event.user_id)
-            if user is None:
-                await uow.repos.user.save(
-                    User(id=ids.UserId(event.user_id), username="")
-                )
-            team.add_member(
-                user_id=ids.UserId(event.user_id),
-                is_manager=_is_manager_role(event.role),
-            )
-            await uow.repos.team.save(team)
-            await uow.commit()
-
-
-class SchedulingMemberRemoveHandler(EventHandler[team_event.MemberRemoveTeam]):
-    def __init__(self, uow: SchedulingHandlerUnitOfWork):
-        self.uow = uow
-
-    async def handle(self, event: team_event.MemberRemoveTeam) -> None:
-        async with self.uow as uow:
-            team = await uow.repos.team.get_by_id(event.team_id)
-            if team is None:
-                return
-            team.remove_member(ids.UserId(event.user_id))
-            await uow.repos.team.save(team)
-            await uow.commit()
-
-
-class SchedulingMemberChangeRoleHandler(EventHandler[team_event.MemberChangeRole]):
-    def __init__(self, uow: SchedulingHandlerUnitOfWork):
-        self.uow = uow
-
-    async def handle(self, event: team_event.MemberChangeRole) -> None:
-        async with self.uow as uow:
-            team = await uow.repos.team.get_by_id(event.team_id)
-            if team is None:
-                return
-            user = await uow.repos.user.get_by_id(event.user_id)
-            if user is None:
-                await uow.repos.user.save(
-                    User(id=ids.UserId(event.user_id), username="")
-                )
-            team.change_member_role(
-                user_id=ids.UserId(event.user_id),
-                is_manager=_is_manager_role(event.new_role),
-            )
-            await uow.repos.team.save(team)
-            await uow.commit()
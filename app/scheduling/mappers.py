@@ -1,6 +1,8 @@
 from collections.abc import Sequence
 
 from app.core.custom_types import ids
+from app.membership.models import PROJECTED, RoleMask
+from app.membership.orm_models import MembershipOrm
 from app.scheduling import models, orm_models
 
 
@@ -24,42 +26,23 @@ class SchedulingUserMapper:
         orm.username = user.username
 
 
-class SchedulingMemberMapper:
-    @staticmethod
-    def to_domain(orm: orm_models.SchedulingMemberOrm) -> models.MemberTeam:
-        return models.MemberTeam(
-            user_id=ids.UserId(orm.user_id),
-            team_id=ids.TeamId(orm.team_id),
-            is_manager=orm.is_manager,
-        )
-
-    @staticmethod
-    def to_orm(member: models.MemberTeam) -> orm_models.SchedulingMemberOrm:
-        return orm_models.SchedulingMemberOrm(
-            user_id=member.user_id,
-            team_id=member.team_id,
-            is_manager=member.is_manager,
-        )
-
-    @staticmethod
-    def update_orm(
-            orm: orm_models.SchedulingMemberOrm,
-            member: models.MemberTeam,
-    ) -> None:
-        orm.user_id = member.user_id
-        orm.team_id = member.team_id
-        orm.is_manager = member.is_manager
-
-
 class SchedulingTeamMapper:
     @staticmethod
     def to_domain(
             orm: orm_models.SchedulingTeamOrm,
-            members: Sequence[orm_models.SchedulingMemberOrm],
+            memberships: Sequence[MembershipOrm],
     ) -> models.Team:
         return models.Team(
             id=ids.TeamId(orm.id),
-            members=[SchedulingMemberMapper.to_domain(member) for member in members],
+            members=[
+                models.MemberTeam(
+                    user_id=ids.UserId(membership.user_id),
+                    team_id=ids.TeamId(membership.team_id),
+                    is_manager=bool(membership.roles & RoleMask.MANAGER),
+                )
+                for membership in memberships
+                if membership.roles & PROJECTED
+            ],
         )
 
     @staticmethod
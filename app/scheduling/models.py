@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemberTeam:
     """Represents a team member with an assigned role."""
     user_id: ids.UserId
@@ -19,6 +19,7 @@ class MemberTeam:
 
 class Team(Entity):
     """Team for sheduling's context."""
+    __slots__ = ("_id", "_members", "_index")
 
     def __init__(
             self, id: ids.TeamId,
@@ -27,6 +28,10 @@ class Team(Entity):
         """Create a team with a unique identifier."""
         self._id = id
         self._members = members
+        # user_id -> member; a user holds one membership per team here.
+        self._index: dict[ids.UserId, MemberTeam] = {
+            member.user_id: member for member in members
+        }
 
     @property
     def id(self) -> ids.TeamId:
@@ -39,14 +44,13 @@ class Team(Entity):
 
     def is_member(self, user_id: ids.UserId) -> bool:
         """Check whether the given user is a team member."""
-        return any(
-            member.user_id == user_id
-            for member in self._members
-        )
+        return user_id in self._index
 
     def is_manager(self, user_id: ids.UserId) -> bool:
             """Check whether the user is already a team member."""
-            return MemberTeam(user_id, self._id, True) in self.members
+            return self._index.get(user_id) == MemberTeam(
+                user_id, self._id, True
+            )
 
     def add_member(
             self,
@@ -58,37 +62,42 @@ class Team(Entity):
             team_id=self._id,
             is_manager=is_manager,
         )
-        if new_member in self._members:
+        current = self._index.get(user_id)
+        if current == new_member:
             return None
-        self._members = [item for item in self._members if item.user_id != user_id]
+        if current is not None:
+            self._members = [
+                item for item in self._members if item.user_id != user_id
+            ]
         self._members.append(new_member)
+        self._index[user_id] = new_member
         return new_member
 
     def remove_member(self, user_id: ids.UserId) -> MemberTeam | None:
-        for member in self._members:
-            if member.user_id == user_id:
-                self._members.remove(member)
-                return member
-        return None
+        member = self._index.pop(user_id, None)
+        if member is not None:
+            self._members.remove(member)
+        return member
 
     def change_member_role(
             self,
             user_id: ids.UserId,
             is_manager: bool,
     ) -> MemberTeam | None:
-        for index, member in enumerate(self._members):
-            if member.user_id == user_id:
-                updated_member = MemberTeam(
-                    user_id=user_id,
-                    team_id=self._id,
-                    is_manager=is_manager,
-                )
-                self._members[index] = updated_member
-                return updated_member
-        return None
+        member = self._index.get(user_id)
+        if member is None:
+            return None
+        updated_member = MemberTeam(
+            user_id=user_id,
+            team_id=self._id,
+            is_manager=is_manager,
+        )
+        self._members[self._members.index(member)] = updated_member
+        self._index[user_id] = updated_member
+        return updated_member
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeetingParticipant:
     """The value object representing a meeting participant"""
 
@@ -98,6 +107,10 @@ class MeetingParticipant:
 
 class Meeting(Entity, AggregateRoot):
     """Meeting aggregate representing a scheduled team event."""
+    __slots__ = (
+        "_id", "_team_id", "_organizer_id", "_description",
+        "_is_cancelled", "_participants", "_start", "_end",
+    )
 
     def __init__(
         self,
@@ -270,6 +283,7 @@ class Meeting(Entity, AggregateRoot):
 
 class User(BaseUser):
     """User aggregate representing a system participant."""
+    __slots__ = ("_meetings",)
     def __init__(
             self, id: ids.UserId, username: str,
             meetings: list[Meeting] | None = None,
@@ -28,15 +28,6 @@ class SchedulingTeamOrm(Base, IdMixin, TimestampMixin):
     __table_args__ = TABLE_ARGS
 
 
-class SchedulingMemberOrm(Base, IdMixin, TimestampMixin):
-    __tablename__ = "scheduling_member"
-    __table_args__ = TABLE_ARGS
-
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey(USER_FK), nullable=False)
-    team_id: Mapped[int] = mapped_column(Integer, ForeignKey(TEAM_FK), nullable=False)
-    is_manager: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-
-
 class SchedulingMeetingOrm(Base, IdMixin, TimestampMixin):
     __tablename__ = "scheduling_meeting"
     __table_args__ = TABLE_ARGS
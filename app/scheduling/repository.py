@@ -1,7 +1,10 @@
+from typing import Iterable
+
 from sqlalchemy import delete, select
 
 from app.core.custom_types import ids
 from app.core.repositories.base import AbstractRepository
+from app.membership.orm_models import MembershipOrm
 from app.scheduling import mappers, models, orm_models
 
 
@@ -33,6 +36,14 @@ class SQLAlchemySchedulingUserRepository(AbstractRepository[models.User]):
         user._meetings = meetings
         return user
 
+    async def get_existing_ids(self, user_ids: Iterable[int]) -> set[int]:
+        result = await self.session.execute(
+            select(orm_models.SchedulingUserOrm.id).where(
+                orm_models.SchedulingUserOrm.id.in_(set(user_ids))
+            )
+        )
+        return set(result.scalars().all())
+
     async def save(self, domain: models.User) -> None:
         result = await self.session.execute(
             select(orm_models.SchedulingUserOrm).where(
@@ -47,6 +58,8 @@ class SQLAlchemySchedulingUserRepository(AbstractRepository[models.User]):
 
 
 class SQLAlchemySchedulingTeamRepository(AbstractRepository[models.Team]):
+    """Teams with members read from the shared membership read model."""
+
     async def get_by_id(self, id: int) -> models.Team | None:
         team_result = await self.session.execute(
             select(orm_models.SchedulingTeamOrm).where(
@@ -56,67 +69,23 @@ class SQLAlchemySchedulingTeamRepository(AbstractRepository[models.Team]):
         team_orm = team_result.scalar_one_or_none()
         if team_orm is None:
             return None
-        member_result = await self.session.execute(
-            select(orm_models.SchedulingMemberOrm).where(
-                orm_models.SchedulingMemberOrm.team_id == id
-            )
+        memberships = await self.session.execute(
+            select(MembershipOrm)
+            .where(MembershipOrm.team_id == id)
+            .order_by(MembershipOrm.user_id)
+        )
+        return mappers.SchedulingTeamMapper.to_domain(
+            team_orm, memberships.scalars().all()
         )
-        members_orm = member_result.scalars().all()
-        return mappers.SchedulingTeamMapper.to_domain(team_orm, members_orm)
 
     async def save(self, domain: models.Team) -> None:
         result = await self.session.execute(
-            select(orm_models.SchedulingTeamOrm).where(
+            select(orm_models.SchedulingTeamOrm.id).where(
                 orm_models.SchedulingTeamOrm.id == domain.id
             )
         )
-        team_orm = result.scalar_one_or_none()
-        if team_orm is None:
+        if result.scalar_one_or_none() is None:
             self.session.add(mappers.SchedulingTeamMapper.to_orm(domain))
-        await self.session.execute(
-            delete(orm_models.SchedulingMemberOrm).where(
-                orm_models.SchedulingMemberOrm.team_id == domain.id
-            )
-        )
-        for member in domain.members:
-            self.session.add(mappers.SchedulingMemberMapper.to_orm(member))
-
-
-class SQLAlchemySchedulingMemberRepository(AbstractRepository[models.MemberTeam]):
-    async def get_by_user_and_team(
-            self, user_id: int, team_id: int
-    ) -> models.MemberTeam | None:
-        result = await self.session.execute(
-            select(orm_models.SchedulingMemberOrm).where(
-                orm_models.SchedulingMemberOrm.user_id == user_id,
-                orm_models.SchedulingMemberOrm.team_id == team_id,
-            )
-        )
-        member_orm = result.scalar_one_or_none()
-        if member_orm is None:
-            return None
-        return mappers.SchedulingMemberMapper.to_domain(member_orm)
-
-    async def save(self, domain: models.MemberTeam) -> None:
-        result = await self.session.execute(
-            select(orm_models.SchedulingMemberOrm).where(
-                orm_models.SchedulingMemberOrm.user_id == domain.user_id,
-                orm_models.SchedulingMemberOrm.team_id == domain.team_id,
-            )
-        )
-        member_orm = result.scalar_one_or_none()
-        if member_orm is None:
-            self.session.add(mappers.SchedulingMemberMapper.to_orm(domain))
-            return
-        mappers.SchedulingMemberMapper.update_orm(member_orm, domain)
-
-    async def delete(self, user_id: int, team_id: int) -> None:
-        await self.session.execute(
-            delete(orm_models.SchedulingMemberOrm).where(
-                orm_models.SchedulingMemberOrm.user_id == user_id,
-                orm_models.SchedulingMemberOrm.team_id == team_id,
-            )
-        )
 
 
 class SQLAlchemySchedulingMeetingRepository(AbstractRepository[models.Meeting]):
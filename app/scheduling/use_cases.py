@@ -1,6 +1,8 @@
 from fastapi import HTTPException
 
 from app.core.custom_types import ids
+from app.core.infrastructure import tracing
+from app.core.infrastructure.tracing import traced
 from app.core.uow.scheduling import SchedulingUnitOfWork
 from app.scheduling import custom_exception, dto, management
 from app.scheduling.models import Meeting
@@ -51,6 +53,7 @@ class CreateMeetingUseCase:
     def __init__(self, uow: SchedulingUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, command: dto.CreateMeetingCommand) -> dto.MeetingReadDTO:
         if command.actor_user_id is None:
             raise ValueError("actor_user_id is required")
@@ -74,6 +77,7 @@ class ReadMeetingUseCase:
     def __init__(self, uow: SchedulingUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, meeting_id: int, actor_user_id: int) -> dto.MeetingReadDTO:
         meeting = await self.uow.repos.meeting.get_by_id(meeting_id)
         if meeting is None:
@@ -88,6 +92,7 @@ class ListMeetingUseCase:
     def __init__(self, uow: SchedulingUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
             self,
             actor_user_id: int,
@@ -115,6 +120,7 @@ class AddParticipantUseCase:
     def __init__(self, uow: SchedulingUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
             self,
             meeting_id: int,
@@ -137,7 +143,8 @@ class AddParticipantUseCase:
             user_id=ids.UserId(actor_user_id),
             meeting=meeting,
         )
-        action.execute(user=user, team=team)
+        with tracing.span("ActionAddMeeting.execute"):
+            action.execute(user=user, team=team)
         meeting.mark_updated_event(previous_participant_ids)
         await self.uow.repos.meeting.save(meeting)
         await self.uow.commit()
@@ -148,6 +155,7 @@ class RemoveParticipantUseCase:
     def __init__(self, uow: SchedulingUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
             self,
             meeting_id: int,
@@ -175,6 +183,7 @@ class CancelMeetingUseCase:
     def __init__(self, uow: SchedulingUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
             self, meeting_id: int, actor_user_id: int
     ) -> dto.MeetingReadDTO:
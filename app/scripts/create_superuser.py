@@ -14,13 +14,7 @@ from app.identity.orm_models import UserORM
 
 
 def _database_url() -> str:
-    settings = get_settings()
-    return (
-        f"postgresql+asyncpg://{settings.database_user}:"
-        f"{settings.database_password}@"
-        f"{settings.database_host}:{settings.database_port}/"
-        f"{settings.database_name}"
-    )
+    return get_settings().database_dsn
 
 
 async def _create_or_promote_superuser(
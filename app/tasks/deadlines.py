@@ -0,0 +1,212 @@
+"""In-process timers for task deadlines.
+
+Each worker keeps a min-heap of the deadline timers that fire within
+the next ``horizon``: one ``approaching`` timer ``lead`` before a
+deadline and one ``overdue`` timer at it. The heap is filled window by
+window with one indexed range query over live, unfinished tasks and is
+kept current from ``TaskCreated``/``TaskUpdated`` in between, so the
+``tasks`` table is never scanned.
+
+Every worker holds the same timers. When one is due, the worker re-reads
+the task and claims the timer in ``tasks_deadline_timers``; the primary
+key lets exactly one process win, and only the winner publishes
+``TaskDeadlineApproaching``/``TaskOverdue``.
+"""
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from app.core.custom_types import ids
+from app.core.custom_types.deadline_kind import DeadlineKind
+from app.core.uow.tasks import TaskHandlerUnitOfWork
+from app.tasks.models import DeadlineTimer
+
+
+logger = logging.getLogger(__name__)
+
+# (fire_at, task_id, kind, deadline); ordered by fire time.
+_Entry = tuple[datetime, int, DeadlineKind, datetime]
+
+
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class DeadlineScheduler:
+    """Fires deadline timers of tasks from a min-heap.
+
+    Not thread-safe: meant to be used from the event loop thread only.
+    """
+
+    def __init__(
+        self,
+        uow: TaskHandlerUnitOfWork,
+        *,
+        lead: timedelta = timedelta(days=1),
+        horizon: timedelta = timedelta(hours=1),
+        catch_up: timedelta = timedelta(days=1),
+        retry_seconds: float = 30.0,
+        clock: Callable[[], datetime] = _now,
+    ):
+        """Initialize the scheduler.
+
+        ``catch_up`` is how far back the first load looks for timers
+        missed while no worker was running.
+        """
+        if horizon <= timedelta(0):
+            raise ValueError("horizon must be positive")
+        self.uow = uow
+        self._lead = lead
+        self._horizon = horizon
+        self._catch_up = catch_up
+        self._retry_seconds = retry_seconds
+        self._clock = clock
+        self._heap: list[_Entry] = []
+        # task_id -> deadline the task's pending timers are for; heap
+        # entries with another deadline are stale and skipped.
+        self._deadlines: dict[int, datetime] = {}
+        self._until: datetime | None = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _timers(
+        self, deadline: datetime
+    ) -> tuple[tuple[datetime, DeadlineKind], ...]:
+        return (
+            (deadline - self._lead, DeadlineKind.APPROACHING),
+            (deadline, DeadlineKind.OVERDUE),
+        )
+
+    def _push(self, task_id: int, deadline: datetime, since: datetime) -> None:
+        """Queue the task's timers that fire in (since, loaded window]."""
+        until = self._until
+        if until is None:
+            return
+        for fire_at, kind in self._timers(deadline):
+            if since < fire_at <= until:
+                if not self._heap or fire_at < self._heap[0][0]:
+                    self._wake.set()
+                heapq.heappush(self._heap, (fire_at, task_id, kind, deadline))
+                self._deadlines[task_id] = deadline
+
+    def schedule(self, task_id: int, deadline: datetime) -> None:
+        """(Re)arm the timers of a task whose deadline is set or moved."""
+        deadline = _utc(deadline)
+        if self._deadlines.get(task_id) == deadline:
+            return
+        self._push(task_id, deadline, _EPOCH)
+
+    def cancel(self, task_id: int) -> None:
+        """Drop the pending timers of a task (done or deleted)."""
+        self._deadlines.pop(task_id, None)
+
+    async def load(self, now: datetime) -> None:
+        """Queue the timers of the next window with one range query."""
+        since = self._until or now - self._catch_up
+        until = now + self._horizon
+        async with self.uow as uow:
+            # Approaching timers fire ``lead`` before their deadline.
+            deadlines = await uow.repos.task.get_deadlines(
+                since, until + self._lead
+            )
+        self._until = until
+        for task_id, deadline in deadlines:
+            self._push(task_id, _utc(deadline), since)
+
+    async def fire_due(self, now: datetime) -> None:
+        """Fire every timer due at ``now``."""
+        until = self._until
+        if until is None:
+            # Nothing is queued before the first window is loaded.
+            return
+        while self._heap and self._heap[0][0] <= now:
+            _, task_id, kind, deadline = heapq.heappop(self._heap)
+            if self._deadlines.get(task_id) != deadline:
+                continue
+            # The overdue timer is the task's last; it may also belong
+            # to a window not loaded yet, which re-arms the task.
+            if kind == DeadlineKind.OVERDUE or deadline > until:
+                del self._deadlines[task_id]
+            if kind == DeadlineKind.APPROACHING and deadline <= now:
+                continue
+            try:
+                await self._fire(
+                    DeadlineTimer(ids.TaskId(task_id), kind, deadline)
+                )
+            except Exception:
+                logger.exception(
+                    "Deadline timer %s of task %s failed", kind.value, task_id
+                )
+
+    async def _fire(self, timer: DeadlineTimer) -> None:
+        async with self.uow as uow:
+            task = await uow.repos.task.get_by_id(timer.task_id)
+            if task is None or not task.reach_deadline(timer):
+                return
+            if not await uow.repos.timer.claim(timer):
+                return
+            # Registers the task, so the commit publishes its event.
+            await uow.repos.task.save(task)
+            await uow.commit()
+
+    def _timeout(self, now: datetime) -> float:
+        if self._until is None:
+            return 0.0
+        # Load the next window while half of the current one is left.
+        wake_at = self._until - self._horizon / 2
+        if self._heap:
+            wake_at = min(wake_at, self._heap[0][0])
+        return max((wake_at - now).total_seconds(), 0.0)
+
+    async def run(self) -> None:
+        """Load windows and fire timers until cancelled."""
+        while True:
+            try:
+                now = self._clock()
+                until = self._until
+                if until is None or now >= until - self._horizon / 2:
+                    await self.load(now)
+                await self.fire_due(now)
+                self._wake.clear()
+                timeout = self._timeout(self._clock())
+            except Exception:
+                logger.exception("Deadline scheduler iteration failed")
+                self._wake.clear()
+                timeout = self._retry_seconds
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Run the scheduler in a background task of the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self.run(), name="deadline-scheduler"
+            )
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -32,6 +32,38 @@ class UpdateTaskCommand(BaseModel):
     deleted: bool | None = None
 
 
+# Upper bound of tasks in one bulk request.
+BULK_MAX_TASKS = 500
+
+
+class BulkCreateTasksCommand(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    tasks: list[CreateTaskCommand] = Field(
+        ..., min_length=1, max_length=BULK_MAX_TASKS
+    )
+    actor_user_id: int | None = Field(default=None, gt=0)
+
+
+class BulkUpdateTaskItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    task_id: int = Field(..., gt=0)
+    title: str | None = Field(default=None, min_length=1, max_length=255)
+    description: str | None = Field(default=None, min_length=1)
+    status: str | None = Field(default=None, description="open|in_progress|done")
+    deleted: bool | None = None
+
+
+class BulkUpdateTasksCommand(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    tasks: list[BulkUpdateTaskItem] = Field(
+        ..., min_length=1, max_length=BULK_MAX_TASKS
+    )
+    actor_user_id: int | None = Field(default=None, gt=0)
+
+
 class AddCommentCommand(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -65,6 +97,56 @@ class TaskListDTO(BaseModel):
     offset: int
 
 
+class TaskBulkDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    items: list[TaskReadDTO]
+
+
+class TaskSearchHitDTO(TaskReadDTO):
+    """A matching task; higher ``rank`` is a better match."""
+    rank: float
+
+
+class TaskSearchDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    items: list[TaskSearchHitDTO]
+    total: int
+    limit: int
+    offset: int
+
+
+class TaskStatsDTO(BaseModel):
+    """Live task counts of a team, or of one executor in it."""
+    model_config = ConfigDict(frozen=True)
+
+    team_id: int
+    executor_id: int | None = None
+    open: int
+    in_progress: int
+    done: int
+    overdue: int
+    total: int
+
+
+class TaskImportErrorDTO(BaseModel):
+    """A rejected CSV row; ``row`` counts data rows from 1."""
+    model_config = ConfigDict(frozen=True)
+
+    row: int
+    error: str
+
+
+class TaskImportReportDTO(BaseModel):
+    """Outcome of a CSV import; ``errors`` holds the first rejections."""
+    model_config = ConfigDict(frozen=True)
+
+    imported: int
+    failed: int
+    errors: list[TaskImportErrorDTO]
+
+
 class CommentReadDTO(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -73,3 +155,13 @@ class CommentReadDTO(BaseModel):
     author_id: int
     text: str
     created_at: datetime | None = None
+
+
+class CommentPageDTO(BaseModel):
+    """Page of comments, oldest first; pass ``next_cursor`` back as
+    ``cursor``."""
+    model_config = ConfigDict(frozen=True)
+
+    items: list[CommentReadDTO]
+    next_cursor: int | None = None
+
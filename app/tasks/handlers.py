@@ -1,3 +1,6 @@
+from typing import Sequence
+
+from app.core.shared.events import tasks as task_event
 from app.core.shared.events import teams as team_event
 from app.core.shared.handlers.users import (
     UserCreatedHandler,
@@ -5,10 +8,10 @@ from app.core.shared.handlers.users import (
     UserUpdatedHandler,
 )
 from app.core.uow.tasks import TaskHandlerUnitOfWork
-from app.core.custom_types import ids, role
-from app.core.infrastructure.event import EventHandler
-from app.tasks.models import Team, TaskUser
-from app.tasks.custom_exception import TeamNotFoundException
+from app.core.custom_types import ids, task_status
+from app.core.infrastructure.event import DomainEvent, EventHandler
+from app.tasks.deadlines import DeadlineScheduler
+from app.tasks.models import TaskCounter, Team, TaskUser
 
 
 class TeamCreatedHandler(EventHandler[team_event.TeamCreated]):
@@ -47,31 +50,23 @@ class TaskUserDeletedHandler(
     ...
 
 
-class MemberAddTeamHandler(EventHandler[team_event.MemberAddTeam]):
-    """Handler for MemblerAddTeam event."""
+def _counter(
+        team_id: int, executor_id: int | None, status: str, count: int
+) -> TaskCounter:
+    return TaskCounter(
+        team_id=ids.TeamId(team_id),
+        executor_id=ids.UserId(executor_id or 0),
+        status=task_status.TaskStatus(status),
+        count=count,
+    )
 
-    def __init__(
-            self,
-            uow: TaskHandlerUnitOfWork,
-    ):
-        self.uow = uow
-
-    async def handle(self, event: team_event.MemberAddTeam) -> None:
-        """Add member in Team."""
-        async with self.uow as uow:
-            team_model = await uow.repos.team.get_by_id(event.team_id)
-            if team_model is None:
-                raise TeamNotFoundException("Team not found")
-            team_model.add_member(
-                ids.UserId(event.user_id),
-                role.UserTaskRole(event.role)
-            )
-            await uow.repos.team.save(team_model)
-            await uow.commit()
 
+class TaskCountersHandler(EventHandler[DomainEvent]):
+    """Moves a task between counter buckets on create/update.
 
-class MemberRemoveTeamHandler(EventHandler[team_event.MemberRemoveTeam]):
-    """Handler for MemblerRemoveTeam event."""
+    An update takes the task out of its previous (executor, status)
+    bucket and puts it into the new one; deleted tasks are in none.
+    """
 
     def __init__(
             self,
@@ -79,41 +74,54 @@ class MemberRemoveTeamHandler(EventHandler[team_event.MemberRemoveTeam]):
     ):
         self.uow = uow
 
-    async def handle(self, event: team_event.MemberRemoveTeam) -> None:
-        """Remove member in Team."""
+    async def handle(self, event: DomainEvent) -> None:
+        await self.handle_many([event])
+
+    async def handle_many(self, events: Sequence[DomainEvent]) -> None:
+        """Apply the buckets' deltas of all events in one upsert."""
+        deltas: list[TaskCounter] = []
+        for event in events:
+            if isinstance(event, task_event.TaskCreated):
+                if not event.deleted:
+                    deltas.append(_counter(
+                        event.team_id, event.executor_id, event.status, 1
+                    ))
+            elif isinstance(event, task_event.TaskUpdated):
+                if not event.previous_deleted and event.previous_status:
+                    deltas.append(_counter(
+                        event.team_id,
+                        event.previous_executor_id,
+                        event.previous_status,
+                        -1,
+                    ))
+                if not event.deleted:
+                    deltas.append(_counter(
+                        event.team_id, event.executor_id, event.status, 1
+                    ))
+        if not deltas:
+            return
         async with self.uow as uow:
-            team_model = await uow.repos.team.get_by_id(event.team_id)
-            if team_model is None:
-
-                raise TeamNotFoundException("Team not found")
-            team_model.remove_member(
-                ids.UserId(event.user_id),
-                role.UserTaskRole(event.role)
-            )
-            await uow.repos.team.save(team_model)
+            await uow.repos.counter.add(deltas)
             await uow.commit()
 
 
-class MemberChangeRoleHandler(EventHandler[team_event.MemberChangeRole]):
-    """Handler for MemberChangeRoleHandler event."""
+class DeadlineTimerHandler(EventHandler[DomainEvent]):
+    """Keeps the deadline scheduler's timers in step with tasks."""
 
-    def __init__(
-            self,
-            uow: TaskHandlerUnitOfWork,
-    ):
-        self.uow = uow
+    def __init__(self, scheduler: DeadlineScheduler):
+        self.scheduler = scheduler
+
+    async def handle(self, event: DomainEvent) -> None:
+        if not isinstance(
+            event, (task_event.TaskCreated, task_event.TaskUpdated)
+        ):
+            return
+        if (
+            event.deleted
+            or event.status == task_status.TaskStatus.DONE.value
+            or event.deadline is None
+        ):
+            self.scheduler.cancel(event.task_id)
+        else:
+            self.scheduler.schedule(event.task_id, event.deadline)
 
-    async def handle(self, event: team_event.MemberChangeRole) -> None:
-        """Change role member in Team."""
-        async with self.uow as uow:
-            team_model = await uow.repos.team.get_by_id(event.team_id)
-            if team_model is None:
-
-                raise TeamNotFoundException("Team not found")
-            team_model.change_role(
-                user_id=ids.UserId(event.user_id),
-                old_role=role.UserTaskRole(event.old_role),
-                new_role=role.UserTaskRole(event.new_role)
-            )
-            await uow.repos.team.save(team_model)
-            await uow.commit()
@@ -0,0 +1,196 @@
+"""Streaming CSV import of tasks.
+
+The CSV is parsed record by record as bytes arrive, so neither the
+endpoint nor the CLI holds the file in memory. Columns are those of
+``CreateTaskCommand`` (``team_id``, ``title``, ``description``,
+``deadline``); others are ignored, and rows of an export whose
+``record`` is not ``task`` are skipped, so an export can be re-imported.
+Rows are validated and written by ``ImportTaskUseCase``::
+
+    python -m app.tasks.importer tasks.csv --actor-id 1
+    python -m app.tasks.importer tasks.csv --actor-id 1 --chunk-size 5000
+
+The database is taken from the application settings, as by the app.
+"""
+
+import argparse
+import asyncio
+import codecs
+import csv
+import sys
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, Iterator
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.infrastructure.event_bus import MemoryEventBus
+from app.core.register_handlers import register_event_handlers
+from app.deps.base import get_settings
+from app.tasks import dto, use_cases
+from app.tasks.unit_of_work import (
+    TaskRepositoryProvider,
+    TaskSQLAlchemyUnitOfWork,
+)
+
+
+READ_SIZE = 64 * 1024
+# Longest record kept in memory; a longer one is reported as malformed.
+MAX_RECORD_SIZE = 1024 * 1024
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str | None]:
+    """Decode a UTF-8 byte stream into lines, without their newline.
+
+    A line longer than ``MAX_RECORD_SIZE`` is dropped and yields None.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    skipping = False
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            yield line
+        if len(pending) > MAX_RECORD_SIZE:
+            if not skipping:
+                skipping = True
+                yield None
+            pending = ""
+    if not skipping:
+        yield pending + decoder.decode(b"", final=True)
+
+
+class _Records:
+    """Joins lines into CSV records and parses them into dicts.
+
+    A record ends at a newline outside quotes: with doubled quotes as
+    the only escape, that is where its quote count is even. A record
+    still open at ``MAX_RECORD_SIZE`` or at the end of the file most
+    likely starts with a stray quote: its first line is reported as
+    malformed and the lines after it are read again.
+    """
+
+    def __init__(self) -> None:
+        self.header: list[str] | None = None
+        self.record: list[str] = []
+        self.size = 0
+        self.quotes = 0
+
+    def push(self, line: str | None) -> Iterator[dict]:
+        queue: deque[str | None] = deque([line])
+        while queue:
+            line = queue.popleft()
+            if line is None:
+                if self.record:
+                    # The open record is reported before the long line.
+                    queue.appendleft(None)
+                    queue.extendleft(reversed(self._take()[1:]))
+                yield self._malformed()
+                continue
+            self.record.append(line)
+            self.size += len(line) + 1
+            self.quotes += line.count('"')
+            if self.size > MAX_RECORD_SIZE:
+                yield self._malformed()
+                queue.extendleft(reversed(self._take()[1:]))
+                continue
+            if self.quotes % 2:
+                continue
+            row = self._parse("\n".join(self._take()))
+            if row is not None:
+                yield row
+
+    def finish(self) -> Iterator[dict]:
+        while self.record:
+            yield self._malformed()
+            for line in self._take()[1:]:
+                yield from self.push(line)
+
+    def _take(self) -> list[str]:
+        record = self.record
+        self.record, self.size, self.quotes = [], 0, 0
+        return record
+
+    def _malformed(self) -> dict:
+        return {
+            use_cases.IMPORT_ROW_ERROR:
+                "Malformed record: unbalanced quote or longer than "
+                f"{MAX_RECORD_SIZE} characters"
+        }
+
+    def _parse(self, text: str) -> dict | None:
+        if not text.strip():
+            return None
+        values = next(csv.reader([text]))
+        if self.header is None:
+            self.header = [name.strip() for name in values]
+            return None
+        return dict(zip(self.header, values))
+
+
+async def csv_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[dict]:
+    """Yield the rows of a UTF-8 CSV as dicts keyed by its header.
+
+    Memory is bounded by ``MAX_RECORD_SIZE``; a record that does not
+    fit, or never closes its quotes, is yielded as a row holding only
+    ``IMPORT_ROW_ERROR``, so the import reports it and goes on.
+    """
+    records = _Records()
+    async for line in _lines(chunks):
+        for row in records.push(line):
+            yield row
+    for row in records.finish():
+        yield row
+
+
+async def _file_chunks(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as file:
+        while chunk := file.read(READ_SIZE):
+            yield chunk
+
+
+async def _main(args: argparse.Namespace) -> dto.TaskImportReportDTO:
+    settings = get_settings()
+    engine = create_async_engine(settings.database_dsn)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    bus = MemoryEventBus()
+    # Read models (counters, calendars, timers) follow TaskCreated.
+    await register_event_handlers(bus, session_factory)
+    try:
+        async with TaskSQLAlchemyUnitOfWork(
+            session_factory, bus, TaskRepositoryProvider
+        ) as uow:
+            return await use_cases.ImportTaskUseCase(uow).execute(
+                actor_user_id=args.actor_id,
+                rows=csv_rows(_file_chunks(args.path)),
+                chunk_size=args.chunk_size,
+            )
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Import tasks from a CSV file."
+    )
+    parser.add_argument("path")
+    parser.add_argument(
+        "--actor-id", type=int, required=True,
+        help="user creating the tasks; must manage every team",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=use_cases.IMPORT_CHUNK_SIZE
+    )
+    args = parser.parse_args(argv)
+    report = asyncio.run(_main(args))
+    for error in report.errors:
+        print(f"row {error.row}: {error.error}", file=sys.stderr)
+    print(f"imported {report.imported}, failed {report.failed}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,14 @@
+from collections.abc import Sequence
+
 from app.tasks.orm_models import (
     TaskUserOrm,
-    TaskMemberOrm,
     TaskTeamOrm,
     CommentOrm,
     TaskOrm
 )
 from app.core.custom_types import ids, role
+from app.membership.models import PROJECTED, RoleMask
+from app.membership.orm_models import MembershipOrm
 from app.tasks.models import (
     TaskUser,
     MemberTask,
@@ -32,46 +35,21 @@ class TaskUserMapper:
         orm.username = user.username
 
 
-class TaskMemberMapper:
-
-    @staticmethod
-    def to_domain(orm: TaskMemberOrm) -> MemberTask:
-        """ORM -> Domain"""
-        return MemberTask(
-            user_id=ids.UserId(orm.user_id),
-            team_id=ids.TeamId(orm.team_id),
-            role=role.UserTaskRole(orm.role)
-        )
-
-    @staticmethod
-    def to_orm(member: MemberTask) -> TaskMemberOrm:
-        """Domain -> ORM"""
-        return TaskMemberOrm(
-            user_id=member.user_id,
-            team_id=member.team_id,
-            role=member.role
-        )
-
-    @staticmethod
-    def update_orm(orm: TaskMemberOrm, member: MemberTask) -> None:
-        """Updating an existing ORM model"""
-        orm.user_id=member.user_id
-        orm.team_id=member.team_id
-        orm.role=member.role
-
-
 class TaskTeamMapper:
 
     @staticmethod
-    def to_domain(orm: TaskTeamOrm) -> Team:
-        """ORM -> Domain"""
+    def to_domain(
+            orm: TaskTeamOrm, memberships: Sequence[MembershipOrm]
+    ) -> Team:
+        """ORM + shared membership rows -> Domain"""
         members = [
             MemberTask(
-                user_id=ids.UserId(member.user_id),
-                team_id=member.team_id,
-                role=role.UserTaskRole(member.role)
+                user_id=ids.UserId(membership.user_id),
+                team_id=ids.TeamId(membership.team_id),
+                role=role.UserTaskRole(member_role)
             )
-            for member in orm.members
+            for membership in memberships
+            for member_role in (RoleMask(membership.roles) & PROJECTED).roles()
         ]
         return Team(
             id=ids.TeamId(orm.id),
@@ -80,36 +58,11 @@ class TaskTeamMapper:
 
     @staticmethod
     def to_orm(team: Team) -> TaskTeamOrm:
-        """Domain -> ORM"""
-        members_orm = [
-            TaskMemberOrm(
-                user_id=member.user_id,
-                team_id=member.team_id,
-                role=member.role
-            )
-            for member in team.members
-        ]
-
-        team_orm = TaskTeamOrm(
-            id=team.id,
-            members=members_orm
-        )
-
-        return team_orm
+        """Domain -> ORM
 
-
-    @staticmethod
-    def update_orm(team_orm: TaskTeamOrm, team: Team) -> None:
-        """Updating an existing ORM model"""
-
-        team_orm.members.clear()
-        for member in team.members:
-            member_model = TaskMemberOrm(
-                team_id=team_orm.id,
-                user_id=member.user_id,
-                role=member.role
-            )
-            team_orm.members.append(member_model)
+        Members live in the shared membership read model, not here.
+        """
+        return TaskTeamOrm(id=team.id)
 
 
 class TaskCommentMapper:
@@ -176,6 +129,23 @@ class TaskMapper:
             deleted=task.deleted,
         )
 
+    @staticmethod
+    def to_row(task: Task) -> dict:
+        """Domain -> column values, for bulk inserts and updates."""
+        row = {
+            "team_id": task.team_id,
+            "supervisor_id": task.supervisor_id,
+            "executor_id": task.executor_id,
+            "description": task.description,
+            "title": task.title,
+            "deadline": task.deadline,
+            "status": task.status,
+            "deleted": task.deleted,
+        }
+        if task.id is not None:
+            row["id"] = task.id
+        return row
+
     @staticmethod
     def update_orm(orm: TaskOrm, task: Task) -> None:
         """Updating an existing ORM model"""
@@ -1,6 +1,6 @@
 from typing import Unpack
 from datetime import datetime, timezone
-from app.core.custom_types import ids, role, task_status, task_patch
+from app.core.custom_types import deadline_kind, ids, role, task_status, task_patch
 from app.core.aggregate import AggregateRoot
 from app.core.entity import Entity
 from app.core.shared.models.users import BaseUser
@@ -12,10 +12,10 @@ from dataclasses import dataclass
 
 
 class TaskUser(BaseUser):
-    ...
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemberTask:
     """Represents a task member with an assigned role."""
     user_id: ids.UserId
@@ -23,8 +23,29 @@ class MemberTask:
     role: role.UserTaskRole
 
 
+@dataclass(frozen=True, slots=True)
+class TaskCounter:
+    """Number of live tasks of a team in one (executor, status) bucket.
+
+    ``executor_id`` 0 stands for tasks nobody executes yet.
+    """
+    team_id: ids.TeamId
+    executor_id: ids.UserId
+    status: task_status.TaskStatus
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class DeadlineTimer:
+    """A deadline event of one task, fired once per (kind, deadline)."""
+    task_id: ids.TaskId
+    kind: deadline_kind.DeadlineKind
+    deadline: datetime
+
+
 class Team(Entity):
     """Team for task's context."""
+    __slots__ = ("_id", "_members", "_index")
 
     def __init__(
             self, id: ids.TeamId,
@@ -33,6 +54,25 @@ class Team(Entity):
         """Create a team with a unique identifier."""
         self._id = id
         self._members = members
+        # user_id -> role -> member, kept in step with ``_members``.
+        self._index: dict[ids.UserId, dict[role.UserTaskRole, MemberTask]] = {}
+        for member in self._members:
+            self._index_add(member)
+
+    def _index_add(self, member: MemberTask) -> None:
+        self._index.setdefault(member.user_id, {})[member.role] = member
+
+    def _index_remove(self, member: MemberTask) -> None:
+        roles = self._index.get(member.user_id)
+        if roles is None or roles.get(member.role) != member:
+            return
+        del roles[member.role]
+        if not roles:
+            del self._index[member.user_id]
+
+    def _contains(self, member: MemberTask) -> bool:
+        roles = self._index.get(member.user_id)
+        return roles is not None and roles.get(member.role) == member
 
     @property
     def id(self) -> ids.TeamId:
@@ -43,11 +83,11 @@ class Team(Entity):
             self, user_id: ids.UserId, role: role.UserTaskRole
     ) -> MemberTask:
         """Return team member by user id or raise an error if not found."""
-        for member in self.members:
-            if member.user_id == user_id and member.role == role:
-                return member
-        raise custom_exception.TaskMemberNotFoundException(
-            "User is not a team member")
+        member = self._index.get(user_id, {}).get(role)
+        if member is None:
+            raise custom_exception.TaskMemberNotFoundException(
+                "User is not a team member")
+        return member
 
     def add_member(
             self, user_id: ids.UserId, role: role.UserTaskRole
@@ -57,8 +97,9 @@ class Team(Entity):
             raise custom_exception.TaskTeamIdMissingException(
                 "Cannot add member to a team without id")
         new_member = MemberTask(user_id, self._id, role)
-        if new_member not in self._members:
+        if not self._contains(new_member):
             self._members.append(new_member)
+            self._index_add(new_member)
             return new_member
 
     def remove_member(
@@ -67,6 +108,7 @@ class Team(Entity):
         """Remove member in team"""
         member = self.get_member(user_id, role)
         self._members.remove(member)
+        self._index_remove(member)
         return member
 
     @property
@@ -76,14 +118,11 @@ class Team(Entity):
 
     def is_member(self, user_id: ids.UserId) -> bool:
         """Check whether the given user is a team member."""
-        return any(
-            member.user_id == user_id
-            for member in self._members
-        )
+        return user_id in self._index
 
     def has_member(self, user_id: ids.UserId, role: role.UserTaskRole) -> bool:
             """Check whether the user is already a team member."""
-            return MemberTask(user_id, self.id, role) in self.members
+            return self._contains(MemberTask(user_id, self.id, role))
 
     def change_role(
         self,
@@ -96,21 +135,27 @@ class Team(Entity):
         old_member = MemberTask(user_id, self.id, old_role)
         new_member = MemberTask(user_id, self.id, new_role)
 
-        if old_member not in self._members:
+        if not self._contains(old_member):
             raise custom_exception.TaskMemberNotFoundException(
                 "User with this role not found"
             )
 
-        if new_member in self._members:
+        if self._contains(new_member):
             self._members.remove(old_member)
+            self._index_remove(old_member)
             return
 
         index = self._members.index(old_member)
         self._members[index] = new_member
+        self._index_remove(old_member)
+        self._index_add(new_member)
 
 
 class Comment(Entity):
     """A comment on a task with author and creation time."""
+    __slots__ = (
+        "_id", "_team_id", "_task_id", "_author_id", "_text", "_created_at"
+    )
 
     def __init__(
             self, author_id: ids.UserId,
@@ -169,6 +214,11 @@ class Task(Entity, AggregateRoot):
         _status: Current status of the task (default: OPEN).
         _comments: List of comments attached to the task.
     """
+    __slots__ = (
+        "_id", "_supervisor_id", "_team_id", "_title", "_description",
+        "_status", "_deadline", "_created_at", "_updated_at",
+        "_executor_id", "_deleted",
+    )
 
     def __init__(self,
                  supervisor_id: ids.UserId,
@@ -274,6 +324,8 @@ class Task(Entity, AggregateRoot):
                 description=self._description,
                 deadline=self._deadline,
                 deleted=self._deleted,
+                previous_status=self._status.value,
+                previous_deleted=self._deleted,
             )
         )
 
@@ -287,6 +339,8 @@ class Task(Entity, AggregateRoot):
             "deleted": "_deleted",
         }
 
+        previous_status = self._status
+        previous_deleted = self._deleted
         for arg_name, attr_name in allowed_fields.items():
             if arg_name in args:
                 setattr(self, attr_name, args[arg_name])
@@ -304,9 +358,41 @@ class Task(Entity, AggregateRoot):
                 description=self._description,
                 deadline=self._deadline,
                 deleted=self._deleted,
+                previous_status=previous_status.value,
+                previous_deleted=previous_deleted,
             )
         )
 
+    def reach_deadline(self, timer: DeadlineTimer) -> bool:
+        """Record the timer's deadline event if the timer still applies.
+
+        It does not once the task is done, deleted or its deadline moved.
+        """
+        if (
+            self._deleted
+            or self._status == task_status.TaskStatus.DONE
+            or self._deadline is None
+            or self._team_id is None
+        ):
+            return False
+        deadline = self._deadline
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+        if deadline != timer.deadline:
+            return False
+        if timer.kind == deadline_kind.DeadlineKind.OVERDUE:
+            event_cls = task_event.TaskOverdue
+        else:
+            event_cls = task_event.TaskDeadlineApproaching
+        self.record_event(event_cls(
+            task_id=int(self._id or 0),
+            team_id=int(self._team_id),
+            supervisor_id=int(self._supervisor_id),
+            executor_id=int(self._executor_id) if self._executor_id else None,
+            deadline=deadline,
+        ))
+        return True
+
     def mark_created_event(self) -> None:
         if self._id is None or self._team_id is None:
             return
@@ -4,11 +4,14 @@ from app.deps.base import get_settings
 from datetime import datetime
 
 from sqlalchemy.orm import (
-    relationship,
     Mapped,
     mapped_column
 )
 from sqlalchemy import (
+    DDL,
+    event,
+    Index,
+    text,
     String,
     Integer,
     ForeignKey,
@@ -38,20 +41,6 @@ class TaskUserOrm(Base, TimestampMixin):
     username: Mapped[str] = mapped_column(String, nullable=True)
 
 
-class TaskMemberOrm(Base, IdMixin):
-    __tablename__ = "tasks_member"
-    __table_args__ = TABLE_ARGS
-
-    user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(USER_FK), nullable=False
-    )
-    team_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(TEAM_FK)
-    )
-
-    role: Mapped[str] = mapped_column(String)
-
-
 class TaskTeamOrm(Base, TimestampMixin):
     __tablename__ = 'tasks_teams'
     __table_args__ = TABLE_ARGS
@@ -61,17 +50,18 @@ class TaskTeamOrm(Base, TimestampMixin):
         primary_key=True,
     )
 
-    members = relationship(
-        TaskMemberOrm,
-        foreign_keys="TaskMemberOrm.team_id",
-        lazy="selectin",
-        cascade="all, delete-orphan"
-    )
-
 
 class CommentOrm(Base, IdMixin, TimestampMixin):
     __tablename__ = 'tasks_comment'
-    __table_args__ = TABLE_ARGS
+    __table_args__ = (
+        # Comment pages of a task in (created_dttm, id) order.
+        Index(
+            "ix_tasks_comment_task_id_created_dttm",
+            "task_id",
+            "created_dttm",
+        ),
+        *(() if not TABLE_ARGS else (TABLE_ARGS,)),
+    )
 
     author_id: Mapped[int] = mapped_column(
         Integer,
@@ -89,9 +79,29 @@ class CommentOrm(Base, IdMixin, TimestampMixin):
     )
 
 
+# Tasks that still count towards "overdue": not done, not deleted.
+LIVE_UNFINISHED = text("NOT deleted AND status <> 'DONE'")
+
+
 class TaskOrm(Base, IdMixin, TimestampMixin):
     __tablename__ = "tasks"
-    __table_args__ = TABLE_ARGS
+    __table_args__ = (
+        Index(
+            "ix_tasks_team_id_deadline_unfinished",
+            "team_id",
+            "deadline",
+            postgresql_where=LIVE_UNFINISHED,
+            sqlite_where=LIVE_UNFINISHED,
+        ),
+        # Range scans of upcoming deadlines for the deadline scheduler.
+        Index(
+            "ix_tasks_deadline_unfinished",
+            "deadline",
+            postgresql_where=LIVE_UNFINISHED,
+            sqlite_where=LIVE_UNFINISHED,
+        ),
+        *(() if not TABLE_ARGS else (TABLE_ARGS,)),
+    )
 
     supervisor_id: Mapped[int] = mapped_column(
         Integer,
@@ -130,3 +140,107 @@ class TaskOrm(Base, IdMixin, TimestampMixin):
         nullable=False,
         default=False,
     )
+
+
+
+class TaskCounterOrm(Base):
+    """Read model: live (not deleted) tasks per team, executor and status.
+
+    Kept up to date by ``TaskCountersHandler``; ``executor_id`` 0 counts
+    unassigned tasks.
+    """
+    __tablename__ = "tasks_counters"
+    __table_args__ = TABLE_ARGS
+
+    team_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    executor_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[task_status.TaskStatus] = mapped_column(
+        Enum(task_status.TaskStatus, name="tasks_status"),
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class TaskDeadlineTimerOrm(Base):
+    """Deadline timers already fired; one row per (task, kind, deadline).
+
+    Inserting the row claims the timer, so with several workers only the
+    one whose insert succeeds publishes the event.
+    """
+    __tablename__ = "tasks_deadline_timers"
+    __table_args__ = TABLE_ARGS
+
+    task_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    kind: Mapped[str] = mapped_column(String(16), primary_key=True)
+    deadline: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+
+
+# Full-text search. PostgreSQL gets a generated ``search_vector`` column
+# with a GIN index on both tables (also created by migration c9f2d4a6b813);
+# SQLite (test mode) gets FTS5 external-content tables kept in step by
+# triggers. Either way the index follows every insert/update on its own,
+# so the repositories need no extra write. Queries live in
+# ``SQLAlchemyTaskRepository.search``.
+
+SEARCH_CONFIG = "simple"
+
+_SEARCH_DOCUMENTS = {
+    TaskOrm.__table__: (
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A')"
+        f" || setweight(to_tsvector('{SEARCH_CONFIG}',"
+        f" coalesce(description, '')), 'B')",
+        ("title", "description"),
+    ),
+    CommentOrm.__table__: (
+        f"to_tsvector('{SEARCH_CONFIG}', coalesce(text, ''))",
+        ("text",),
+    ),
+}
+
+
+def fts_table_name(table) -> str:
+    """SQLite FTS5 table indexing ``table``."""
+    return f"{table.name}_fts"
+
+
+def _sqlite_fts_ddl(table, columns: tuple[str, ...]) -> list[str]:
+    fts = fts_table_name(table)
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{name}" for name in columns)
+    old = ", ".join(f"old.{name}" for name in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new});"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        f"{names}, content='{table.name}', content_rowid='id')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table.name} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table.name} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {names} ON {table.name} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+for _table, (_document, _columns) in _SEARCH_DOCUMENTS.items():
+    event.listen(_table, "after_create", DDL(
+        "ALTER TABLE %(fullname)s ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({_document}) STORED"
+    ).execute_if(dialect="postgresql"))
+    event.listen(_table, "after_create", DDL(
+        "CREATE INDEX ix_%(table)s_search_vector "
+        "ON %(fullname)s USING GIN (search_vector)"
+    ).execute_if(dialect="postgresql"))
+    for _statement in _sqlite_fts_ddl(_table, _columns):
+        event.listen(
+            _table, "after_create",
+            DDL(_statement).execute_if(dialect="sqlite"),
+        )
+    event.listen(_table, "before_drop", DDL(
+        f"DROP TABLE IF EXISTS {fts_table_name(_table)}"
+    ).execute_if(dialect="sqlite"))
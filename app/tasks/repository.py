@@ -1,7 +1,26 @@
-from sqlalchemy import select
+import re
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterable, cast
+
+from sqlalchemy import (
+    column,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.engine import CursorResult
 
 from app.core.repositories.base import AbstractRepository
-from app.core.custom_types import ids
+from app.core.custom_types import ids, task_status
+from app.membership.models import PROJECTED
+from app.membership.orm_models import MembershipOrm
 from app.tasks import (
     models,
     orm_models,
@@ -9,6 +28,75 @@ from app.tasks import (
 )
 
 
+# Rows fetched per round trip when streaming exports.
+STREAM_BATCH_SIZE = 1000
+
+# A match in a comment counts for less than one in the task itself.
+COMMENT_RANK_WEIGHT = 0.5
+
+
+def search_terms(query: str) -> list[str]:
+    """Words of a search query; every one of them has to match."""
+    return re.findall(r"\w+", query.lower())
+
+
+def _postgres_hits(terms: list[str]):
+    """(task_id, rank) of tasks and comments matching every term."""
+    tsquery = func.plainto_tsquery(
+        literal_column(f"'{orm_models.SEARCH_CONFIG}'::regconfig"),
+        " ".join(terms),
+    )
+    task_vector = literal_column("tasks.search_vector")
+    comment_vector = literal_column("tasks_comment.search_vector")
+    return union_all(
+        select(
+            orm_models.TaskOrm.id.label("task_id"),
+            func.ts_rank(task_vector, tsquery).label("rank"),
+        ).where(task_vector.op("@@")(tsquery)),
+        select(
+            orm_models.CommentOrm.task_id,
+            func.ts_rank(comment_vector, tsquery) * COMMENT_RANK_WEIGHT,
+        ).where(comment_vector.op("@@")(tsquery)),
+    )
+
+
+def _sqlite_hits(terms: list[str]):
+    """(task_id, rank) from the FTS5 tables; bm25 is lower-is-better."""
+    match = " ".join(f'"{term}"' for term in terms)
+    tasks_fts = table(
+        orm_models.fts_table_name(orm_models.TaskOrm.__table__),
+        column("rowid"),
+    )
+    comments_fts = table(
+        orm_models.fts_table_name(orm_models.CommentOrm.__table__),
+        column("rowid"),
+    )
+    tasks_name = literal_column(tasks_fts.name)
+    comments_name = literal_column(comments_fts.name)
+    return union_all(
+        select(
+            tasks_fts.c.rowid.label("task_id"),
+            (-func.bm25(tasks_name, 2.0, 1.0)).label("rank"),
+        ).where(tasks_name.op("MATCH")(match)),
+        select(
+            orm_models.CommentOrm.task_id,
+            -func.bm25(comments_name) * COMMENT_RANK_WEIGHT,
+        )
+        .select_from(comments_fts)
+        .join(
+            orm_models.CommentOrm,
+            orm_models.CommentOrm.id == comments_fts.c.rowid,
+        )
+        .where(comments_name.op("MATCH")(match)),
+    )
+
+
+_SEARCH_HITS = {
+    "postgresql": _postgres_hits,
+    "sqlite": _sqlite_hits,
+}
+
+
 class SQLAlchemyTaskUserRepository(AbstractRepository[models.TaskUser]):
     """Implementing a user's repository"""
 
@@ -34,56 +122,13 @@ class SQLAlchemyTaskUserRepository(AbstractRepository[models.TaskUser]):
         mappers.TaskUserMapper.update_orm(orm, domain)
 
 
-class SQLAlchemyTaskMemberRepository(AbstractRepository[models.MemberTask]):
-    """Implementing a member's repository"""
-
-    async def get_by_user(
-        self, user_id: int
-    ) -> list[models.MemberTask]:
-
-        result = await self.session.execute(
-            select(orm_models.TaskMemberOrm)
-            .where(orm_models.TaskMemberOrm.user_id == user_id)
-        )
-        orms = result.scalars().all()
-        return [mappers.TaskMemberMapper.to_domain(orm) for orm in orms]
-
-
-    async def get_by_user_and_team(
-        self,
-        user_id: int,
-        team_id: int
-    ) -> list[models.MemberTask]:
-
-        result = await self.session.execute(
-            select(orm_models.TaskMemberOrm)
-            .where(
-                orm_models.TaskMemberOrm.user_id == user_id,
-                orm_models.TaskMemberOrm.team_id == team_id
-            )
-        )
-        orms = result.scalars().all()
-        return [mappers.TaskMemberMapper.to_domain(orm) for orm in orms]
-
-
-    async def save(self, domain: models.MemberTask) -> None:
-        result = await self.session.execute(
-            select(orm_models.TaskMemberOrm)
-            .where(
-                orm_models.TaskMemberOrm.user_id == domain.user_id,
-                orm_models.TaskMemberOrm.team_id == domain.team_id,
-                orm_models.TaskMemberOrm.role == domain.role
-            )
-        )
-        orm = result.scalar_one_or_none()
-        if orm is None:
-            self.session.add(mappers.TaskMemberMapper.to_orm(domain))
-            return
-        mappers.TaskMemberMapper.update_orm(orm, domain)
-
-
 class SQLAlchemyTeamRepository(AbstractRepository[models.Team]):
-    """Implementing a team's repository"""
+    """Implementing a team's repository
+
+    Members are read from the shared membership read model, which the
+    membership projection keeps up to date; ``save`` only registers the
+    team itself.
+    """
 
     async def get_by_id(self, id: int) -> models.Team | None:
         result = await self.session.execute(
@@ -93,31 +138,96 @@ class SQLAlchemyTeamRepository(AbstractRepository[models.Team]):
         orm_team = result.scalar_one_or_none()
         if orm_team is None:
             return
-        return mappers.TaskTeamMapper.to_domain(orm_team)
+        memberships = await self.session.execute(
+            select(MembershipOrm)
+            .where(MembershipOrm.team_id == id)
+            .order_by(MembershipOrm.user_id)
+        )
+        return mappers.TaskTeamMapper.to_domain(
+            orm_team, memberships.scalars().all()
+        )
 
     async def save(self, domain: models.Team) -> None:
         result = await self.session.execute(
-            select(orm_models.TaskTeamOrm)
+            select(orm_models.TaskTeamOrm.id)
             .where(orm_models.TaskTeamOrm.id == domain.id)
         )
-        orm_team = result.scalar_one_or_none()
-        if orm_team is None:
+        if result.scalar_one_or_none() is None:
             self.session.add(mappers.TaskTeamMapper.to_orm(domain))
-            return
-        mappers.TaskTeamMapper.update_orm(orm_team, domain)
-
 
 
 class SQLAlchemyTaskCommentRepository(AbstractRepository[models.Comment]):
     """Implementing a comment's repository"""
 
-    async def get_by_task_id(self, task_id: int) ->  list[models.Comment]:
+    async def get_page_by_task(
+        self,
+        task_id: int,
+        *,
+        limit: int,
+        after_id: int | None = None,
+        since: datetime | None = None,
+    ) -> list[models.Comment]:
+        """Comments of a task in ``(created_dttm, id)`` order.
+
+        The page starts after comment ``after_id`` of the same task and
+        only holds comments created after ``since``; both are range
+        conditions on the ``(task_id, created_dttm)`` index. An
+        ``after_id`` that is not a comment of the task gives no rows.
+        """
+        comment = orm_models.CommentOrm
+        query = select(comment).where(comment.task_id == task_id)
+        if after_id is not None:
+            after = (
+                select(comment.created_dttm)
+                .where(comment.id == after_id, comment.task_id == task_id)
+                .scalar_subquery()
+            )
+            query = query.where(
+                tuple_(comment.created_dttm, comment.id)
+                > tuple_(after, literal(after_id))
+            )
+        if since is not None:
+            if since.tzinfo is not None:
+                since = since.astimezone(timezone.utc)
+            query = query.where(comment.created_dttm > since)
         result = await self.session.execute(
-            select(orm_models.CommentOrm)
-            .where(orm_models.CommentOrm.task_id == task_id)
+            query.order_by(comment.created_dttm, comment.id).limit(limit)
         )
-        orms = result.scalars().all()
-        return [mappers.TaskCommentMapper.to_domain(orm) for orm in orms]
+        return [
+            mappers.TaskCommentMapper.to_domain(orm)
+            for orm in result.scalars()
+        ]
+
+    async def has_comment(self, task_id: int, comment_id: int) -> bool:
+        result = await self.session.execute(
+            select(orm_models.CommentOrm.id).where(
+                orm_models.CommentOrm.id == comment_id,
+                orm_models.CommentOrm.task_id == task_id,
+            )
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def stream_by_team(self, team_id: int) -> AsyncIterator[dict]:
+        """Comments on the team's tasks, read through a server-side cursor."""
+        comment = orm_models.CommentOrm
+        task = orm_models.TaskOrm
+        stmt = (
+            select(
+                comment.id,
+                comment.task_id,
+                task.team_id,
+                comment.author_id,
+                comment.text,
+                comment.created_dttm.label("created_at"),
+            )
+            .join(task, task.id == comment.task_id)
+            .where(task.team_id == team_id)
+            .order_by(comment.task_id, comment.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result.mappings():
+            yield dict(row)
 
     async def save(self, domain: models.Comment) -> None:
         result = await self.session.execute(
@@ -149,6 +259,16 @@ class SQLAlchemyTaskRepository(AbstractRepository[models.Task]):
         return mappers.TaskMapper.to_domain(task_orm)
 
 
+    async def get_by_ids(self, task_ids: Iterable[int]) -> list[models.Task]:
+        result = await self.session.execute(
+            select(orm_models.TaskOrm)
+            .where(orm_models.TaskOrm.id.in_(set(task_ids)))
+        )
+        return [
+            mappers.TaskMapper.to_domain(task)
+            for task in result.scalars().all()
+        ]
+
     async def get_by_supervisor(self, id: int) -> list[models.Task]:
         result = await self.session.execute(
             select(orm_models.TaskOrm)
@@ -190,3 +310,244 @@ class SQLAlchemyTaskRepository(AbstractRepository[models.Task]):
             return
         mappers.TaskMapper.update_orm(task_orm, domain)
         self.uow._seen.add(domain)
+
+    async def stream_by_team(self, team_id: int) -> AsyncIterator[dict]:
+        """The team's tasks as plain rows, read through a server-side
+        cursor ``STREAM_BATCH_SIZE`` rows at a time."""
+        task = orm_models.TaskOrm
+        stmt = (
+            select(
+                task.id,
+                task.team_id,
+                task.supervisor_id,
+                task.executor_id,
+                task.title,
+                task.description,
+                task.status,
+                task.deadline,
+                task.deleted,
+                task.created_dttm.label("created_at"),
+                task.updated_dttm.label("updated_at"),
+            )
+            .where(task.team_id == team_id)
+            .order_by(task.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result.mappings():
+            yield dict(row)
+
+    async def add_many(self, domains: list[models.Task]) -> None:
+        """Insert new tasks with one ``INSERT ... RETURNING id``."""
+        if not domains:
+            return
+        task = orm_models.TaskOrm
+        result = await self.session.execute(
+            insert(task).returning(task.id, sort_by_parameter_order=True),
+            [mappers.TaskMapper.to_row(domain) for domain in domains],
+        )
+        for domain, task_id in zip(domains, result.scalars().all()):
+            domain._id = ids.TaskId(task_id)
+            domain.mark_created_event()
+            self.uow._seen.add(domain)
+
+    async def update_many(self, domains: list[models.Task]) -> None:
+        """Write back loaded tasks with one executemany ``UPDATE``."""
+        if not domains:
+            return
+        await self.session.execute(
+            update(orm_models.TaskOrm),
+            [mappers.TaskMapper.to_row(domain) for domain in domains],
+        )
+        for domain in domains:
+            self.uow._seen.add(domain)
+
+    async def search(
+        self,
+        user_id: int,
+        query: str,
+        *,
+        team_id: int | None = None,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[list[tuple[models.Task, float]], int]:
+        """Tasks whose text or comments match ``query``, best first.
+
+        Only tasks the user may read are returned: tasks of teams where
+        they are a member or manager, and tasks they supervise or
+        execute. Deleted tasks are left out. ``total`` rides along as a
+        window count, as in the teams listing.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return [], 0
+        dialect = self.session.get_bind().dialect.name
+        hits = _SEARCH_HITS[dialect](terms).subquery()
+        ranked = (
+            select(hits.c.task_id, func.max(hits.c.rank).label("rank"))
+            .group_by(hits.c.task_id)
+            .subquery()
+        )
+        task = orm_models.TaskOrm
+        my_team_ids = select(MembershipOrm.team_id).where(
+            MembershipOrm.user_id == user_id,
+            MembershipOrm.roles.op("&")(int(PROJECTED)) != 0,
+        )
+        conditions = [
+            task.deleted.is_(False),
+            or_(
+                task.team_id.in_(my_team_ids),
+                task.supervisor_id == user_id,
+                task.executor_id == user_id,
+            ),
+        ]
+        if team_id is not None:
+            conditions.append(task.team_id == team_id)
+
+        result = await self.session.execute(
+            select(task, ranked.c.rank, func.count().over().label("total"))
+            .join(ranked, ranked.c.task_id == task.id)
+            .where(*conditions)
+            .order_by(ranked.c.rank.desc(), task.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = result.all()
+        if rows:
+            total = rows[0].total
+        else:
+            total = 0 if offset == 0 else await self.session.scalar(
+                select(func.count())
+                .select_from(task)
+                .join(ranked, ranked.c.task_id == task.id)
+                .where(*conditions)
+            ) or 0
+        return [
+            (mappers.TaskMapper.to_domain(row[0]), float(row.rank))
+            for row in rows
+        ], total
+
+    async def count_overdue(
+        self,
+        team_id: int,
+        *,
+        executor_id: int | None = None,
+        now: datetime,
+    ) -> int:
+        """Live, unfinished tasks of the team whose deadline has passed."""
+        task = orm_models.TaskOrm
+        stmt = (
+            select(func.count())
+            .select_from(task)
+            .where(
+                task.team_id == team_id,
+                task.deadline < now,
+                orm_models.LIVE_UNFINISHED,
+            )
+        )
+        if executor_id is not None:
+            stmt = stmt.where(task.executor_id == executor_id)
+        return await self.session.scalar(stmt) or 0
+
+
+    async def get_deadlines(
+        self, since: datetime, until: datetime
+    ) -> list[tuple[ids.TaskId, datetime]]:
+        """(id, deadline) of live, unfinished tasks due in (since, until]."""
+        task = orm_models.TaskOrm
+        result = await self.session.execute(
+            select(task.id, task.deadline)
+            .where(
+                task.deadline > since,
+                task.deadline <= until,
+                orm_models.LIVE_UNFINISHED,
+            )
+            .order_by(task.deadline)
+        )
+        return [
+            (ids.TaskId(task_id), deadline)
+            for task_id, deadline in result.all()
+        ]
+
+
+class SQLAlchemyTaskCounterRepository(AbstractRepository[models.TaskCounter]):
+    """Implementing the task counters read model"""
+
+    async def get_counts(
+        self, team_id: int, executor_id: int | None = None
+    ) -> dict[task_status.TaskStatus, int]:
+        """Live tasks per status, for the team or one of its executors."""
+        counter = orm_models.TaskCounterOrm
+        stmt = (
+            select(counter.status, func.sum(counter.count))
+            .where(counter.team_id == team_id)
+            .group_by(counter.status)
+        )
+        if executor_id is not None:
+            stmt = stmt.where(counter.executor_id == executor_id)
+        result = await self.session.execute(stmt)
+        counts = {status: 0 for status in task_status.TaskStatus}
+        for status, count in result.all():
+            counts[task_status.TaskStatus(status)] = int(count or 0)
+        return counts
+
+    async def add(self, deltas: Iterable[models.TaskCounter]) -> None:
+        """Add each delta's ``count`` to its bucket in one upsert."""
+        merged: dict[tuple[int, int, task_status.TaskStatus], int] = {}
+        for delta in deltas:
+            key = (delta.team_id, delta.executor_id, delta.status)
+            merged[key] = merged.get(key, 0) + delta.count
+        rows = [
+            {
+                "team_id": team_id,
+                "executor_id": executor_id,
+                "status": status,
+                "count": count,
+            }
+            for (team_id, executor_id, status), count in merged.items()
+            if count
+        ]
+        if not rows:
+            return
+        counter = orm_models.TaskCounterOrm
+        stmt = self._insert(counter).values(rows)
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=[
+                counter.team_id, counter.executor_id, counter.status
+            ],
+            set_={"count": counter.count + stmt.excluded.count},
+        ))
+
+    async def save(self, domain: models.TaskCounter) -> None:
+        counter = orm_models.TaskCounterOrm
+        stmt = self._insert(counter).values(
+            team_id=domain.team_id,
+            executor_id=domain.executor_id,
+            status=domain.status,
+            count=domain.count,
+        )
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=[
+                counter.team_id, counter.executor_id, counter.status
+            ],
+            set_={"count": stmt.excluded.count},
+        ))
+
+
+class SQLAlchemyTaskDeadlineTimerRepository(
+    AbstractRepository[models.DeadlineTimer]
+):
+    """Implementing the claims of fired deadline timers"""
+
+    async def claim(self, timer: models.DeadlineTimer) -> bool:
+        """Record the timer as fired; False if it already was."""
+        stmt = self._insert(orm_models.TaskDeadlineTimerOrm).values(
+            task_id=timer.task_id,
+            kind=timer.kind.value,
+            deadline=timer.deadline,
+        ).on_conflict_do_nothing()
+        result = cast(CursorResult, await self.session.execute(stmt))
+        return result.rowcount == 1
+
+    async def save(self, domain: models.DeadlineTimer) -> None:
+        await self.claim(domain)
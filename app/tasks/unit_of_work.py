@@ -6,13 +6,16 @@ from app.core.unit_of_work import (
 
 )
 from app.core.repositories.descriptor import LazyRepo
+from app.core.repositories.membership import MembershipProtocol
 from app.core.repositories.tasks import (
     TaskUserProtocol,
-    TaskMemberProtocol,
     TaskTeamProtocol,
     TaskCommentProtocol,
     TaskProtocol,
+    TaskCounterProtocol,
+    TaskDeadlineTimerProtocol,
 )
+from app.membership.repository import SQLAlchemyMembershipRepository
 from app.tasks import repository as repo
 
 
@@ -20,16 +23,20 @@ class TaskRepositoryProvider(AbstractSqlRepositoryProvider):
     """Task's interface for SQL repository providers."""
     if TYPE_CHECKING:
         user: TaskUserProtocol
-        member: TaskMemberProtocol
         team: TaskTeamProtocol
         comment: TaskCommentProtocol
         task: TaskProtocol
+        counter: TaskCounterProtocol
+        timer: TaskDeadlineTimerProtocol
+        membership: MembershipProtocol
     else:
         user = LazyRepo(repo.SQLAlchemyTaskUserRepository)
-        member = LazyRepo(repo.SQLAlchemyTaskMemberRepository)
         team = LazyRepo(repo.SQLAlchemyTeamRepository)
         comment = LazyRepo(repo.SQLAlchemyTaskCommentRepository)
         task = LazyRepo(repo.SQLAlchemyTaskRepository)
+        counter = LazyRepo(repo.SQLAlchemyTaskCounterRepository)
+        timer = LazyRepo(repo.SQLAlchemyTaskDeadlineTimerRepository)
+        membership = LazyRepo(SQLAlchemyMembershipRepository)
 
 
 class TaskSQLAlchemyUnitOfWork(SQLAlchemyUnitOfWork[TaskRepositoryProvider]):
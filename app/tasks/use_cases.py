@@ -1,9 +1,15 @@
+from datetime import datetime, timezone
+from typing import AsyncIterable, AsyncIterator
+
 from fastapi import HTTPException
+from pydantic import ValidationError
 
 from app.core.custom_types import ids, task_patch, task_status
-from app.core.uow.tasks import TaskUnitOfWork
-from app.tasks import custom_exception, dto, management
-from app.tasks.models import Task
+from app.core.infrastructure.tracing import traced
+from app.core.uow.tasks import TaskHandlerUnitOfWork, TaskUnitOfWork
+from app.membership.models import PROJECTED
+from app.tasks import custom_exception, dto, export, management
+from app.tasks.models import Task, Team
 
 
 def map_task_exception(exc: Exception) -> HTTPException:
@@ -45,10 +51,26 @@ def _to_task_dto(task: Task) -> dto.TaskReadDTO:
     )
 
 
+def _update_payload(
+        command: dto.UpdateTaskCommand | dto.BulkUpdateTaskItem
+) -> task_patch.TaskUpdateArgs:
+    update_payload: task_patch.TaskUpdateArgs = {}
+    if command.title is not None:
+        update_payload["title"] = command.title
+    if command.description is not None:
+        update_payload["description"] = command.description
+    if command.status is not None:
+        update_payload["status"] = task_status.TaskStatus(command.status)
+    if command.deleted is not None:
+        update_payload["deleted"] = command.deleted
+    return update_payload
+
+
 class CreateTaskUseCase:
     def __init__(self, uow: TaskUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, command: dto.CreateTaskCommand) -> dto.TaskReadDTO:
         if command.actor_user_id is None:
             raise ValueError("actor_user_id is required")
@@ -67,20 +89,151 @@ class CreateTaskUseCase:
         return _to_task_dto(task)
 
 
+class BulkCreateTaskUseCase:
+    def __init__(self, uow: TaskUnitOfWork):
+        self.uow = uow
+
+    @traced
+    async def execute(
+        self, command: dto.BulkCreateTasksCommand
+    ) -> dto.TaskBulkDTO:
+        if command.actor_user_id is None:
+            raise ValueError("actor_user_id is required")
+        actor_id = ids.UserId(command.actor_user_id)
+        teams: dict[int, Team] = {}
+        tasks: list[Task] = []
+        for item in command.tasks:
+            team = teams.get(item.team_id)
+            if team is None:
+                team = await self.uow.repos.team.get_by_id(item.team_id)
+                if team is None:
+                    raise HTTPException(404, f"Team {item.team_id} not found")
+                teams[item.team_id] = team
+            tasks.append(management.create_task(
+                actor_id, team, item.deadline, item.title, item.description
+            ))
+        await self.uow.repos.task.add_many(tasks)
+        await self.uow.commit()
+        return dto.TaskBulkDTO(items=[_to_task_dto(task) for task in tasks])
+
+
+# Tasks written and committed together by an import.
+IMPORT_CHUNK_SIZE = 1_000
+# Rejected rows listed in an import report; the rest are only counted.
+IMPORT_MAX_ERRORS = 1_000
+_IMPORT_FIELDS = ("team_id", "title", "description", "deadline")
+# Key of a row the reader could not parse; its value is the reason.
+IMPORT_ROW_ERROR = "_error"
+
+
+def _import_command(row: dict) -> dto.CreateTaskCommand:
+    if IMPORT_ROW_ERROR in row:
+        raise ValueError(row[IMPORT_ROW_ERROR])
+    command = dto.CreateTaskCommand.model_validate(
+        {field: row.get(field) for field in _IMPORT_FIELDS}
+    )
+    if command.deadline.tzinfo is None:
+        raise ValueError("deadline must include a UTC offset")
+    return command
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+class ImportTaskUseCase:
+    def __init__(self, uow: TaskUnitOfWork):
+        self.uow = uow
+
+    @traced
+    async def execute(
+        self,
+        *,
+        actor_user_id: int,
+        rows: AsyncIterable[dict],
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> dto.TaskImportReportDTO:
+        """Create a task per valid row, committing every ``chunk_size``.
+
+        Invalid rows are reported and skipped; chunks committed before a
+        failure stay. Each commit publishes its chunk's ``TaskCreated``
+        events as one batch.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        actor_id = ids.UserId(actor_user_id)
+        teams: dict[int, Team | None] = {}
+        chunk: list[Task] = []
+        imported = failed = 0
+        errors: list[dto.TaskImportErrorDTO] = []
+        number = 0
+        async for row in rows:
+            number += 1
+            if row.get("record") not in (None, "", "task"):
+                continue
+            try:
+                command = _import_command(row)
+                if command.team_id not in teams:
+                    teams[command.team_id] = (
+                        await self.uow.repos.team.get_by_id(command.team_id)
+                    )
+                team = teams[command.team_id]
+                if team is None:
+                    raise custom_exception.TeamNotFoundException(
+                        f"Team {command.team_id} not found"
+                    )
+                chunk.append(management.create_task(
+                    actor_id, team, command.deadline,
+                    command.title, command.description,
+                ))
+            except ValidationError as exc:
+                error = _validation_message(exc)
+            except (
+                ValueError,
+                custom_exception.TaskDeadlineException,
+                custom_exception.TaskSupervisorException,
+                custom_exception.TeamNotFoundException,
+            ) as exc:
+                error = str(exc)
+            else:
+                if len(chunk) >= chunk_size:
+                    await self._write(chunk)
+                    imported += len(chunk)
+                    chunk = []
+                continue
+            failed += 1
+            if len(errors) < IMPORT_MAX_ERRORS:
+                errors.append(dto.TaskImportErrorDTO(row=number, error=error))
+        if chunk:
+            await self._write(chunk)
+            imported += len(chunk)
+        return dto.TaskImportReportDTO(
+            imported=imported, failed=failed, errors=errors
+        )
+
+    async def _write(self, chunk: list[Task]) -> None:
+        await self.uow.repos.task.add_many(chunk)
+        await self.uow.commit()
+
+
 class ReadTaskUseCase:
     def __init__(self, uow: TaskUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, task_id: int, actor_user_id: int) -> dto.TaskReadDTO:
         task = await self.uow.repos.task.get_by_id(task_id)
         if task is None:
             raise HTTPException(404, "Task not found")
         if task.team_id is None:
             raise HTTPException(400, "Task without team is not supported")
-        user_memberships = await self.uow.repos.member.get_by_user_and_team(
-            actor_user_id, task.team_id
+        roles = await self.uow.repos.membership.get_roles(
+            task.team_id, actor_user_id
         )
-        if not user_memberships and task.supervisor_id != actor_user_id and task.executor_id != actor_user_id:
+        if not roles & PROJECTED and task.supervisor_id != actor_user_id and task.executor_id != actor_user_id:
             raise HTTPException(403, "No access to task")
         return _to_task_dto(task)
 
@@ -89,6 +242,7 @@ class ListTaskUseCase:
     def __init__(self, uow: TaskUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
         self,
         *,
@@ -101,10 +255,10 @@ class ListTaskUseCase:
         if assigned_only:
             tasks = await self.uow.repos.task.get_by_executor(actor_user_id)
         elif team_id is not None:
-            user_memberships = await self.uow.repos.member.get_by_user_and_team(
-                actor_user_id, team_id
+            roles = await self.uow.repos.membership.get_roles(
+                team_id, actor_user_id
             )
-            if not user_memberships:
+            if not roles & PROJECTED:
                 raise HTTPException(403, "No access to team tasks")
             tasks = await self.uow.repos.task.get_by_team(team_id)
         else:
@@ -125,10 +279,101 @@ class ListTaskUseCase:
         )
 
 
+class SearchTaskUseCase:
+    def __init__(self, uow: TaskUnitOfWork):
+        self.uow = uow
+
+    @traced
+    async def execute(
+        self,
+        *,
+        actor_user_id: int,
+        query: str,
+        team_id: int | None,
+        limit: int,
+        offset: int,
+    ) -> dto.TaskSearchDTO:
+        # The repository's access filter applies with or without team_id.
+        hits, total = await self.uow.repos.task.search(
+            actor_user_id, query, team_id=team_id, limit=limit, offset=offset
+        )
+        return dto.TaskSearchDTO(
+            items=[
+                dto.TaskSearchHitDTO(
+                    **_to_task_dto(task).model_dump(), rank=rank
+                )
+                for task, rank in hits
+            ],
+            total=total,
+            limit=limit,
+            offset=offset,
+        )
+
+
+class TaskStatsUseCase:
+    def __init__(self, uow: TaskUnitOfWork):
+        self.uow = uow
+
+    @traced
+    async def execute(
+        self,
+        *,
+        actor_user_id: int,
+        team_id: int,
+        executor_id: int | None,
+    ) -> dto.TaskStatsDTO:
+        roles = await self.uow.repos.membership.get_roles(
+            team_id, actor_user_id
+        )
+        if not roles & PROJECTED:
+            raise HTTPException(403, "No access to team tasks")
+        counts = await self.uow.repos.counter.get_counts(team_id, executor_id)
+        overdue = await self.uow.repos.task.count_overdue(
+            team_id, executor_id=executor_id, now=datetime.now(timezone.utc)
+        )
+        return dto.TaskStatsDTO(
+            team_id=team_id,
+            executor_id=executor_id,
+            open=counts[task_status.TaskStatus.OPEN],
+            in_progress=counts[task_status.TaskStatus.IN_PROGRESS],
+            done=counts[task_status.TaskStatus.DONE],
+            overdue=overdue,
+            total=sum(counts.values()),
+        )
+
+
+class ExportTaskUseCase:
+    def __init__(self, uow: TaskUnitOfWork):
+        self.uow = uow
+
+    @traced
+    async def execute(
+        self,
+        *,
+        actor_user_id: int,
+        team_id: int,
+        export_format: str,
+        export_uow: TaskHandlerUnitOfWork,
+    ) -> AsyncIterator[str]:
+        """Check access now; rows are read by ``export_uow`` while the
+        returned chunks are consumed."""
+        if export_format not in export.MEDIA_TYPES:
+            raise ValueError(f"Unknown export format: {export_format}")
+        roles = await self.uow.repos.membership.get_roles(
+            team_id, actor_user_id
+        )
+        if not roles & PROJECTED:
+            raise HTTPException(403, "No access to team tasks")
+        return export.encode(
+            export.export_records(export_uow, team_id), export_format
+        )
+
+
 class AssignExecutorUseCase:
     def __init__(self, uow: TaskUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, command: dto.AssignExecutorCommand) -> dto.TaskReadDTO:
         if command.actor_user_id is None:
             raise ValueError("actor_user_id is required")
@@ -153,6 +398,7 @@ class UpdateTaskUseCase:
     def __init__(self, uow: TaskUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, command: dto.UpdateTaskCommand) -> dto.TaskReadDTO:
         if command.task_id is None:
             raise ValueError("task_id is required")
@@ -162,25 +408,48 @@ class UpdateTaskUseCase:
         if task is None:
             raise HTTPException(404, "Task not found")
         action = management.ActionUpdateTask(task, ids.UserId(command.actor_user_id))
-        update_payload: task_patch.TaskUpdateArgs = {}
-        if command.title is not None:
-            update_payload["title"] = command.title
-        if command.description is not None:
-            update_payload["description"] = command.description
-        if command.status is not None:
-            update_payload["status"] = task_status.TaskStatus(command.status)
-        if command.deleted is not None:
-            update_payload["deleted"] = command.deleted
-        action.execute(**update_payload)
+        action.execute(**_update_payload(command))
         await self.uow.repos.task.save(task)
         await self.uow.commit()
         return _to_task_dto(task)
 
 
+class BulkUpdateTaskUseCase:
+    def __init__(self, uow: TaskUnitOfWork):
+        self.uow = uow
+
+    @traced
+    async def execute(
+        self, command: dto.BulkUpdateTasksCommand
+    ) -> dto.TaskBulkDTO:
+        if command.actor_user_id is None:
+            raise ValueError("actor_user_id is required")
+        actor_id = ids.UserId(command.actor_user_id)
+        loaded = await self.uow.repos.task.get_by_ids(
+            item.task_id for item in command.tasks
+        )
+        tasks = {task.id: task for task in loaded}
+        # Request order, each task once even if listed several times.
+        updated: dict[int, Task] = {}
+        for item in command.tasks:
+            task = tasks.get(ids.TaskId(item.task_id))
+            if task is None:
+                raise HTTPException(404, f"Task {item.task_id} not found")
+            action = management.ActionUpdateTask(task, actor_id)
+            action.execute(**_update_payload(item))
+            updated[item.task_id] = task
+        await self.uow.repos.task.update_many(list(updated.values()))
+        await self.uow.commit()
+        return dto.TaskBulkDTO(
+            items=[_to_task_dto(task) for task in updated.values()]
+        )
+
+
 class AddCommentUseCase:
     def __init__(self, uow: TaskUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, command: dto.AddCommentCommand) -> dto.CommentReadDTO:
         if command.task_id is None:
             raise ValueError("task_id is required")
@@ -217,26 +486,48 @@ class ListCommentUseCase:
     def __init__(self, uow: TaskUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
-        self, task_id: int, actor_user_id: int
-    ) -> list[dto.CommentReadDTO]:
+        self,
+        task_id: int,
+        actor_user_id: int,
+        *,
+        limit: int,
+        cursor: int | None = None,
+        since: datetime | None = None,
+    ) -> dto.CommentPageDTO:
         task = await self.uow.repos.task.get_by_id(task_id)
         if task is None:
             raise HTTPException(404, "Task not found")
         if task.team_id is not None:
-            memberships = await self.uow.repos.member.get_by_user_and_team(
-                actor_user_id, task.team_id
+            roles = await self.uow.repos.membership.get_roles(
+                task.team_id, actor_user_id
             )
-            if not memberships and task.supervisor_id != actor_user_id and task.executor_id != actor_user_id:
+            if not roles & PROJECTED and task.supervisor_id != actor_user_id and task.executor_id != actor_user_id:
                 raise HTTPException(403, "No access to comments")
-        comments = await self.uow.repos.comment.get_by_task_id(task_id)
-        return [
-            dto.CommentReadDTO(
-                id=comment.id or 0,
-                task_id=comment.task_id,
-                author_id=comment.author_id,
-                text=comment.text,
-                created_at=comment.created_at,
-            )
-            for comment in comments
-        ]
+        # One extra row tells whether another page follows.
+        comments = await self.uow.repos.comment.get_page_by_task(
+            task_id, limit=limit + 1, after_id=cursor, since=since
+        )
+        # An empty page may also mean the cursor is not a comment of
+        # this task; only then is it worth the extra lookup.
+        if (
+            cursor is not None
+            and not comments
+            and not await self.uow.repos.comment.has_comment(task_id, cursor)
+        ):
+            raise HTTPException(400, "Unknown comment cursor")
+        next_cursor = comments[limit - 1].id if len(comments) > limit else None
+        return dto.CommentPageDTO(
+            items=[
+                dto.CommentReadDTO(
+                    id=comment.id or 0,
+                    task_id=comment.task_id,
+                    author_id=comment.author_id,
+                    text=comment.text,
+                    created_at=comment.created_at,
+                )
+                for comment in comments[:limit]
+            ],
+            next_cursor=next_cursor,
+        )
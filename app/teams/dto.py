@@ -35,6 +35,23 @@ class AddMemberCommand(BaseModel):
     role: str = Field(..., description="member|manager|admin")
 
 
+class MemberOperation(BaseModel):
+    """One (user, role) entry of a bulk member command."""
+
+    model_config = ConfigDict(frozen=True)
+    target_user_id: int = Field(..., gt=0)
+    role: str = Field(..., description="member|manager|admin")
+
+
+class BulkAddMembersCommand(BaseModel):
+    """Command to add many members to a team at once."""
+
+    model_config = ConfigDict(frozen=True)
+    team_id: int | None = Field(default=None, gt=0)
+    actor_user_id: int | None = Field(default=None, gt=0)
+    members: list[MemberOperation] = Field(..., min_length=1, max_length=1000)
+
+
 class RemoveMemberCommand(BaseModel):
     model_config = ConfigDict(frozen=True)
     team_id: int = Field(..., gt=0)
@@ -61,6 +78,15 @@ class MemberReadDTO(BaseModel):
     joined_at: datetime | None = None
 
 
+class BulkAddMembersResult(BaseModel):
+    """Members added by a bulk command; ``skipped`` were already there."""
+
+    model_config = ConfigDict(frozen=True)
+    team_id: int
+    added: list[MemberReadDTO]
+    skipped: list[MemberOperation] = Field(default_factory=list)
+
+
 class TeamReadResponsDTO(BaseModel):
     model_config = ConfigDict(frozen=True, from_attributes=True)
 
@@ -68,14 +94,37 @@ class TeamReadResponsDTO(BaseModel):
     team_id: int
 
 
+class TeamMemberItemDTO(BaseModel):
+    """One row of a team's member listing."""
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    user_id: int
+    username: str | None = None
+    role: str
+
+
+class TeamMemberPageDTO(BaseModel):
+    """Page of team members; pass ``next_cursor`` back as ``cursor``."""
+    model_config = ConfigDict(frozen=True)
+
+    items: list[TeamMemberItemDTO]
+    next_cursor: int | None = None
+
+
 class TeamReadDTO(BaseModel):
-    """DTO for reading team data."""
+    """DTO for reading team data.
+
+    ``GET /teams/{id}`` fills only ``members_count``; the members
+    themselves are paged through ``GET /teams/{id}/members``.
+    """
     model_config = ConfigDict(frozen=True, from_attributes=True)
 
     id: int
     name: str
     members: list[MemberReadDTO] = Field(default_factory=list)
     members_count: int = 0
+    roles: list[str] = Field(default_factory=list)
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -87,6 +136,8 @@ class TeamListDTO(BaseModel):
     model_config = ConfigDict(frozen=True)
     items: list[TeamReadDTO]
     total: int
+    limit: int | None = None
+    offset: int = 0
 
 
 class TeamCapabilitiesDTO(BaseModel):
@@ -1,5 +1,10 @@
 from typing import Type
 
+from app.core.infrastructure.cache import TTLCache
+from app.core.infrastructure.event import DomainEvent, EventHandler
+from app.core.shared.events import identity as user_event
+from app.core.shared.events import teams as team_event
+from app.teams.dto import TeamCapabilitiesDTO
 from app.teams.models import User
 from app.core.uow.teams import TeamHandlerUnitOfWork
 from app.core.shared.handlers.users import (
@@ -26,3 +31,25 @@ class TeamUserDeletedHandler(
 ):
     ...
 
+
+
+CapabilityCache = TTLCache[tuple[int, int], TeamCapabilitiesDTO]
+
+
+class CapabilityCacheInvalidationHandler(EventHandler[DomainEvent]):
+    """Drops cached capabilities on membership changes and user removal."""
+
+    def __init__(self, cache: CapabilityCache):
+        self.cache = cache
+
+    async def handle(self, event: DomainEvent) -> None:
+        """Invalidate the (team, user) entry, or all of a deleted user."""
+        if isinstance(event, team_event.MembersAddTeam):
+            for user_id, _ in event.members:
+                self.cache.invalidate((event.team_id, user_id))
+            return
+        user_id = getattr(event, "user_id")
+        if isinstance(event, user_event.UserDeleted):
+            self.cache.invalidate_where(lambda key: key[1] == user_id)
+            return
+        self.cache.invalidate((getattr(event, "team_id"), user_id))
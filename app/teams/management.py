@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 from app.teams.models import Member, Team
 from app.teams import custom_exception
@@ -72,6 +73,12 @@ class ActionAddMemberTeam(TeamManagement):
             user_id, role
         )
 
+    def execute_many(
+            self, members: Iterable[tuple[ids.UserId, role.UserRole]]
+    ) -> list[Member]:
+        """Add several members under the single admin check."""
+        return self._team.add_members(members)
+
 
 class ActionRemoveMemberTeam(TeamManagement):
     """Remove an existing member from the team."""
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Iterable
 from app.core.custom_types import ids, role
 from app.core.shared.models.users import BaseUser
 from app.core.entity import Entity
@@ -10,10 +11,10 @@ from app.core.shared.events import teams as team_event
 
 class User(BaseUser):
     """User teams domain."""
-    ...
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Member:
     """Represents a team member with an assigned role."""
     user_id: ids.UserId
@@ -23,6 +24,7 @@ class Member:
 
 class Team(Entity, AggregateRoot):
     """Team aggregate root."""
+    __slots__ = ("_id", "_members", "_name", "__user_create_id", "_index")
 
     def __init__(
             self, id: ids.TeamId | None = None,
@@ -35,6 +37,26 @@ class Team(Entity, AggregateRoot):
         self._members = members if members is not None else []
         self._name = name
         self.__user_create_id: ids.UserId | None = None
+        # user_id -> role -> member; kept in step with ``_members`` so
+        # permission checks do not scan the member list.
+        self._index: dict[ids.UserId, dict[role.UserRole, Member]] = {}
+        for member in self._members:
+            self._index_add(member)
+
+    def _index_add(self, member: Member) -> None:
+        self._index.setdefault(member.user_id, {})[member.role] = member
+
+    def _index_remove(self, member: Member) -> None:
+        roles = self._index.get(member.user_id)
+        if roles is None or roles.get(member.role) != member:
+            return
+        del roles[member.role]
+        if not roles:
+            del self._index[member.user_id]
+
+    def _contains(self, member: Member) -> bool:
+        roles = self._index.get(member.user_id)
+        return roles is not None and roles.get(member.role) == member
 
     @property
     def user_create_id(self) -> ids.UserId | None:
@@ -56,25 +78,19 @@ class Team(Entity, AggregateRoot):
 
     def get_member(self, user_id: ids.UserId, role: role.UserRole) -> Member:
         """Return team member by user id or raise an error if not found."""
-        for member in self.members:
-            if member.user_id == user_id and member.role == role:
-                return member
-        raise custom_exception.MemberNotFoundException(
-            "User is not a team member")
+        member = self._index.get(user_id, {}).get(role)
+        if member is None:
+            raise custom_exception.MemberNotFoundException(
+                "User is not a team member")
+        return member
 
     def is_admin(self, user_id: ids.UserId) -> bool:
         """Check whether the given user is a team admin."""
-        return any(
-            member.user_id == user_id and member.role == role.UserRole.ADMIN
-            for member in self._members
-        )
+        return role.UserRole.ADMIN in self._index.get(user_id, ())
 
     def is_member(self, user_id: ids.UserId) -> bool:
         """Check whether the given user is a team member."""
-        return any(
-            member.user_id == user_id
-            for member in self._members
-        )
+        return user_id in self._index
 
     def add_member(
             self, user_id: ids.UserId, role_member: role.UserRole
@@ -84,24 +100,66 @@ class Team(Entity, AggregateRoot):
             raise custom_exception.TeamIdMissingException(
                 "Cannot add member to a team without id")
         new_member = Member(user_id, self._id, role_member)
-        if new_member not in self._members:
+        if not self._contains(new_member):
             self._members.append(new_member)
+            self._index_add(new_member)
             if role_member != role.UserRole.ADMIN:
                 event = team_event.MemberAddTeam(
                     team_id=self.id,
                     user_id=new_member.user_id,
                     role=new_member.role
                 )
-                self.record_event(event)
+            else:
+                event = team_event.AdminAddTeam(
+                    team_id=self.id,
+                    user_id=new_member.user_id,
+                )
+            self.record_event(event)
 
             return new_member
 
+    def add_members(
+            self, members: Iterable[tuple[ids.UserId, role.UserRole]]
+    ) -> list[Member]:
+        """Add several members, recording one batched event.
+
+        Entries the team already has are skipped; admins get their own
+        ``AdminAddTeam`` events as in ``add_member``.
+        """
+        if self.id is None:
+            raise custom_exception.TeamIdMissingException(
+                "Cannot add member to a team without id")
+        added: list[Member] = []
+        for user_id, role_member in members:
+            new_member = Member(user_id, self._id, role_member)
+            if self._contains(new_member):
+                continue
+            self._members.append(new_member)
+            self._index_add(new_member)
+            added.append(new_member)
+        projected = tuple(
+            (int(member.user_id), member.role.value)
+            for member in added
+            if member.role != role.UserRole.ADMIN
+        )
+        if projected:
+            self.record_event(
+                team_event.MembersAddTeam(team_id=self.id, members=projected)
+            )
+        for member in added:
+            if member.role == role.UserRole.ADMIN:
+                self.record_event(team_event.AdminAddTeam(
+                    team_id=self.id, user_id=member.user_id
+                ))
+        return added
+
     def remove_member(
             self, user_id: ids.UserId, role_member: role.UserRole
     ) -> Member:
         """Remove member in team"""
         member = self.get_member(user_id, role_member)
         self._members.remove(member)
+        self._index_remove(member)
         if member.team_id is not None and role_member != role.UserRole.ADMIN:
             event = team_event.MemberRemoveTeam(
                 team_id=member.team_id,
@@ -109,12 +167,17 @@ class Team(Entity, AggregateRoot):
                 role=member.role
             )
             self.record_event(event)
+        elif member.team_id is not None:
+            self.record_event(team_event.AdminRemoveTeam(
+                team_id=member.team_id,
+                user_id=member.user_id,
+            ))
 
         return member
 
     def has_member(self, user_id: ids.UserId, role: role.UserRole) -> bool:
             """Check whether the user is already a team member."""
-            return Member(user_id, self.id, role) in self.members
+            return self._contains(Member(user_id, self.id, role))
 
     def change_role(
         self,
@@ -135,7 +198,7 @@ class Team(Entity, AggregateRoot):
 
 
     def _validate_role_change(self, old_member: Member) -> None:
-        if old_member not in self._members:
+        if not self._contains(old_member):
             raise custom_exception.MemberNotFoundException(
                 "User with this role not found"
             )
@@ -145,12 +208,15 @@ class Team(Entity, AggregateRoot):
     ) -> None:
         """Replace old member entry with new one,
         or just remove if duplicate exists."""
-        if new_member in self._members:
+        if self._contains(new_member):
             self._members.remove(old_member)
+            self._index_remove(old_member)
             return
 
         index = self._members.index(old_member)
         self._members[index] = new_member
+        self._index_remove(old_member)
+        self._index_add(new_member)
 
     def _record_role_change_event(
             self, old_member: Member, new_member: Member
@@ -160,6 +226,16 @@ class Team(Entity, AggregateRoot):
 
         event = self._build_role_change_event(old_member, new_member)
         self.record_event(event)
+        # Other contexts only see the non-admin side of the change; the
+        # membership read model also tracks the admin bit.
+        if new_member.role == role.UserRole.ADMIN:
+            self.record_event(team_event.AdminAddTeam(
+                team_id=new_member.team_id, user_id=new_member.user_id
+            ))
+        elif old_member.role == role.UserRole.ADMIN:
+            self.record_event(team_event.AdminRemoveTeam(
+                team_id=new_member.team_id, user_id=new_member.user_id
+            ))
 
     def _build_role_change_event(
         self,
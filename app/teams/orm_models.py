@@ -6,7 +6,7 @@ from sqlalchemy.orm import (
     Mapped,
     mapped_column,
 )
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey, Index
 
 
 settings = get_settings()
@@ -31,7 +31,14 @@ class TeamUserOrm(Base, TimestampMixin):
 
 class MemberOrm(Base, IdMixin):
     __tablename__ = 'teams_members'
-    __table_args__ = TABLE_ARGS
+    __table_args__ = (
+        # Keyset pages of a team's members and role-filtered listings.
+        Index("ix_teams_members_team_id_id", "team_id", "id"),
+        Index("ix_teams_members_team_id_role", "team_id", "role"),
+        # Membership checks and "my teams".
+        Index("ix_teams_members_user_id_team_id", "user_id", "team_id"),
+        *(() if not TABLE_ARGS else (TABLE_ARGS,)),
+    )
 
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey(USER_FK), nullable=False
@@ -1,13 +1,24 @@
-from sqlalchemy import select
+from typing import Iterable
+
+from sqlalchemy import case, func, insert, select
 
 from app.core.repositories.base import AbstractRepository
-from app.core.custom_types import ids
+from app.core.custom_types import ids, role
 from app.teams import (
+    dto,
     models,
     orm_models,
     mappers
 )
 
+
+def _like_pattern(text: str) -> str:
+    escaped = (
+        text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    return f"%{escaped}%"
+
+
 class SQLAlchemyUserRepository(AbstractRepository[models.User]):
     """Implementing a user's repository"""
 
@@ -21,6 +32,13 @@ class SQLAlchemyUserRepository(AbstractRepository[models.User]):
             return None
         return mappers.UserMapper.to_domain(orm)
 
+    async def get_existing_ids(self, user_ids: Iterable[int]) -> set[int]:
+        result = await self.session.execute(
+            select(orm_models.TeamUserOrm.id)
+            .where(orm_models.TeamUserOrm.id.in_(set(user_ids)))
+        )
+        return set(result.scalars().all())
+
     async def save(self, domain: models.User):
         result = await self.session.execute(
             select(orm_models.TeamUserOrm)
@@ -60,6 +78,54 @@ class SQLAlchemyMemberRepository(AbstractRepository[models.Member]):
         orm_model = result.scalar_one_or_none()
         return mappers.MemberMapper.to_domain(orm_model) if orm_model else None
 
+    async def get_roles(self, user_id: int, team_id: int) -> list[str]:
+        result = await self.session.execute(
+            select(orm_models.MemberOrm.role)
+            .where(
+                orm_models.MemberOrm.user_id == user_id,
+                orm_models.MemberOrm.team_id == team_id
+            )
+        )
+        return list(result.scalars().all())
+
+    async def get_page_by_team(
+        self,
+        team_id: int,
+        *,
+        limit: int,
+        after_id: int | None = None,
+        role: role.UserRole | None = None,
+        search: str | None = None,
+    ) -> list[dto.TeamMemberItemDTO]:
+        """Members in membership-id order, starting after ``after_id``."""
+        member = orm_models.MemberOrm
+        user = orm_models.TeamUserOrm
+        query = (
+            select(member.id, member.user_id, user.username, member.role)
+            .join(user, user.id == member.user_id)
+            .where(member.team_id == team_id)
+        )
+        if after_id is not None:
+            query = query.where(member.id > after_id)
+        if role is not None:
+            query = query.where(member.role == role.value)
+        if search:
+            query = query.where(
+                user.username.ilike(_like_pattern(search), escape="\\")
+            )
+        result = await self.session.execute(
+            query.order_by(member.id).limit(limit)
+        )
+        return [
+            dto.TeamMemberItemDTO(
+                id=row.id,
+                user_id=row.user_id,
+                username=row.username,
+                role=row.role,
+            )
+            for row in result
+        ]
+
     async def save(self, domain: models.Member):
         result = await self.session.execute(
             select(orm_models.MemberOrm)
@@ -88,6 +154,136 @@ class SQLAlchemyTeamRepository(AbstractRepository[models.Team]):
         orm_model = result.scalar_one_or_none()
         return mappers.TeamMapper.to_domain(orm_model) if orm_model else None
 
+    async def exists(self, team_id: int) -> bool:
+        result = await self.session.execute(
+            select(orm_models.TeamOrm.id)
+            .where(orm_models.TeamOrm.id == team_id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def get_summary(self, team_id: int) -> dto.TeamReadDTO | None:
+        """Team header with ``members_count``, without loading members."""
+        team = orm_models.TeamOrm
+        members_count = (
+            select(func.count())
+            .select_from(orm_models.MemberOrm)
+            .where(orm_models.MemberOrm.team_id == team.id)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            select(
+                team.id,
+                team.name,
+                team.created_dttm,
+                team.updated_dttm,
+                members_count.label("members_count"),
+            )
+            .where(team.id == team_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return dto.TeamReadDTO(
+            id=row.id,
+            name=row.name,
+            members_count=row.members_count,
+            created_at=row.created_dttm,
+            updated_at=row.updated_dttm,
+        )
+
+    async def get_page_by_user(
+        self,
+        user_id: int,
+        *,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[list[dto.TeamReadDTO], int]:
+        """The user's teams with member counts and the user's roles.
+
+        One grouped statement; ``total`` rides along as a window count
+        over the groups, so the page size does not add queries.
+        """
+        team = orm_models.TeamOrm
+        member = orm_models.MemberOrm
+
+        def has_role(role_name: str):
+            return func.max(
+                case(
+                    (
+                        (member.user_id == user_id)
+                        & (member.role == role_name),
+                        1,
+                    ),
+                    else_=0,
+                )
+            ).label(f"is_{role_name}")
+
+        my_team_ids = select(member.team_id).where(member.user_id == user_id)
+        result = await self.session.execute(
+            select(
+                team.id,
+                team.name,
+                team.created_dttm,
+                team.updated_dttm,
+                func.count(member.id).label("members_count"),
+                *(has_role(name.value) for name in role.UserRole),
+                func.count().over().label("total"),
+            )
+            .join(member, member.team_id == team.id)
+            .where(team.id.in_(my_team_ids))
+            .group_by(team.id, team.name, team.created_dttm, team.updated_dttm)
+            .order_by(team.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = result.all()
+        if rows:
+            total = rows[0].total
+        else:
+            total = 0 if offset == 0 else await self.session.scalar(
+                select(func.count(func.distinct(member.team_id)))
+                .where(member.user_id == user_id)
+            ) or 0
+        items = []
+        for row in rows:
+            roles = [
+                name.value for name in role.UserRole
+                if getattr(row, f"is_{name.value}")
+            ]
+            items.append(
+                dto.TeamReadDTO(
+                    id=row.id,
+                    name=row.name,
+                    members_count=row.members_count,
+                    roles=roles,
+                    created_at=row.created_dttm,
+                    updated_at=row.updated_dttm,
+                    is_admin=role.UserRole.ADMIN.value in roles,
+                    is_member=True,
+                )
+            )
+        return items, total
+
+    async def save_new_members(
+        self, team: models.Team, members: list[models.Member]
+    ) -> None:
+        """Insert members just added to a stored team in one statement.
+
+        Unlike ``save`` this leaves the team's other member rows alone.
+        """
+        if members:
+            await self.session.execute(
+                insert(orm_models.MemberOrm).values([
+                    {
+                        "user_id": member.user_id,
+                        "team_id": team.id,
+                        "role": member.role.value,
+                    }
+                    for member in members
+                ])
+            )
+        self.uow._seen.add(team)
+
     async def save(self, domain: models.Team):
         if domain.id is None:
             orm_team = mappers.TeamMapper.to_orm(domain)
@@ -6,7 +6,9 @@ from app.teams import (
     management
 )
 from app.core.custom_types import ids, role
+from app.core.infrastructure.tracing import traced
 from app.core.uow.teams import TeamUnitOfWork
+from app.teams.handlers import CapabilityCache
 
 
 class CreateTeamUseCase:
@@ -23,6 +25,7 @@ class CreateTeamUseCase:
         """Initialize with Unit of Work."""
         self.uow = uow
 
+    @traced
     async def execute(
             self,
             command: dto.CreateTeamCommand
@@ -70,6 +73,7 @@ class ReadTeamUseCase:
         """Initialize with Unit of Work."""
         self.uow = uow
 
+    @traced
     async def execute(
             self,
             command: dto.TeamReadResponsDTO
@@ -82,35 +86,54 @@ class ReadTeamUseCase:
             raise custom_exception.UserNotFoundException(
                 f"User {command.user_id} not found"
             )
-        team = await self.uow.repos.team.get_by_id(
-            command.team_id
-        )
+        team = await self.uow.repos.team.get_summary(command.team_id)
         if team is None:
             raise HTTPException(404, "Team not found")
-        management.TeamQuery(team, ids.UserId(user.id or 0))
-
-        return dto.TeamReadDTO(
-            id=team.id or 0,
-            name=team._name,
-            members=[
-                dto.MemberReadDTO(
-                    user_id=m.user_id,
-                    role=m.role,
-                )
-                for m in team.members
-            ],
-            members_count=len(team.members),
-            created_at=getattr(team, 'created_at', None),
-            updated_at=getattr(team, 'updated_at', None),
-            is_admin=team.is_admin(ids.UserId(user.id or 0)),
-            is_member=True,
+        roles = await _require_member_roles(
+            self.uow, int(user.id or 0), command.team_id
         )
+        return team.model_copy(
+            update={"is_admin": role.UserRole.ADMIN in roles, "is_member": True}
+        )
+
+
+class ListTeamMembersUseCase:
+
+    def __init__(self, uow: TeamUnitOfWork):
+        """Initialize with Unit of Work."""
+        self.uow = uow
+
+    @traced
+    async def execute(
+            self,
+            *,
+            actor_user_id: int,
+            team_id: int,
+            limit: int,
+            cursor: int | None = None,
+            role: role.UserRole | None = None,
+            search: str | None = None,
+    ) -> dto.TeamMemberPageDTO:
+        if not await self.uow.repos.team.exists(team_id):
+            raise HTTPException(404, "Team not found")
+        await _require_member_roles(self.uow, actor_user_id, team_id)
+        # One extra row tells whether another page follows.
+        items = await self.uow.repos.member.get_page_by_team(
+            team_id,
+            limit=limit + 1,
+            after_id=cursor,
+            role=role,
+            search=search,
+        )
+        next_cursor = items[limit - 1].id if len(items) > limit else None
+        return dto.TeamMemberPageDTO(items=items[:limit], next_cursor=next_cursor)
 
 
 class AddMemberUseCase:
     def __init__(self, uow: TeamUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, command: dto.AddMemberCommand) -> dto.TeamReadDTO:
         if command.actor_user_id is None:
             raise ValueError("actor_user_id is required")
@@ -137,10 +160,67 @@ class AddMemberUseCase:
         return _to_team_read_dto(team, command.actor_user_id)
 
 
+class BulkAddMembersUseCase:
+    """
+    Add many members to a team in one transaction.
+
+    The admin check runs once, new member rows go in as one INSERT and
+    the other contexts receive a single ``MembersAddTeam`` event.
+    """
+
+    def __init__(self, uow: TeamUnitOfWork):
+        self.uow = uow
+
+    @traced
+    async def execute(
+            self, command: dto.BulkAddMembersCommand
+    ) -> dto.BulkAddMembersResult:
+        if command.actor_user_id is None:
+            raise ValueError("actor_user_id is required")
+        if command.team_id is None:
+            raise ValueError("team_id is required")
+        operations = [
+            (ids.UserId(item.target_user_id), role.UserRole(item.role))
+            for item in command.members
+        ]
+        team = await self.uow.repos.team.get_by_id(command.team_id)
+        if team is None:
+            raise HTTPException(404, "Team not found")
+        action = management.ActionAddMemberTeam(
+            team=team,
+            admin_id=ids.UserId(command.actor_user_id),
+        )
+        wanted = {user_id for user_id, _ in operations}
+        missing = wanted - await self.uow.repos.user.get_existing_ids(wanted)
+        if missing:
+            raise custom_exception.UserNotFoundException(
+                f"Users {sorted(missing)} not found"
+            )
+        added = action.execute_many(operations)
+        await self.uow.repos.team.save_new_members(team, added)
+        await self.uow.commit()
+        pending = {(m.user_id, m.role) for m in added}
+        skipped = []
+        for item, key in zip(command.members, operations):
+            if key in pending:
+                pending.discard(key)
+            else:
+                skipped.append(item)
+        return dto.BulkAddMembersResult(
+            team_id=command.team_id,
+            added=[
+                dto.MemberReadDTO(user_id=m.user_id, role=m.role)
+                for m in added
+            ],
+            skipped=skipped,
+        )
+
+
 class RemoveMemberUseCase:
     def __init__(self, uow: TeamUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(self, command: dto.RemoveMemberCommand) -> dto.TeamReadDTO:
         if command.actor_user_id is None:
             raise ValueError("actor_user_id is required")
@@ -164,6 +244,7 @@ class ChangeMemberRoleUseCase:
     def __init__(self, uow: TeamUnitOfWork):
         self.uow = uow
 
+    @traced
     async def execute(
         self,
         command: dto.ChangeMemberRoleCommand,
@@ -195,36 +276,72 @@ class ListMyTeamsUseCase:
     def __init__(self, uow: TeamUnitOfWork):
         self.uow = uow
 
-    async def execute(self, user_id: int) -> dto.TeamListDTO:
+    @traced
+    async def execute(
+        self,
+        user_id: int,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dto.TeamListDTO:
         user = await self.uow.repos.user.get_by_id(user_id)
         if user is None:
             raise custom_exception.UserNotFoundException(f"User {user_id} not found")
-        members = await self.uow.repos.member.get_by_user(user_id)
-        team_items: list[dto.TeamReadDTO] = []
-        seen_team_ids: set[int] = set()
-        for member in members:
-            if member.team_id is None or int(member.team_id) in seen_team_ids:
-                continue
-            team = await self.uow.repos.team.get_by_id(int(member.team_id))
-            if team is None:
-                continue
-            team_items.append(_to_team_read_dto(team, user_id))
-            seen_team_ids.add(int(member.team_id))
-        return dto.TeamListDTO(items=team_items, total=len(team_items))
+        items, total = await self.uow.repos.team.get_page_by_user(
+            user_id, limit=limit, offset=offset
+        )
+        return dto.TeamListDTO(
+            items=items, total=total, limit=limit, offset=offset
+        )
 
 
 class TeamCapabilitiesUseCase:
-    def __init__(self, uow: TeamUnitOfWork):
+    """
+    Capabilities of a user in a team.
+
+    Served from the (team_id, user_id) cache when given one; a miss costs
+    one indexed lookup of the user's roles in the team. The cache is
+    invalidated by membership events, and its TTL bounds staleness
+    across processes.
+    """
+
+    def __init__(
+            self,
+            uow: TeamUnitOfWork,
+            cache: CapabilityCache | None = None,
+    ):
         self.uow = uow
+        self.cache = cache
 
+    @traced
     async def execute(self, team_id: int, user_id: int) -> dto.TeamCapabilitiesDTO:
-        user = await self.uow.repos.user.get_by_id(user_id)
-        if user is None:
-            raise custom_exception.UserNotFoundException(f"User {user_id} not found")
-        team = await self.uow.repos.team.get_by_id(team_id)
-        if team is None:
-            raise HTTPException(404, "Team not found")
-        return _to_team_capabilities(team, user_id)
+        key = (team_id, user_id)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        roles = await self.uow.repos.member.get_roles(user_id, team_id)
+        if not roles:
+            user = await self.uow.repos.user.get_by_id(user_id)
+            if user is None:
+                raise custom_exception.UserNotFoundException(f"User {user_id} not found")
+            if await self.uow.repos.team.get_summary(team_id) is None:
+                raise HTTPException(404, "Team not found")
+        capabilities = _to_team_capabilities(team_id, user_id, roles)
+        if self.cache is not None:
+            self.cache.set(key, capabilities)
+        return capabilities
+
+
+async def _require_member_roles(
+        uow: TeamUnitOfWork, user_id: int, team_id: int
+) -> list[str]:
+    roles = await uow.repos.member.get_roles(user_id, team_id)
+    if not roles:
+        raise custom_exception.MemberNotFoundException(
+            f"User {user_id} is not a member of team {team_id}"
+        )
+    return roles
 
 
 def _to_team_read_dto(team, user_id: int) -> dto.TeamReadDTO:
@@ -236,6 +353,10 @@ def _to_team_read_dto(team, user_id: int) -> dto.TeamReadDTO:
             for member in team.members
         ],
         members_count=len(team.members),
+        roles=[
+            team_role.value for team_role in role.UserRole
+            if team.has_member(ids.UserId(user_id), team_role)
+        ],
         created_at=getattr(team, "created_at", None),
         updated_at=getattr(team, "updated_at", None),
         is_admin=team.is_admin(ids.UserId(user_id)),
@@ -243,27 +364,18 @@ def _to_team_read_dto(team, user_id: int) -> dto.TeamReadDTO:
     )
 
 
-def _to_team_capabilities(team, user_id: int) -> dto.TeamCapabilitiesDTO:
-    user_domain_id = ids.UserId(user_id)
-    member_roles = sorted(
-        {
-            str(member.role)
-            for member in team.members
-            if int(member.user_id) == user_id
-        }
-    )
-    is_member = team.is_member(user_domain_id)
-    is_admin = team.is_admin(user_domain_id)
-    is_manager = any(
-        int(member.user_id) == user_id and member.role == role.UserRole.MANAGER
-        for member in team.members
-    )
+def _to_team_capabilities(
+        team_id: int, user_id: int, roles: list[str]
+) -> dto.TeamCapabilitiesDTO:
+    is_member = bool(roles)
+    is_admin = role.UserRole.ADMIN in roles
+    is_manager = role.UserRole.MANAGER in roles
     can_manage_team = is_admin
     can_manage_work = is_admin or is_manager
     return dto.TeamCapabilitiesDTO(
-        team_id=int(team.id or 0),
+        team_id=team_id,
         user_id=user_id,
-        available_roles=member_roles,
+        available_roles=sorted(set(roles)),
         is_member=is_member,
         is_admin=is_admin,
         is_manager=is_manager,
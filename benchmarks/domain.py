@@ -0,0 +1,248 @@
+"""Domain model hot paths, sized by members/events/evaluations.
+
+Lookups target the last element, the worst case for a linear scan.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import cast
+
+from app.calendar import mappers as calendar_mappers
+from app.calendar import models as calendar_models
+from app.calendar import orm_models as calendar_orm
+from app.core.custom_types import calendar_type, grade, ids, role
+from app.evaluations import mappers as evaluations_mappers
+from app.evaluations import models as evaluations_models
+from app.evaluations import orm_models as evaluations_orm
+from app.membership import models as membership_models
+from app.scheduling import mappers as scheduling_mappers
+from app.scheduling import models as scheduling_models
+from app.scheduling import orm_models as scheduling_orm
+from app.tasks import models as tasks_models
+from app.teams import management as teams_management
+from app.teams import mappers as teams_mappers
+from app.teams import models as teams_models
+from app.teams import orm_models as teams_orm
+from benchmarks.micro import benchmark
+
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+TEAM_ID = ids.TeamId(1)
+
+
+def _teams_team(size: int) -> teams_models.Team:
+    """Members 1..size; the last one is also the admin."""
+    members = [
+        teams_models.Member(
+            ids.UserId(user_id), TEAM_ID, role.UserRole.MEMBER
+        )
+        for user_id in range(1, size + 1)
+    ]
+    members.append(
+        teams_models.Member(ids.UserId(size), TEAM_ID, role.UserRole.ADMIN)
+    )
+    return teams_models.Team(TEAM_ID, members, "bench")
+
+
+def _tasks_team(size: int) -> tasks_models.Team:
+    members = [
+        tasks_models.MemberTask(
+            ids.UserId(user_id), TEAM_ID, role.UserTaskRole.MEMBER
+        )
+        for user_id in range(1, size + 1)
+    ]
+    return tasks_models.Team(TEAM_ID, members)
+
+
+def _scheduling_team(size: int) -> scheduling_models.Team:
+    members = [
+        scheduling_models.MemberTeam(ids.UserId(user_id), TEAM_ID)
+        for user_id in range(1, size + 1)
+    ]
+    return scheduling_models.Team(TEAM_ID, members)
+
+
+@benchmark("teams.Team.is_member")
+def teams_is_member(size):
+    team = _teams_team(size)
+    return lambda: team.is_member(ids.UserId(size))
+
+
+@benchmark("teams.Team.has_member")
+def teams_has_member(size):
+    team = _teams_team(size)
+    return lambda: team.has_member(ids.UserId(size), role.UserRole.MEMBER)
+
+
+@benchmark("teams.Team.is_admin")
+def teams_is_admin(size):
+    team = _teams_team(size)
+    return lambda: team.is_admin(ids.UserId(size))
+
+
+@benchmark("teams.management.permission_check")
+def teams_permission_check(size):
+    """Admin check plus the membership lookup of a role change."""
+    team = _teams_team(size)
+    admin_id = ids.UserId(size)
+    member_id = ids.UserId(size - 1 or 1)
+
+    def check():
+        teams_management.ActionAssigningRolesTeam(team, admin_id)
+        team.get_member(member_id, role.UserRole.MEMBER)
+        team.has_member(member_id, role.UserRole.MANAGER)
+
+    return check
+
+
+@benchmark("tasks.Team.is_member")
+def tasks_is_member(size):
+    team = _tasks_team(size)
+    return lambda: team.is_member(ids.UserId(size))
+
+
+@benchmark("tasks.Team.has_member")
+def tasks_has_member(size):
+    team = _tasks_team(size)
+    return lambda: team.has_member(
+        ids.UserId(size), role.UserTaskRole.MEMBER
+    )
+
+
+@benchmark("scheduling.Team.is_member")
+def scheduling_is_member(size):
+    team = _scheduling_team(size)
+    return lambda: team.is_member(ids.UserId(size))
+
+
+@benchmark("scheduling.Team.is_manager")
+def scheduling_is_manager(size):
+    team = _scheduling_team(size)
+    return lambda: team.is_manager(ids.UserId(size))
+
+
+@benchmark("scheduling.User.check_meeting")
+def scheduling_check_meeting(size):
+    meetings = [
+        scheduling_models.Meeting(
+            ids.UserId(1), TEAM_ID,
+            START + timedelta(hours=2 * number),
+            START + timedelta(hours=2 * number + 1),
+            [],
+            id=ids.MeetingId(number + 1),
+        )
+        for number in range(size)
+    ]
+    user = scheduling_models.User(ids.UserId(1), "bench", meetings)
+    free_slot = START + timedelta(hours=2 * size)
+    new_meeting = scheduling_models.Meeting(
+        ids.UserId(1), TEAM_ID, free_slot, free_slot + timedelta(hours=1), []
+    )
+    return lambda: user.check_meeting(new_meeting)
+
+
+def _calendar(size: int) -> calendar_models.Calendar:
+    events = [
+        calendar_models.CalendarEvent(
+            user_id=ids.UserId(1),
+            id=ids.CalendarEventId(number + 1),
+            type=calendar_type.CalendarEventType.TASK,
+            description="",
+            title=f"Event {number}",
+            time=START + timedelta(hours=7 * number),
+            reference_id=ids.TaskId(number + 1),
+            cancelled=False,
+        )
+        for number in range(size)
+    ]
+    return calendar_models.Calendar(ids.UserId(1), events)
+
+
+@benchmark("calendar.Calendar.events_for_day")
+def calendar_events_for_day(size):
+    calendar = _calendar(size)
+    return lambda: calendar.events_for_day(START)
+
+
+@benchmark("calendar.Calendar.events_for_month")
+def calendar_events_for_month(size):
+    calendar = _calendar(size)
+    return lambda: calendar.events_for_month(START.year, START.month)
+
+
+@benchmark("evaluations.User.average_grade")
+def evaluations_average_grade(size):
+    evaluations = [
+        evaluations_models.Evaluation(
+            user_id=ids.UserId(1),
+            team_id=ids.TeamId(number % 2 + 1),
+            task_id=ids.TaskId(number + 1),
+            grade=cast(grade.Grade, number % 5 + 1),
+            created_at=START + timedelta(minutes=number),
+        )
+        for number in range(size)
+    ]
+    user = evaluations_models.User(ids.UserId(1), evaluations, "bench")
+    end = START + timedelta(minutes=size // 2)
+    return lambda: user.average_grade(TEAM_ID, start=START, end=end)
+
+
+@benchmark("teams.TeamMapper.to_domain")
+def teams_mapper_to_domain(size):
+    team_orm = teams_orm.TeamOrm(id=1, name="bench")
+    team_orm.members = [
+        teams_orm.MemberOrm(
+            user_id=user_id, team_id=1, role=role.UserRole.MEMBER.value
+        )
+        for user_id in range(1, size + 1)
+    ]
+    return lambda: teams_mappers.TeamMapper.to_domain(team_orm)
+
+
+@benchmark("scheduling.SchedulingTeamMapper.to_domain")
+def scheduling_team_mapper_to_domain(size):
+    team_orm = scheduling_orm.SchedulingTeamOrm(id=1)
+    members = [
+        membership_models.Membership(
+            TEAM_ID, ids.UserId(user_id), membership_models.RoleMask.MEMBER
+        )
+        for user_id in range(1, size + 1)
+    ]
+    return lambda: scheduling_mappers.SchedulingTeamMapper.to_domain(
+        team_orm, members
+    )
+
+
+@benchmark("calendar.CalendarEventMapper.to_domain")
+def calendar_event_mapper_to_domain(size):
+    rows = [
+        calendar_orm.CalendarEventOrm(
+            id=number + 1,
+            user_id=1,
+            event_type=calendar_type.CalendarEventType.TASK,
+            title=f"Event {number}",
+            description="",
+            time=START + timedelta(hours=number),
+            reference_id=number + 1,
+            cancelled=False,
+        )
+        for number in range(size)
+    ]
+    to_domain = calendar_mappers.CalendarEventMapper.to_domain
+    return lambda: [to_domain(row) for row in rows]
+
+
+@benchmark("evaluations.EvaluationMapper.to_domain")
+def evaluation_mapper_to_domain(size):
+    rows = [
+        evaluations_orm.EvaluationOrm(
+            id=number + 1,
+            user_id=1,
+            team_id=1,
+            task_id=number + 1,
+            grade=number % 5 + 1,
+            created_dttm=START + timedelta(minutes=number),
+        )
+        for number in range(size)
+    ]
+    to_domain = evaluations_mappers.EvaluationMapper.to_domain
+    return lambda: [to_domain(row) for row in rows]
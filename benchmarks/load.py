@@ -0,0 +1,393 @@
+"""HTTP load generator reporting per-endpoint latency percentiles.
+
+Virtual users (seeded by ``benchmarks.seed``) log in once and then hit
+the read endpoints with a fixed number of concurrent workers::
+
+    python -m benchmarks.load --mode asgi --requests 500 --concurrency 16
+    python -m benchmarks.load --mode socket --json results.json
+    python -m benchmarks.load --mode socket --base-url http://host:8000
+
+``asgi`` drives the application in-process through httpx's ASGI
+transport (no network, measures the app and database). ``socket`` goes
+through a real TCP connection to uvicorn, started as a subprocess from
+the same settings unless ``--base-url`` is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from typing import AsyncIterator, Callable
+
+import httpx
+
+from benchmarks.seed import BENCH_PASSWORD, SEARCH_WORDS
+
+
+PREFIX = "/api/v1"
+
+
+@dataclass(frozen=True)
+class VirtualUser:
+    """A logged-in user and the team its requests are scoped to."""
+    user_id: int
+    team_id: int
+    headers: dict[str, str]
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    path: Callable[[VirtualUser], str]
+
+
+def _default_endpoints() -> list[Endpoint]:
+    today = date.today()
+    return [
+        Endpoint("users.me", lambda u: f"{PREFIX}/users/me"),
+        Endpoint("teams.list", lambda u: f"{PREFIX}/teams"),
+        Endpoint("teams.get", lambda u: f"{PREFIX}/teams/{u.team_id}"),
+        Endpoint(
+            "teams.members", lambda u: f"{PREFIX}/teams/{u.team_id}/members"
+        ),
+        Endpoint(
+            "tasks.list", lambda u: f"{PREFIX}/tasks?team_id={u.team_id}"
+        ),
+        Endpoint(
+            "tasks.search",
+            lambda u: (
+                f"{PREFIX}/tasks/search"
+                f"?q={SEARCH_WORDS[u.user_id % len(SEARCH_WORDS)]}"
+            ),
+        ),
+        # Task ``team_id`` belongs to that team and, with the presets,
+        # is among the commented tasks.
+        Endpoint(
+            "tasks.comments",
+            lambda u: f"{PREFIX}/tasks/{u.team_id}/comments",
+        ),
+        Endpoint(
+            "tasks.stats",
+            lambda u: f"{PREFIX}/tasks/stats?team_id={u.team_id}",
+        ),
+        Endpoint(
+            "calendar.day",
+            lambda u: f"{PREFIX}/calendar/day?day={today.isoformat()}",
+        ),
+        Endpoint(
+            "calendar.month",
+            lambda u: (
+                f"{PREFIX}/calendar/month"
+                f"?year={today.year}&month={today.month}"
+            ),
+        ),
+        Endpoint("evaluations.me", lambda u: f"{PREFIX}/evaluations/me"),
+        Endpoint(
+            "evaluations.average",
+            lambda u: (
+                f"{PREFIX}/evaluations/me/average?team_id={u.team_id}"
+            ),
+        ),
+        Endpoint(
+            "meetings.list",
+            lambda u: f"{PREFIX}/scheduling/meetings?team_id={u.team_id}",
+        ),
+    ]
+
+
+ENDPOINTS = _default_endpoints()
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (``q`` in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class EndpointStats:
+    """Latencies (ms) and failures of one endpoint run."""
+    name: str
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed_seconds: float = 0.0
+
+    def summary(self) -> dict[str, float | int | str]:
+        ordered = sorted(self.latencies_ms)
+        count = len(ordered)
+        return {
+            "endpoint": self.name,
+            "requests": count,
+            "errors": self.errors,
+            "rps": round(count / self.elapsed_seconds, 1)
+            if self.elapsed_seconds else 0.0,
+            "mean_ms": round(sum(ordered) / count, 2) if count else 0.0,
+            "p50_ms": round(percentile(ordered, 50), 2),
+            "p95_ms": round(percentile(ordered, 95), 2),
+            "p99_ms": round(percentile(ordered, 99), 2),
+            "max_ms": round(ordered[-1], 2) if count else 0.0,
+        }
+
+
+async def login(
+        client: httpx.AsyncClient, user_id: int
+) -> VirtualUser | None:
+    """Log a seeded user in and pick a team it is a member or manager of.
+
+    ``GET /teams`` lists the caller's own ``roles`` per team. Admin-only
+    users cannot read team tasks, so users that only administer teams
+    are skipped (None).
+    """
+    response = await client.post(
+        f"{PREFIX}/auth/jwt/login",
+        data={
+            "username": f"user{user_id}@bench.example.com",
+            "password": BENCH_PASSWORD,
+        },
+    )
+    response.raise_for_status()
+    headers = {
+        "Authorization": f"Bearer {response.json()['access_token']}"
+    }
+    teams = await client.get(f"{PREFIX}/teams", headers=headers)
+    teams.raise_for_status()
+    for team in teams.json()["items"]:
+        if {"member", "manager"} & set(team["roles"]):
+            return VirtualUser(user_id, team["id"], headers)
+    return None
+
+
+async def run_endpoint(
+        client: httpx.AsyncClient,
+        endpoint: Endpoint,
+        users: list[VirtualUser],
+        *,
+        requests: int,
+        concurrency: int,
+) -> EndpointStats:
+    """Send ``requests`` GETs from ``concurrency`` workers."""
+    stats = EndpointStats(endpoint.name)
+    issued = 0
+
+    async def worker() -> None:
+        nonlocal issued
+        while issued < requests:
+            user = users[issued % len(users)]
+            issued += 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(
+                    endpoint.path(user), headers=user.headers
+                )
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            stats.latencies_ms.append(
+                (time.perf_counter() - started) * 1000
+            )
+            stats.errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    stats.elapsed_seconds = time.perf_counter() - started
+    return stats
+
+
+async def run(
+        client: httpx.AsyncClient,
+        *,
+        users: int,
+        requests: int,
+        concurrency: int,
+        warmup: int = 10,
+        endpoints: list[Endpoint] | None = None,
+) -> list[EndpointStats]:
+    """Log ``users`` virtual users in and load each endpoint in turn."""
+    virtual_users: list[VirtualUser] = []
+    next_user_id = 1
+    while len(virtual_users) < users:
+        batch = range(next_user_id, next_user_id + users)
+        next_user_id += users
+        logged_in = await asyncio.gather(
+            *(login(client, user_id) for user_id in batch)
+        )
+        virtual_users.extend(user for user in logged_in if user)
+    virtual_users = virtual_users[:users]
+    results = []
+    for endpoint in endpoints or ENDPOINTS:
+        if warmup:
+            await run_endpoint(
+                client, endpoint, virtual_users,
+                requests=warmup, concurrency=1,
+            )
+        results.append(await run_endpoint(
+            client, endpoint, virtual_users,
+            requests=requests, concurrency=concurrency,
+        ))
+    return results
+
+
+@asynccontextmanager
+async def asgi_client() -> AsyncIterator[httpx.AsyncClient]:
+    """In-process client; runs the application's lifespan around it."""
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=60
+        ) as client:
+            yield client
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_until_ready(
+        client: httpx.AsyncClient, process: subprocess.Popen, timeout: float
+) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            if (await client.get("/metrics")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("uvicorn did not become ready in time")
+
+
+@asynccontextmanager
+async def socket_client(
+        base_url: str | None = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Client over real TCP; starts uvicorn unless ``base_url`` is given."""
+    process = None
+    if base_url is None:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "app.main:app",
+                "--host", "127.0.0.1", "--port", str(port),
+                "--log-level", "warning", "--no-access-log",
+            ],
+            env=os.environ.copy(),
+        )
+    try:
+        async with httpx.AsyncClient(
+            base_url=base_url,
+            timeout=60,
+            limits=httpx.Limits(max_connections=None),
+        ) as client:
+            if process is not None:
+                await _wait_until_ready(client, process, timeout=30)
+            yield client
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+def format_table(summaries: list[dict]) -> str:
+    columns = (
+        "endpoint", "requests", "errors", "rps",
+        "p50_ms", "p95_ms", "p99_ms", "max_ms",
+    )
+    rows = [columns] + [
+        tuple(str(summary[column]) for column in columns)
+        for summary in summaries
+    ]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return "\n".join(
+        "  ".join(value.ljust(width) for value, width in zip(row, widths))
+        for row in rows
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Load the read endpoints and report latency percentiles."
+    )
+    parser.add_argument("--mode", choices=("asgi", "socket"), default="asgi")
+    parser.add_argument(
+        "--base-url", default=None,
+        help="Socket mode: target an already running server",
+    )
+    parser.add_argument("--users", type=int, default=10,
+                        help="Virtual users to log in (default: 10)")
+    parser.add_argument("--requests", type=int, default=200,
+                        help="Requests per endpoint (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Concurrent workers (default: 8)")
+    parser.add_argument("--warmup", type=int, default=10,
+                        help="Unmeasured requests per endpoint")
+    parser.add_argument(
+        "--endpoint", action="append", dest="endpoints",
+        choices=[endpoint.name for endpoint in ENDPOINTS],
+        help="Only load this endpoint (repeatable)",
+    )
+    parser.add_argument("--json", default=None,
+                        help="Write the results to this JSON file")
+    return parser
+
+
+async def _main(args: argparse.Namespace) -> list[dict]:
+    endpoints = [
+        endpoint for endpoint in ENDPOINTS
+        if not args.endpoints or endpoint.name in args.endpoints
+    ]
+    client_context = (
+        asgi_client() if args.mode == "asgi"
+        else socket_client(args.base_url)
+    )
+    async with client_context as client:
+        results = await run(
+            client,
+            users=args.users,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            warmup=args.warmup,
+            endpoints=endpoints,
+        )
+    return [result.summary() for result in results]
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+    summaries = asyncio.run(_main(args))
+    print(format_table(summaries))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "mode": args.mode,
+                    "users": args.users,
+                    "requests": args.requests,
+                    "concurrency": args.concurrency,
+                    "endpoints": summaries,
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
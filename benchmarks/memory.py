@@ -0,0 +1,199 @@
+"""Memory footprint of loaded domain objects.
+
+Builds ``--count`` instances of each domain type the way a repository
+load would and reports the traced allocation per instance; the fields'
+own values (ids, strings, datetimes) are created up front so only the
+objects themselves are counted::
+
+    python -m benchmarks.memory --count 100000 --json memory.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from app.calendar import models as calendar_models
+from app.core.custom_types import (
+    calendar_type,
+    grade,
+    ids,
+    role,
+    task_status,
+)
+from app.evaluations import models as evaluations_models
+from app.scheduling import models as scheduling_models
+from app.tasks import models as tasks_models
+from app.teams import models as teams_models
+
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+USER_ID = ids.UserId(1)
+EXECUTOR_ID = ids.UserId(2)
+TEAM_ID = ids.TeamId(1)
+GRADE: grade.Grade = 5
+
+Builder = Callable[[int], list]
+
+
+def _values(count: int) -> tuple[list[int], list[datetime]]:
+    return list(range(1, count + 1)), [
+        START + timedelta(minutes=n) for n in range(count)
+    ]
+
+
+def _calendar_events(numbers, times):
+    task = calendar_type.CalendarEventType.TASK
+    return lambda: [
+        calendar_models.CalendarEvent(
+            user_id=USER_ID, id=ids.CalendarEventId(n), type=task,
+            description="", title="Event", time=t,
+            reference_id=ids.TaskId(n), cancelled=False,
+        )
+        for n, t in zip(numbers, times)
+    ]
+
+
+def _evaluations(numbers, times):
+    return lambda: [
+        evaluations_models.Evaluation(
+            user_id=USER_ID, team_id=TEAM_ID, task_id=ids.TaskId(n),
+            grade=GRADE, created_at=t,
+        )
+        for n, t in zip(numbers, times)
+    ]
+
+
+def _evaluation_tasks(numbers, times):
+    done = task_status.TaskStatus.DONE
+    return lambda: [
+        evaluations_models.Task(
+            ids.TaskId(n), TEAM_ID, USER_ID, EXECUTOR_ID, done
+        )
+        for n in numbers
+    ]
+
+
+def _team_members(numbers, times):
+    member = role.UserRole.MEMBER
+    return lambda: [
+        teams_models.Member(ids.UserId(n), TEAM_ID, member)
+        for n in numbers
+    ]
+
+
+def _task_members(numbers, times):
+    member = role.UserTaskRole.MEMBER
+    return lambda: [
+        tasks_models.MemberTask(ids.UserId(n), TEAM_ID, member)
+        for n in numbers
+    ]
+
+
+def _scheduling_members(numbers, times):
+    return lambda: [
+        scheduling_models.MemberTeam(ids.UserId(n), TEAM_ID, False)
+        for n in numbers
+    ]
+
+
+def _participants(numbers, times):
+    meeting_id = ids.MeetingId(1)
+    return lambda: [
+        scheduling_models.MeetingParticipant(ids.UserId(n), meeting_id)
+        for n in numbers
+    ]
+
+
+def _comments(numbers, times):
+    task_id = ids.TaskId(1)
+    return lambda: [
+        tasks_models.Comment(
+            USER_ID, task_id, "text", TEAM_ID, ids.CommentId(n), t
+        )
+        for n, t in zip(numbers, times)
+    ]
+
+
+def _tasks(numbers, times):
+    return lambda: [
+        tasks_models.Task(
+            USER_ID, t, "title", "description", id=ids.TaskId(n),
+            team_id=TEAM_ID, executor_id=EXECUTOR_ID, created_at=t,
+            updated_at=t,
+        )
+        for n, t in zip(numbers, times)
+    ]
+
+
+def _meetings(numbers, times):
+    return lambda: [
+        scheduling_models.Meeting(
+            USER_ID, TEAM_ID, t, t, [], id=ids.MeetingId(n)
+        )
+        for n, t in zip(numbers, times)
+    ]
+
+
+CASES: dict[str, Callable] = {
+    "calendar.CalendarEvent": _calendar_events,
+    "evaluations.Evaluation": _evaluations,
+    "evaluations.Task": _evaluation_tasks,
+    "teams.Member": _team_members,
+    "tasks.MemberTask": _task_members,
+    "scheduling.MemberTeam": _scheduling_members,
+    "scheduling.MeetingParticipant": _participants,
+    "tasks.Comment": _comments,
+    "tasks.Task": _tasks,
+    "scheduling.Meeting": _meetings,
+}
+
+
+def bytes_per_object(name: str, count: int) -> float:
+    """Average traced bytes allocated per instance of case ``name``."""
+    build = CASES[name](*_values(count))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # The list holding the objects is not part of the objects' cost.
+    list_bytes = objects.__sizeof__()
+    return (after - before - list_bytes) / len(objects)
+
+
+def run(count: int) -> dict[str, float]:
+    return {
+        name: round(bytes_per_object(name, count), 1) for name in CASES
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure bytes per loaded domain object."
+    )
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--json", default=None)
+    args = parser.parse_args()
+
+    results = run(args.count)
+    for name, size in results.items():
+        print(f"{name:<32} {size:>8.1f} B/object")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {"count": args.count, "bytes_per_object": results},
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
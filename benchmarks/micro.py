@@ -0,0 +1,283 @@
+"""Micro-benchmark runner with JSON results and regression checks.
+
+Cases are registered with ``@benchmark`` (see ``benchmarks.domain``);
+each case is a factory that builds its input for a given size and
+returns the zero-argument callable to time::
+
+    python -m benchmarks.micro run --json before.json
+    python -m benchmarks.micro run --sizes 10 1000 --filter Team
+    python -m benchmarks.micro run --baseline before.json --threshold 0.25
+    python -m benchmarks.micro compare before.json after.json
+
+Every case/size pair is auto-calibrated to run for at least
+``--min-time`` per repeat; the fastest repeat is the reported ns/op
+(the least disturbed by the rest of the machine) and the one compared
+against a baseline. ``compare`` and ``run --baseline`` exit with status
+1 when any pair got slower than the threshold allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000)
+SUITES = ("benchmarks.domain",)
+
+Factory = Callable[[int], Callable[[], object]]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    factory: Factory
+    sizes: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    size: int
+    ns_per_op: float
+    median_ns_per_op: float
+    loops: int
+    repeats: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    size: int
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+_registry: dict[str, Case] = {}
+
+
+def benchmark(
+        name: str, sizes: Iterable[int] = DEFAULT_SIZES
+) -> Callable[[Factory], Factory]:
+    """Register a case factory under ``name``."""
+    def register(factory: Factory) -> Factory:
+        if name in _registry:
+            raise ValueError(f"Benchmark {name} already registered")
+        _registry[name] = Case(name, factory, tuple(sizes))
+        return factory
+    return register
+
+
+def cases() -> list[Case]:
+    for module in SUITES:
+        importlib.import_module(module)
+    return list(_registry.values())
+
+
+def _time_loops(function: Callable[[], object], loops: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(loops):
+        function()
+    return time.perf_counter_ns() - started
+
+
+def measure(
+        name: str,
+        size: int,
+        function: Callable[[], object],
+        *,
+        repeats: int = 5,
+        min_time: float = 0.05,
+) -> Result:
+    """Time ``function``; loops per repeat grow until ``min_time``."""
+    loops = 1
+    while True:
+        elapsed = _time_loops(function, loops)
+        if elapsed >= min_time * 1e9 or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_time * 1e8 else 2
+    timings = [elapsed] + [
+        _time_loops(function, loops) for _ in range(repeats - 1)
+    ]
+    per_op = [timing / loops for timing in timings]
+    return Result(
+        name=name,
+        size=size,
+        ns_per_op=round(min(per_op), 1),
+        median_ns_per_op=round(statistics.median(per_op), 1),
+        loops=loops,
+        repeats=repeats,
+    )
+
+
+def run(
+        *,
+        sizes: Iterable[int] | None = None,
+        name_filter: str | None = None,
+        repeats: int = 5,
+        min_time: float = 0.05,
+        log: Callable[[str], None] | None = None,
+) -> list[Result]:
+    """Run the registered cases, restricted to ``sizes`` if given."""
+    wanted = set(sizes) if sizes is not None else None
+    results = []
+    for case in cases():
+        if name_filter and name_filter not in case.name:
+            continue
+        for size in case.sizes:
+            if wanted is not None and size not in wanted:
+                continue
+            result = measure(
+                case.name, size, case.factory(size),
+                repeats=repeats, min_time=min_time,
+            )
+            results.append(result)
+            if log:
+                log(_format_result(result))
+    return results
+
+
+def _format_result(result: Result) -> str:
+    return (
+        f"{result.name:<45} {result.size:>8}  "
+        f"{result.ns_per_op:>14,.1f} ns/op"
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def to_json(results: list[Result]) -> dict:
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def load_results(path: str) -> list[Result]:
+    with open(path, encoding="utf-8") as file:
+        return [Result(**item) for item in json.load(file)["results"]]
+
+
+def compare(
+        baseline: list[Result],
+        current: list[Result],
+        threshold: float,
+) -> list[Regression]:
+    """Pairs at least ``threshold`` (0.25 = 25 %) slower than baseline."""
+    base = {(r.name, r.size): r.ns_per_op for r in baseline}
+    regressions = []
+    for result in current:
+        baseline_ns = base.get((result.name, result.size))
+        if not baseline_ns:
+            continue
+        if result.ns_per_op > baseline_ns * (1 + threshold):
+            regressions.append(Regression(
+                result.name, result.size, baseline_ns, result.ns_per_op
+            ))
+    return regressions
+
+
+def _report(regressions: list[Regression], threshold: float) -> int:
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}")
+        return 0
+    print(f"{len(regressions)} regression(s) above {threshold:.0%}:")
+    for item in regressions:
+        print(
+            f"  {item.name} [{item.size}]: {item.baseline_ns:,.1f} -> "
+            f"{item.current_ns:,.1f} ns/op (x{item.ratio:.2f})"
+        )
+    return 1
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run domain micro-benchmarks."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=None)
+    run_parser.add_argument("--filter", default=None,
+                            help="Only cases whose name contains this")
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.05,
+                            help="Seconds per repeat (default: 0.05)")
+    run_parser.add_argument("--json", default=None,
+                            help="Write results to this file")
+    run_parser.add_argument("--baseline", default=None,
+                            help="Fail on regressions against this file")
+    run_parser.add_argument("--threshold", type=float, default=0.25)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare two result files"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.25)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command == "compare":
+        return _report(
+            compare(
+                load_results(args.baseline),
+                load_results(args.current),
+                args.threshold,
+            ),
+            args.threshold,
+        )
+
+    results = run(
+        sizes=args.sizes,
+        name_filter=args.filter,
+        repeats=args.repeats,
+        min_time=args.min_time,
+        log=print,
+    )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(to_json(results), file, indent=2)
+    if args.baseline:
+        return _report(
+            compare(load_results(args.baseline), results, args.threshold),
+            args.threshold,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    # Run through the importable module so that suites register their
+    # cases in the same registry ``main`` reads.
+    from benchmarks import micro
+
+    sys.exit(micro.main())
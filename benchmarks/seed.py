@@ -0,0 +1,515 @@
+"""Synthetic data generator for load tests.
+
+Fills every bounded context directly with batched Core inserts (no
+domain events), so realistic volumes are reachable in minutes::
+
+    TEST=true DATABASE_URL=sqlite+aiosqlite:///bench.db \\
+        python -m benchmarks.seed --preset smoke --create-tables
+    python -m benchmarks.seed --preset full --tasks 200000
+
+The database is taken from the application settings (``DATABASE_URL``
+or the ``DATABASE_*`` parts); ``TEST=true`` selects the schema-less
+layout used with SQLite. All users share ``BENCH_PASSWORD``. Generation
+is deterministic: row ``n`` of a table is always the same, so runs on
+different databases are comparable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Iterator
+
+from fastapi_users.password import PasswordHelper
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.calendar import orm_models as calendar_orm
+from app.core.custom_types import calendar_type, role, task_status
+from app.core.database import Base
+from app.deps.base import get_settings
+from app.evaluations import orm_models as evaluations_orm
+from app.identity.orm_models import UserORM
+from app.membership import orm_models as membership_orm
+from app.membership.models import RoleMask
+from app.scheduling import orm_models as scheduling_orm
+from app.tasks import orm_models as tasks_orm
+from app.teams import orm_models as teams_orm
+
+
+BENCH_PASSWORD = "bench-password"
+SCHEMAS = (
+    "identity", "teams", "tasks", "evaluations", "scheduling", "calendar",
+    "membership",
+)
+_TASK_STATUSES = tuple(task_status.TaskStatus)
+# One of these ends every task description, so each word matches about
+# 1/len of the tasks in ``GET /tasks/search`` load runs.
+SEARCH_WORDS = (
+    "invoice", "release", "database", "design", "hiring",
+    "budget", "migration", "review", "deploy", "audit",
+)
+# Comments go to the first 1/COMMENTED_TASK_SHARE of the tasks.
+COMMENTED_TASK_SHARE = 4
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    """Row counts of one generated data set."""
+    users: int
+    teams: int
+    team_size: int
+    tasks: int
+    calendar_events: int
+    evaluations: int
+    meetings: int
+    comments: int
+    meeting_size: int = 4
+    batch_size: int = 5_000
+
+    def __post_init__(self):
+        if self.team_size < 3:
+            raise ValueError("team_size must be at least 3")
+        if self.team_size > self.users:
+            raise ValueError("team_size cannot exceed users")
+        if self.meeting_size > self.team_size:
+            raise ValueError("meeting_size cannot exceed team_size")
+
+
+PRESETS = {
+    "smoke": SeedConfig(
+        users=200,
+        teams=20,
+        team_size=10,
+        tasks=2_000,
+        calendar_events=10_000,
+        evaluations=5_000,
+        meetings=200,
+        comments=5_000,
+    ),
+    "medium": SeedConfig(
+        users=2_000,
+        teams=200,
+        team_size=20,
+        tasks=100_000,
+        calendar_events=500_000,
+        evaluations=1_000_000,
+        meetings=10_000,
+        comments=250_000,
+    ),
+    "full": SeedConfig(
+        users=5_000,
+        teams=500,
+        team_size=25,
+        tasks=1_000_000,
+        calendar_events=5_000_000,
+        evaluations=10_000_000,
+        meetings=50_000,
+        comments=2_500_000,
+    ),
+}
+
+
+class Dataset:
+    """Deterministic mapping from row numbers to generated rows.
+
+    Team ``t`` has ``team_size`` members; member 0 is the team admin,
+    member 1 its manager and the rest are plain members. Users belong to
+    several teams when ``teams * team_size`` exceeds ``users``.
+    """
+
+    def __init__(self, config: SeedConfig, now: datetime | None = None):
+        self.config = config
+        self.now = (now or datetime.now(timezone.utc)).replace(
+            minute=0, second=0, microsecond=0
+        )
+
+    def member(self, team_id: int, index: int) -> int:
+        config = self.config
+        return ((team_id - 1) * config.team_size + index) % config.users + 1
+
+    def admin(self, team_id: int) -> int:
+        return self.member(team_id, 0)
+
+    def manager(self, team_id: int) -> int:
+        return self.member(team_id, 1)
+
+    def task_team(self, task_id: int) -> int:
+        return (task_id - 1) % self.config.teams + 1
+
+    def task_executor(self, task_id: int) -> int:
+        plain_members = self.config.team_size - 2
+        index = 2 + (task_id * 7919) % plain_members
+        return self.member(self.task_team(task_id), index)
+
+    def task_status(self, task_id: int) -> task_status.TaskStatus:
+        return _TASK_STATUSES[task_id % len(_TASK_STATUSES)]
+
+    def comment_task(self, comment_id: int) -> int:
+        commented = max(1, self.config.tasks // COMMENTED_TASK_SHARE)
+        return (comment_id - 1) % commented + 1
+
+    def users(self) -> Iterator[int]:
+        return iter(range(1, self.config.users + 1))
+
+    def memberships(self) -> Iterator[tuple[int, int, int]]:
+        """(team_id, user_id, member index) of every team member."""
+        for team_id in range(1, self.config.teams + 1):
+            for index in range(self.config.team_size):
+                yield team_id, self.member(team_id, index), index
+
+
+def _user_rows(data: Dataset, hashed_password: str) -> Iterator[dict]:
+    for user_id in data.users():
+        yield {
+            "id": user_id,
+            "email": f"user{user_id}@bench.example.com",
+            "username": f"user{user_id}",
+            "hashed_password": hashed_password,
+            "is_active": True,
+            "is_superuser": False,
+            "is_verified": True,
+            "deleted": False,
+        }
+
+
+def _projection_rows(data: Dataset) -> Iterator[dict]:
+    for user_id in data.users():
+        yield {"id": user_id, "username": f"user{user_id}"}
+
+
+def _team_rows(data: Dataset) -> Iterator[dict]:
+    for team_id in range(1, data.config.teams + 1):
+        yield {"id": team_id, "name": f"Team {team_id}"}
+
+
+def _team_id_rows(data: Dataset) -> Iterator[dict]:
+    for team_id in range(1, data.config.teams + 1):
+        yield {"id": team_id}
+
+
+def _team_member_rows(data: Dataset) -> Iterator[dict]:
+    roles = {0: role.UserRole.ADMIN, 1: role.UserRole.MANAGER}
+    for team_id, user_id, index in data.memberships():
+        yield {
+            "team_id": team_id,
+            "user_id": user_id,
+            "role": roles.get(index, role.UserRole.MEMBER).value,
+        }
+
+
+def _membership_rows(data: Dataset) -> Iterator[dict]:
+    masks = {0: RoleMask.ADMIN, 1: RoleMask.MANAGER}
+    for team_id, user_id, index in data.memberships():
+        yield {
+            "team_id": team_id,
+            "user_id": user_id,
+            "roles": int(masks.get(index, RoleMask.MEMBER)),
+        }
+
+
+def _task_rows(data: Dataset) -> Iterator[dict]:
+    for task_id in range(1, data.config.tasks + 1):
+        team_id = data.task_team(task_id)
+        yield {
+            "id": task_id,
+            "team_id": team_id,
+            "supervisor_id": data.manager(team_id),
+            "executor_id": data.task_executor(task_id),
+            "title": f"Task {task_id}",
+            "description": (
+                f"Synthetic task {task_id} for team {team_id}: "
+                f"{SEARCH_WORDS[task_id % len(SEARCH_WORDS)]}"
+            ),
+            "status": data.task_status(task_id),
+            "deadline": data.now + timedelta(
+                days=(task_id * 13) % 120 - 60
+            ),
+            "deleted": False,
+        }
+
+
+def _comment_rows(data: Dataset) -> Iterator[dict]:
+    # The task's executor and manager take turns; ids grow with time.
+    start = data.now - timedelta(minutes=data.config.comments)
+    for comment_id in range(1, data.config.comments + 1):
+        task_id = data.comment_task(comment_id)
+        team_id = data.task_team(task_id)
+        yield {
+            "id": comment_id,
+            "task_id": task_id,
+            "team_id": team_id,
+            "author_id": (
+                data.task_executor(task_id) if comment_id % 2
+                else data.manager(team_id)
+            ),
+            "text": (
+                f"Comment {comment_id}: "
+                f"{SEARCH_WORDS[comment_id * 3 % len(SEARCH_WORDS)]}"
+            ),
+            "created_dttm": start + timedelta(minutes=comment_id),
+        }
+
+
+def _task_counter_rows(data: Dataset) -> Iterator[dict]:
+    """``_task_rows`` aggregated the way ``TaskCountersHandler`` counts."""
+    counts: dict[tuple[int, int, task_status.TaskStatus], int] = {}
+    for task_id in range(1, data.config.tasks + 1):
+        key = (
+            data.task_team(task_id),
+            data.task_executor(task_id),
+            data.task_status(task_id),
+        )
+        counts[key] = counts.get(key, 0) + 1
+    for (team_id, executor_id, status), count in counts.items():
+        yield {
+            "team_id": team_id,
+            "executor_id": executor_id,
+            "status": status,
+            "count": count,
+        }
+
+
+def _evaluation_task_rows(data: Dataset) -> Iterator[dict]:
+    for task_id in range(1, data.config.tasks + 1):
+        team_id = data.task_team(task_id)
+        yield {
+            "id": task_id,
+            "team_id": team_id,
+            "supervisor_id": data.manager(team_id),
+            "executor_id": data.task_executor(task_id),
+            "status": data.task_status(task_id),
+        }
+
+
+def _evaluation_rows(data: Dataset) -> Iterator[dict]:
+    for number in range(1, data.config.evaluations + 1):
+        task_id = (number - 1) % data.config.tasks + 1
+        yield {
+            "user_id": data.task_executor(task_id),
+            "team_id": data.task_team(task_id),
+            "task_id": task_id,
+            "grade": (number * 31) % 5 + 1,
+        }
+
+
+def _calendar_event_rows(data: Dataset) -> Iterator[dict]:
+    # reference_id is unique per row, which satisfies the
+    # (user_id, event_type, reference_id) constraint.
+    for number in range(1, data.config.calendar_events + 1):
+        event_type = (
+            calendar_type.CalendarEventType.TASK if number % 2
+            else calendar_type.CalendarEventType.MEETING
+        )
+        yield {
+            "user_id": (number - 1) % data.config.users + 1,
+            "event_type": event_type,
+            "title": f"{event_type.value.title()} #{number}",
+            "description": "",
+            "time": data.now + timedelta(
+                hours=(number * 37) % (24 * 360) - 24 * 180
+            ),
+            "reference_id": number,
+            "cancelled": number % 50 == 0,
+        }
+
+
+def _meeting_rows(data: Dataset) -> Iterator[dict]:
+    for meeting_id in range(1, data.config.meetings + 1):
+        team_id = (meeting_id - 1) % data.config.teams + 1
+        start = data.now + timedelta(hours=(meeting_id * 11) % 2160 - 1080)
+        yield {
+            "id": meeting_id,
+            "team_id": team_id,
+            "organizer_id": data.manager(team_id),
+            "start": start,
+            "end": start + timedelta(hours=1),
+            "description": f"Meeting {meeting_id}",
+            "is_cancelled": False,
+        }
+
+
+def _meeting_participant_rows(data: Dataset) -> Iterator[dict]:
+    for meeting_id in range(1, data.config.meetings + 1):
+        team_id = (meeting_id - 1) % data.config.teams + 1
+        for index in range(1, data.config.meeting_size + 1):
+            yield {
+                "meeting_id": meeting_id,
+                "user_id": data.member(team_id, index),
+            }
+
+
+def _batches(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _plan(
+        data: Dataset, hashed_password: str
+) -> list[tuple[Any, Callable[[], Iterable[dict]]]]:
+    """(table, row generator) in foreign key order."""
+    projection = lambda: _projection_rows(data)  # noqa: E731
+    return [
+        (UserORM.__table__, lambda: _user_rows(data, hashed_password)),
+        (teams_orm.TeamUserOrm.__table__, projection),
+        (tasks_orm.TaskUserOrm.__table__, projection),
+        (evaluations_orm.EvaluationUserOrm.__table__, projection),
+        (scheduling_orm.SchedulingUserOrm.__table__, projection),
+        (calendar_orm.CalendarUserOrm.__table__, projection),
+        (teams_orm.TeamOrm.__table__, lambda: _team_rows(data)),
+        (teams_orm.MemberOrm.__table__, lambda: _team_member_rows(data)),
+        (tasks_orm.TaskTeamOrm.__table__, lambda: _team_id_rows(data)),
+        (
+            scheduling_orm.SchedulingTeamOrm.__table__,
+            lambda: _team_id_rows(data),
+        ),
+        (
+            membership_orm.MembershipOrm.__table__,
+            lambda: _membership_rows(data),
+        ),
+        (tasks_orm.TaskOrm.__table__, lambda: _task_rows(data)),
+        (tasks_orm.CommentOrm.__table__, lambda: _comment_rows(data)),
+        (
+            tasks_orm.TaskCounterOrm.__table__,
+            lambda: _task_counter_rows(data),
+        ),
+        (
+            evaluations_orm.EvaluationTaskOrm.__table__,
+            lambda: _evaluation_task_rows(data),
+        ),
+        (
+            evaluations_orm.EvaluationOrm.__table__,
+            lambda: _evaluation_rows(data),
+        ),
+        (
+            scheduling_orm.SchedulingMeetingOrm.__table__,
+            lambda: _meeting_rows(data),
+        ),
+        (
+            scheduling_orm.SchedulingMeetingParticipantOrm.__table__,
+            lambda: _meeting_participant_rows(data),
+        ),
+        (
+            calendar_orm.CalendarEventOrm.__table__,
+            lambda: _calendar_event_rows(data),
+        ),
+    ]
+
+
+async def _reset_sequences(conn: AsyncConnection, tables) -> None:
+    """Move PostgreSQL id sequences past the explicitly inserted ids."""
+    for table in tables:
+        if "id" not in table.c or not table.c.id.autoincrement:
+            continue
+        name = table.fullname
+        await conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {name}), 0) + 1, false)"
+        ))
+
+
+async def seed(
+        database_url: str,
+        config: SeedConfig,
+        *,
+        create_tables: bool = False,
+        drop_existing: bool = False,
+        use_schema: bool = False,
+        log: Callable[[str], None] = print,
+) -> dict[str, int]:
+    """Generate ``config`` into the database; returns rows per table."""
+    data = Dataset(config)
+    hashed_password = PasswordHelper().hash(BENCH_PASSWORD)
+    plan = _plan(data, hashed_password)
+    engine = create_async_engine(database_url, echo=False)
+    inserted: dict[str, int] = {}
+    try:
+        async with engine.begin() as conn:
+            if drop_existing:
+                await conn.run_sync(Base.metadata.drop_all)
+            if create_tables or drop_existing:
+                if use_schema:
+                    for schema in SCHEMAS:
+                        await conn.execute(
+                            text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+                        )
+                await conn.run_sync(Base.metadata.create_all)
+
+        for table, rows in plan:
+            started = time.perf_counter()
+            count = 0
+            statement = insert(table)
+            for batch in _batches(rows(), config.batch_size):
+                async with engine.begin() as conn:
+                    await conn.execute(statement, batch)
+                count += len(batch)
+            inserted[table.fullname] = count
+            elapsed = time.perf_counter() - started
+            log(
+                f"{table.fullname}: {count} rows in {elapsed:.1f}s "
+                f"({count / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+
+        if engine.dialect.name == "postgresql":
+            async with engine.begin() as conn:
+                await _reset_sequences(conn, [table for table, _ in plan])
+    finally:
+        await engine.dispose()
+    return inserted
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Fill the database with synthetic benchmark data."
+    )
+    parser.add_argument(
+        "--preset", choices=sorted(PRESETS), default="smoke",
+        help="Base row counts (default: smoke)",
+    )
+    for item in fields(SeedConfig):
+        parser.add_argument(
+            f"--{item.name.replace('_', '-')}", type=int, default=None,
+            help=f"Override {item.name}",
+        )
+    parser.add_argument(
+        "--create-tables", action="store_true",
+        help="Create missing schemas/tables instead of relying on alembic",
+    )
+    parser.add_argument(
+        "--drop-existing", action="store_true",
+        help="Drop and recreate all tables first",
+    )
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+    overrides = {
+        item.name: getattr(args, item.name)
+        for item in fields(SeedConfig)
+        if getattr(args, item.name) is not None
+    }
+    config = replace(PRESETS[args.preset], **overrides)
+    settings = get_settings()
+    asyncio.run(
+        seed(
+            settings.database_dsn,
+            config,
+            create_tables=args.create_tables,
+            drop_existing=args.drop_existing,
+            use_schema=settings.use_schema,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
@@ -8,10 +10,26 @@ from fastapi import FastAPI, status
 from httpx import AsyncClient, ASGITransport
 
 from app.core.database import Base
+from app.core.infrastructure.cache import TTLCache
 from app.core.infrastructure.event_bus import MemoryEventBus
+from app.core.infrastructure.metrics import MetricsMiddleware
+from app.core.infrastructure.profiler import (
+    ProfilerMiddleware,
+    SamplingProfiler,
+)
+from app.core.infrastructure.tracing import TracingMiddleware
+from app.core.infrastructure.query_counter import (
+    QueryCountMiddleware,
+    instrument_engine,
+    query_scope,
+)
+from app.core.infrastructure.slow_query import SlowQueryLog
 from app.core.register_handlers import register_event_handlers
+from app.identity.password import AsyncPasswordHasher
 from app.routers import (
     calendar as calendar_router,
+    debug as debug_router,
+    metrics as metrics_router,
     evaluations as evaluations_router,
     identity as identity_router,
     scheduling as scheduling_router,
@@ -28,6 +46,7 @@ async def engine():
         "sqlite+aiosqlite:///:memory:",
         echo=True,
     )
+    instrument_engine(engine)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
@@ -65,6 +84,9 @@ async def test_app():
         "sqlite+aiosqlite:///:memory:",
         echo=False,
     )
+    instrument_engine(engine)
+    slow_query_log = SlowQueryLog(threshold_ms=0)
+    slow_query_log.instrument(engine)
 
     async with engine.begin() as conn:
         await conn.run_sync(
@@ -77,8 +99,23 @@ async def test_app():
     app.state.async_session = async_sessionmaker(
         engine, expire_on_commit=False
     )
+    app.state.slow_query_log = slow_query_log
+    app.state.profiler = SamplingProfiler()
     app.state.bus = MemoryEventBus()
-    await register_event_handlers(app.state.bus, app.state.async_session)
+    app.state.user_cache = TTLCache(max_size=1000, ttl_seconds=60)
+    app.state.capability_cache = TTLCache(max_size=1000, ttl_seconds=60)
+    app.state.password_hasher = AsyncPasswordHasher(max_workers=4)
+    await register_event_handlers(
+        app.state.bus,
+        app.state.async_session,
+        user_cache=app.state.user_cache,
+        capability_cache=app.state.capability_cache,
+    )
+
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(QueryCountMiddleware, expose_headers=True)
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(ProfilerMiddleware)
 
     PREFIX = "/api/v1"
     app.include_router(identity_router.auth_router, prefix=PREFIX)
@@ -88,8 +125,12 @@ async def test_app():
     app.include_router(evaluations_router.evaluations_router, prefix=PREFIX)
     app.include_router(scheduling_router.scheduling_router, prefix=PREFIX)
     app.include_router(calendar_router.calendar_router, prefix=PREFIX)
+    app.include_router(debug_router.debug_router, prefix=PREFIX)
+    app.include_router(metrics_router.metrics_router)
 
     yield app
+    app.state.profiler.stop()
+    app.state.password_hasher.shutdown()
     await engine.dispose()
 
 
@@ -103,6 +144,25 @@ async def client(test_app):
         yield client
 
 
+@pytest.fixture
+def assert_max_queries():
+    """Assert that a block runs at most ``max_count`` SQL statements.
+
+    Usage:
+        with assert_max_queries(3):
+            await client.get(...)
+    """
+    @contextmanager
+    def _assert_max_queries(max_count: int):
+        with query_scope("test") as stats:
+            yield stats
+        assert stats.count <= max_count, (
+            f"Expected at most {max_count} queries, got {stats.count}: "
+            f"{dict(stats.shapes)}"
+        )
+    return _assert_max_queries
+
+
 @pytest.fixture
 async def registered_user(client):
     """Register user and return credentials."""
@@ -1,5 +1,16 @@
+import asyncio
+import threading
+
 import pytest
-from fastapi import status
+from fastapi import Request, status
+from sqlalchemy import update
+
+from app.admin.auth import AdminAuthBackend
+from app.core.infrastructure.cache import TTLCache
+from app.core.register_handlers import register_event_handlers
+from app.core.shared.events import identity as identity_event
+from app.identity.orm_models import UserORM
+from app.identity.password import AsyncPasswordHasher
 
 
 @pytest.mark.anyio
@@ -170,3 +181,124 @@ async def test_delete_me_revokes_protected_access(client):
 
     me_response = await client.get("/api/v1/users/me", headers=headers)
     assert me_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.anyio
+async def test_authenticated_user_is_served_from_cache(
+    test_app, authenticated_client
+):
+    cache = test_app.state.user_cache
+    first = await authenticated_client.get("/api/v1/users/me")
+    misses = cache.stats.misses
+    second = await authenticated_client.get("/api/v1/users/me")
+
+    assert first.status_code == second.status_code == status.HTTP_200_OK
+    assert first.json() == second.json()
+    assert cache.stats.misses == misses
+    assert cache.stats.hits >= 1
+
+
+@pytest.mark.anyio
+async def test_update_me_invalidates_cached_user(
+    test_app, authenticated_client
+):
+    await authenticated_client.get("/api/v1/users/me")
+    assert len(test_app.state.user_cache) == 1
+
+    response = await authenticated_client.patch(
+        "/api/v1/users/me",
+        json={"username": "renamed"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    me_response = await authenticated_client.get("/api/v1/users/me")
+    assert me_response.json()["username"] == "renamed"
+
+
+@pytest.mark.anyio
+async def test_login_hash_does_not_block_other_requests(
+    test_app, client, registered_user, auth_token, monkeypatch
+):
+    """Password hashing runs off the loop: while a login's hash is
+    blocked, unrelated endpoints still answer."""
+    helper = test_app.state.password_hasher.helper
+    verify_and_update = helper.verify_and_update
+    entered = threading.Event()
+    release = threading.Event()
+
+    def blocked_verify(*args):
+        entered.set()
+        release.wait(timeout=10)
+        return verify_and_update(*args)
+
+    monkeypatch.setattr(helper, "verify_and_update", blocked_verify)
+    login = asyncio.ensure_future(client.post(
+        "/api/v1/auth/jwt/login",
+        data={
+            "username": registered_user["email"],
+            "password": registered_user["password"],
+        },
+    ))
+    try:
+        assert await asyncio.to_thread(entered.wait, 10)
+        me_response = await client.get(
+            "/api/v1/users/me",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+
+        assert me_response.status_code == status.HTTP_200_OK
+        assert not login.done()
+    finally:
+        release.set()
+    assert (await login).status_code == status.HTTP_200_OK
+
+
+@pytest.mark.anyio
+async def test_admin_authenticate_is_cached_until_user_event(
+    async_session_factory, event_bus
+):
+    async with async_session_factory() as session:
+        admin = UserORM(
+            email="root@example.com",
+            username="root",
+            hashed_password="x",
+            is_superuser=True,
+        )
+        session.add(admin)
+        await session.commit()
+        admin_id = admin.id
+
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    await register_event_handlers(
+        event_bus, async_session_factory, admin_cache=cache
+    )
+    password_hasher = AsyncPasswordHasher(max_workers=1)
+    backend = AdminAuthBackend(
+        secret_key="secret",
+        session_factory=async_session_factory,
+        password_hasher=password_hasher,
+        cache=cache,
+    )
+    request = Request(
+        {"type": "http", "session": {"admin_user_id": admin_id}}
+    )
+
+    try:
+        assert await backend.authenticate(request) is True
+        assert await backend.authenticate(request) is True
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+        async with async_session_factory() as session:
+            await session.execute(
+                update(UserORM)
+                .where(UserORM.id == admin_id)
+                .values(is_superuser=False)
+            )
+            await session.commit()
+        await event_bus.publish(
+            identity_event.UserUpdated(user_id=admin_id, username="root")
+        )
+
+        assert await backend.authenticate(request) is False
+    finally:
+        password_hasher.shutdown()
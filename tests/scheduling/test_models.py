@@ -92,6 +92,31 @@ class TestMeeting:
             meeting.cancel()
 
 
+class TestTeam:
+
+    def test_membership_index_follows_changes(self):
+        team_id, user_id = ids.TeamId(1), ids.UserId(2)
+        team = Team(team_id, [MemberTeam(ids.UserId(1), team_id, True)])
+
+        team.add_member(user_id, is_manager=False)
+        assert team.is_member(user_id)
+        assert not team.is_manager(user_id)
+
+        team.add_member(user_id, is_manager=True)
+        assert team.is_manager(user_id)
+        assert len(team.members) == 2
+
+        team.change_member_role(user_id, is_manager=False)
+        assert not team.is_manager(user_id)
+
+        assert team.remove_member(user_id) == MemberTeam(
+            user_id, team_id, False
+        )
+        assert not team.is_member(user_id)
+        assert team.remove_member(user_id) is None
+        assert team.members == (MemberTeam(ids.UserId(1), team_id, True),)
+
+
 class TestMeetingManagement:
 
     def test_create_meeting_success(self):
@@ -0,0 +1,162 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.membership.orm_models import MembershipOrm
+from app.tasks.orm_models import CommentOrm, TaskOrm
+from app.teams.orm_models import MemberOrm
+from benchmarks import memory, micro
+from benchmarks.load import EndpointStats, login, percentile
+from benchmarks.seed import BENCH_PASSWORD, Dataset, SeedConfig, seed
+
+
+TINY = SeedConfig(
+    users=12,
+    teams=4,
+    team_size=5,
+    tasks=40,
+    calendar_events=60,
+    evaluations=80,
+    meetings=8,
+    comments=30,
+    meeting_size=3,
+    batch_size=7,
+)
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 99) == 0.0
+
+
+def test_endpoint_stats_summary():
+    stats = EndpointStats("x", [1.0, 2.0, 3.0, 4.0], errors=1,
+                          elapsed_seconds=2.0)
+    summary = stats.summary()
+    assert summary["requests"] == 4
+    assert summary["errors"] == 1
+    assert summary["rps"] == 2.0
+    assert summary["p50_ms"] == 2.0
+    assert summary["max_ms"] == 4.0
+
+
+@pytest.mark.anyio
+async def test_load_login_picks_a_team_from_the_real_payload(client):
+    # Register users the way the seed names them, so ``login`` reads the
+    # actual GET /teams payload of the application.
+    for user_id in (1, 2):
+        response = await client.post("/api/v1/auth/register", json={
+            "email": f"user{user_id}@bench.example.com",
+            "password": BENCH_PASSWORD,
+            "username": f"user{user_id}",
+        })
+        assert response.json()["id"] == user_id
+    admin = await client.post(
+        "/api/v1/auth/jwt/login",
+        data={"username": "user1@bench.example.com",
+              "password": BENCH_PASSWORD},
+    )
+    headers = {"Authorization": f"Bearer {admin.json()['access_token']}"}
+    team_id = (await client.post(
+        "/api/v1/teams", json={"team_name": "bench"}, headers=headers
+    )).json()["team_id"]
+    await client.post(
+        f"/api/v1/teams/{team_id}/members",
+        json={"target_user_id": 2, "role": "member"},
+        headers=headers,
+    )
+
+    assert await login(client, 1) is None
+    user = await login(client, 2)
+    assert user is not None
+    assert (user.user_id, user.team_id) == (2, team_id)
+
+
+def test_dataset_executors_are_plain_team_members():
+    data = Dataset(TINY)
+    for task_id in range(1, TINY.tasks + 1):
+        team_id = data.task_team(task_id)
+        members = [data.member(team_id, i) for i in range(2, TINY.team_size)]
+        assert data.task_executor(task_id) in members
+
+
+@pytest.mark.anyio
+async def test_seed_fills_all_contexts(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}"
+    inserted = await seed(url, TINY, create_tables=True, log=lambda _: None)
+
+    assert inserted["tasks"] == TINY.tasks
+    assert inserted["evaluations"] == TINY.evaluations
+    assert inserted["calendar_event"] == TINY.calendar_events
+    assert inserted["tasks_comment"] == TINY.comments
+    assert inserted["teams_members"] == TINY.teams * TINY.team_size
+    assert inserted["membership"] == TINY.teams * TINY.team_size
+
+    engine = create_async_engine(url)
+    async with engine.connect() as conn:
+        # Every task executor is a plain member of the task's team in the
+        # membership read model, as the application itself would project it.
+        orphaned = await conn.scalar(
+            select(func.count()).select_from(TaskOrm).where(
+                ~select(MembershipOrm.user_id).where(
+                    MembershipOrm.team_id == TaskOrm.team_id,
+                    MembershipOrm.user_id == TaskOrm.executor_id,
+                    MembershipOrm.roles == 1,
+                ).exists()
+            )
+        )
+        # Comment authors are members or managers of the task's team.
+        outside_authors = await conn.scalar(
+            select(func.count()).select_from(CommentOrm).where(
+                ~select(MembershipOrm.user_id).where(
+                    MembershipOrm.team_id == CommentOrm.team_id,
+                    MembershipOrm.user_id == CommentOrm.author_id,
+                ).exists()
+            )
+        )
+        admins = await conn.scalar(
+            select(func.count()).select_from(MemberOrm).where(
+                MemberOrm.role == "admin"
+            )
+        )
+    await engine.dispose()
+    assert orphaned == 0
+    assert outside_authors == 0
+    assert admins == TINY.teams
+
+
+def test_micro_benchmarks_run_every_domain_case():
+    results = micro.run(sizes=[10], repeats=2, min_time=0.0001)
+
+    names = {result.name for result in results}
+    assert {
+        "teams.Team.has_member",
+        "scheduling.User.check_meeting",
+        "calendar.Calendar.events_for_day",
+        "evaluations.User.average_grade",
+        "teams.TeamMapper.to_domain",
+    } <= names
+    assert all(result.size == 10 for result in results)
+    assert all(result.ns_per_op > 0 for result in results)
+
+
+def test_micro_compare_flags_only_regressions_above_threshold():
+    def result(name, ns):
+        return micro.Result(name, 100, ns, ns, loops=1, repeats=1)
+
+    baseline = [result("a", 100.0), result("b", 100.0), result("c", 100.0)]
+    current = [result("a", 124.0), result("b", 130.0), result("new", 1e9)]
+
+    regressions = micro.compare(baseline, current, threshold=0.25)
+
+    assert [(r.name, r.ratio) for r in regressions] == [("b", 1.3)]
+
+
+def test_memory_benchmark_objects_have_no_instance_dict():
+    for name, case in memory.CASES.items():
+        objects = case(*memory._values(3))()
+        assert not hasattr(objects[0], "__dict__"), name
+    assert all(size > 0 for size in memory.run(count=200).values())
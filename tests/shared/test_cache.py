@@ -0,0 +1,71 @@
+import pytest
+
+from app.core.infrastructure.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_and_miss_are_counted():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=10)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_ratio == 0.5
+
+
+def test_cache_entry_expires_after_ttl():
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(
+        max_size=2, ttl_seconds=10, clock=clock
+    )
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_cache_invalidate_where():
+    cache: TTLCache[tuple[int, str], str] = TTLCache(
+        max_size=10, ttl_seconds=10
+    )
+    cache.set((1, "t1"), "u1")
+    cache.set((1, "t2"), "u1")
+    cache.set((2, "t3"), "u2")
+
+    assert cache.invalidate_where(lambda key: key[0] == 1) == 2
+    assert len(cache) == 1
+    assert cache.get((2, "t3")) == "u2"
+
+
+def test_cache_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        TTLCache(max_size=0, ttl_seconds=10)
+    with pytest.raises(ValueError):
+        TTLCache(max_size=1, ttl_seconds=0)
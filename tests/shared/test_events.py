@@ -3,6 +3,7 @@ from datetime import datetime, timedelta, timezone
 import pytest
 
 from app.core.custom_types import ids, role
+from app.core.infrastructure.event import EventHandler
 from app.core.shared.events import identity as user_event
 from app.core.shared.events import meetings as meeting_event
 from app.core.shared.events import tasks as task_event
@@ -17,6 +18,7 @@ from app.tasks.unit_of_work import (
 )
 from app.tasks import models as tasks_models
 from app.evaluations.unit_of_work import EvaluationSQLAlchemyUnitOfWork
+from app.membership.models import RoleMask
 from app.scheduling.unit_of_work import SchedulingSQLAlchemyUnitOfWork
 
 
@@ -234,6 +236,44 @@ async def test_task_team_change_role(
     assert not scheduling_team.is_manager(user_id_member)
 
 
+@pytest.mark.anyio
+async def test_membership_tracks_every_role_bit(
+    created_team: teams_models.Team,
+    teams_uow: TeamSQLAlchemyUnitOfWork,
+    tasks_uow: TaskSQLAlchemyUnitOfWork,
+    init_user
+):
+    team = created_team
+    user_id = ids.UserId(11)
+    assert team.id is not None
+    membership = tasks_uow.repos.membership
+    assert await membership.get_roles(team.id, 1) == RoleMask.ADMIN
+
+    team.add_member(user_id=user_id, role_member=role.UserRole.MEMBER)
+    team.add_member(user_id=user_id, role_member=role.UserRole.MANAGER)
+    await teams_uow.repos.team.save(team)
+    await teams_uow.commit()
+    assert await membership.get_roles(team.id, user_id) == (
+        RoleMask.MEMBER | RoleMask.MANAGER
+    )
+
+    team.change_role(user_id, role.UserRole.MEMBER, role.UserRole.ADMIN)
+    await teams_uow.repos.team.save(team)
+    await teams_uow.commit()
+    assert await membership.get_roles(team.id, user_id) == (
+        RoleMask.MANAGER | RoleMask.ADMIN
+    )
+
+    team.remove_member(user_id, role.UserRole.MANAGER)
+    team.remove_member(user_id, role.UserRole.ADMIN)
+    await teams_uow.repos.team.save(team)
+    await teams_uow.commit()
+    assert await membership.get_roles(team.id, user_id) == RoleMask(0)
+    assert [
+        m.user_id for m in await membership.get_by_team(team.id)
+    ] == [1]
+
+
 @pytest.mark.anyio
 async def test_user_updated_event_updates_projections(
     registered_event_bus,
@@ -402,3 +442,32 @@ async def test_meeting_events_sync_calendar_entries(
     member_events = await calendar_uow.repos.event.get_by_user(1001)
     assert manager_events[0].cancelled is True
     assert member_events[0].cancelled is True
+
+
+@pytest.mark.anyio
+async def test_publish_many_batches_runs_of_one_event_type(event_bus):
+    Recorded = user_event.UserRegistered | user_event.UserDeleted
+
+    class Record(EventHandler[Recorded]):
+        def __init__(self):
+            self.calls: list[list[int]] = []
+
+        async def handle(self, event: Recorded) -> None:
+            self.calls.append([event.user_id])
+
+        async def handle_many(self, events) -> None:
+            self.calls.append([event.user_id for event in events])
+
+    record = Record()
+    for event_type in (user_event.UserRegistered, user_event.UserDeleted):
+        await event_bus.subscribe(event_type, record)
+
+    await event_bus.publish_many([
+        user_event.UserRegistered(user_id=1, username="a"),
+        user_event.UserRegistered(user_id=2, username="b"),
+        user_event.UserDeleted(user_id=1),
+        user_event.UserRegistered(user_id=3, username="c"),
+    ])
+
+    assert record.calls == [[1, 2], [1], [3]]
+
@@ -0,0 +1,67 @@
+import pytest
+from fastapi import status
+
+from app.core.infrastructure.metrics import MetricsRegistry
+
+
+def test_counter_and_gauge_render_prometheus_text():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("code",))
+    pool = registry.gauge("pool_size", "Pool size.")
+    requests.inc(code="200")
+    requests.inc(2, code="200")
+    requests.inc(code="500")
+    pool.set_function(lambda: 7)
+
+    text = registry.render()
+
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{code="200"} 3' in text
+    assert 'requests_total{code="500"} 1' in text
+    assert "# TYPE pool_size gauge" in text
+    assert "pool_size 7" in text
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram(
+        "latency_seconds", "Latency.", buckets=(0.1, 1.0)
+    )
+    for value in (0.05, 0.5, 0.7, 3.0):
+        latency.observe(value)
+
+    text = registry.render()
+
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1"} 3' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "latency_seconds_count 4" in text
+    assert "latency_seconds_sum 4.25" in text
+
+
+def test_metric_rejects_wrong_labels_and_duplicates():
+    registry = MetricsRegistry()
+    counter = registry.counter("c_total", "C.", ("route",))
+    with pytest.raises(ValueError):
+        counter.inc(path="/x")
+    with pytest.raises(ValueError):
+        counter.inc(-1, route="/x")
+    with pytest.raises(ValueError):
+        registry.counter("c_total", "C.")
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_reports_route_templates(
+    authenticated_client
+):
+    await authenticated_client.get("/api/v1/teams/12345")
+
+    response = await authenticated_client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/teams/{team_id}"'
+        in response.text
+    )
+    assert "events_published_total" in response.text
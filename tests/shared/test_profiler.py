@@ -0,0 +1,85 @@
+import time
+
+import pytest
+from fastapi import status
+from sqlalchemy import update
+
+from app.core.infrastructure.profiler import ProfilerBusyError, SamplingProfiler
+from app.identity.orm_models import UserORM
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sum(range(1000))
+
+
+def test_profiler_collects_collapsed_stacks_of_package():
+    profiler = SamplingProfiler(package="tests")
+    profiler.start(seconds=5, interval=0.001)
+    _busy(0.2)
+    profiler.stop()
+
+    assert not profiler.running
+    assert profiler.samples > 0
+    assert "tests.shared.test_profiler:_busy" in profiler.collapsed()
+    first_line = profiler.collapsed().splitlines()[0]
+    stack, count = first_line.rsplit(" ", 1)
+    assert stack.endswith("_busy")
+    assert int(count) > 0
+
+
+def test_profiler_stops_after_request_budget():
+    profiler = SamplingProfiler()
+    profiler.start(requests=2)
+    with pytest.raises(ProfilerBusyError):
+        profiler.start(requests=1)
+
+    profiler.request_finished()
+    profiler.request_finished()
+    assert profiler._thread is not None
+    profiler._thread.join(timeout=1)
+
+    assert not profiler.running
+    assert profiler.requests == 2
+
+
+def test_profiler_requires_a_limit():
+    with pytest.raises(ValueError):
+        SamplingProfiler().start()
+
+
+@pytest.mark.anyio
+async def test_profiler_endpoints(test_app, client, registered_user, auth_token):
+    async with test_app.state.async_session() as session:
+        await session.execute(
+            update(UserORM)
+            .where(UserORM.id == registered_user["id"])
+            .values(is_superuser=True)
+        )
+        await session.commit()
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    start = await client.post(
+        "/api/v1/debug/profiler/start?requests=2", headers=headers
+    )
+    assert start.status_code == status.HTTP_202_ACCEPTED
+    busy = await client.post(
+        "/api/v1/debug/profiler/start?seconds=1", headers=headers
+    )
+    assert busy.status_code == status.HTTP_409_CONFLICT
+    await client.get("/api/v1/teams", headers=headers)
+    test_app.state.profiler._thread.join(timeout=1)
+
+    profile = await client.get("/api/v1/debug/profiler", headers=headers)
+    assert profile.status_code == status.HTTP_200_OK
+    assert profile.headers["x-profiler-running"] == "false"
+    assert profile.headers["x-profiler-requests"] == "2"
+
+
+@pytest.mark.anyio
+async def test_profiler_requires_superuser(authenticated_client):
+    response = await authenticated_client.post(
+        "/api/v1/debug/profiler/start?seconds=1"
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
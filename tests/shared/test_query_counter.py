@@ -0,0 +1,64 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+
+from app.core.infrastructure import query_counter
+from app.core.infrastructure.query_counter import (
+    instrument_engine,
+    query_scope,
+    statement_shape,
+)
+
+
+def test_statement_shape_ignores_literals_and_in_list_length():
+    first = statement_shape(
+        "SELECT * FROM t WHERE id IN (?, ?, ?) AND name = 'a'"
+    )
+    second = statement_shape(
+        "SELECT *  FROM t\n WHERE id IN ($1, $2) AND name = 'bb'"
+    )
+    assert first == second == "SELECT * FROM t WHERE id IN (?) AND name = ?"
+
+
+@pytest.mark.anyio
+async def test_query_scope_counts_statements_in_nested_scopes(engine):
+    instrument_engine(engine)
+    async with engine.connect() as conn:
+        with query_scope("outer") as outer:
+            await conn.execute(text("SELECT 1"))
+            with query_scope("inner") as inner:
+                await conn.execute(text("SELECT 2"))
+
+    assert outer.count == 2
+    assert inner.count == 1
+    assert outer.total_seconds >= inner.total_seconds > 0
+
+
+@pytest.mark.anyio
+async def test_query_scope_warns_on_repeated_statement(
+    engine, caplog, monkeypatch
+):
+    instrument_engine(engine)
+    monkeypatch.setattr(query_counter, "_repeat_threshold", 2)
+    caplog.set_level(logging.WARNING, logger=query_counter.__name__)
+
+    async with engine.connect() as conn:
+        with query_scope("loop"):
+            for user_id in range(3):
+                await conn.execute(
+                    text("SELECT :id"), {"id": user_id}
+                )
+
+    assert "Possible N+1 in loop" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_response_exposes_query_headers(
+    authenticated_client, assert_max_queries
+):
+    with assert_max_queries(5):
+        response = await authenticated_client.get("/api/v1/teams")
+
+    assert int(response.headers["x-db-query-count"]) >= 1
+    assert float(response.headers["x-db-query-time-ms"]) >= 0
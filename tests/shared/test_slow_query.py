@@ -0,0 +1,95 @@
+import pytest
+from fastapi import status
+from sqlalchemy import update
+
+from app.core.infrastructure.slow_query import SlowQueryLog, fingerprint
+from app.identity.orm_models import UserORM
+
+
+def test_slow_query_log_aggregates_by_fingerprint():
+    log = SlowQueryLog(threshold_ms=10)
+    log.record("SELECT * FROM t WHERE id = 1", 5, origin="GET /a")
+    log.record("SELECT * FROM t WHERE id = 2", 20, -1, origin="GET /a")
+    log.record("SELECT * FROM t WHERE id = 3", 40, -1, origin="Handler")
+    log.record("UPDATE t SET x = 1", 15, 3, origin="GET /b")
+    log.record("UPDATE t SET x = 2", 15, 0, origin="GET /b")
+
+    top = log.top()
+    assert [entry.statement for entry in top] == [
+        "SELECT * FROM t WHERE id = ?",
+        "UPDATE t SET x = ?",
+    ]
+    select_entry = top[0]
+    assert select_entry.fingerprint == fingerprint("SELECT * FROM t WHERE id = 9")
+    assert select_entry.count == 2
+    assert select_entry.total_ms == 60
+    assert select_entry.max_ms == 40
+    assert select_entry.avg_ms == 30
+    assert select_entry.rows is None
+    assert top[1].rows == 3
+    assert select_entry.origins == {"GET /a": 1, "Handler": 1}
+
+
+def test_slow_query_log_drops_cheapest_fingerprint_when_full():
+    log = SlowQueryLog(threshold_ms=0, max_entries=2)
+    log.record("SELECT a FROM t", 30)
+    log.record("SELECT b FROM t", 10)
+    log.record("SELECT c FROM t", 20)
+
+    assert [entry.statement for entry in log.top()] == [
+        "SELECT a FROM t",
+        "SELECT c FROM t",
+    ]
+
+
+def test_slow_query_log_top_honours_explicit_limit():
+    log = SlowQueryLog(threshold_ms=0, top_n=1)
+    log.record("SELECT a FROM t", 30)
+    log.record("SELECT b FROM t", 10)
+
+    assert len(log.top()) == 1
+    assert len(log.top(2)) == 2
+    assert log.top(0) == []
+
+
+@pytest.mark.anyio
+async def test_slow_queries_endpoint_requires_superuser(
+    authenticated_client
+):
+    response = await authenticated_client.get("/api/v1/debug/slow-queries")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.anyio
+async def test_slow_queries_endpoint_reports_route_origin(
+    test_app, client, registered_user, auth_token
+):
+    async with test_app.state.async_session() as session:
+        await session.execute(
+            update(UserORM)
+            .where(UserORM.id == registered_user["id"])
+            .values(is_superuser=True)
+        )
+        await session.commit()
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    await client.get("/api/v1/teams", headers=headers)
+    response = await client.get(
+        "/api/v1/debug/slow-queries", headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    origins = set()
+    for entry in response.json():
+        origins.update(entry["origins"])
+    assert "GET /api/v1/teams" in origins
+
+    negative = await client.get(
+        "/api/v1/debug/slow-queries", params={"limit": -1}, headers=headers
+    )
+    assert negative.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    reset = await client.delete(
+        "/api/v1/debug/slow-queries", headers=headers
+    )
+    assert reset.status_code == status.HTTP_204_NO_CONTENT
@@ -0,0 +1,100 @@
+import pytest
+from fastapi import status
+
+from app.core.infrastructure import tracing
+
+
+@pytest.fixture
+def span_exporter():
+    exporter = tracing.JSONSpanExporter()
+    tracing.configure(exporter)
+    yield exporter
+    tracing.configure(None)
+
+
+class Service:
+    @tracing.traced
+    async def execute(self, fail: bool = False) -> int:
+        with tracing.span("inner", step=1):
+            if fail:
+                raise ValueError("boom")
+        return 1
+
+
+@pytest.mark.anyio
+async def test_spans_nest_under_current_span(span_exporter):
+    with tracing.span("root") as root:
+        assert await Service().execute() == 1
+
+    assert root is not None
+    spans = {item.name: item for item in span_exporter.spans}
+    assert set(spans) == {"root", "Service.execute", "inner"}
+    assert spans["Service.execute"].parent_id == root.span_id
+    assert spans["inner"].parent_id == spans["Service.execute"].span_id
+    assert {item.trace_id for item in spans.values()} == {root.trace_id}
+    assert spans["inner"].attributes == {"step": 1}
+
+
+@pytest.mark.anyio
+async def test_span_records_error_status(span_exporter):
+    with pytest.raises(ValueError):
+        await Service().execute(fail=True)
+
+    statuses = {item.name: item.status for item in span_exporter.spans}
+    assert statuses == {"inner": "error", "Service.execute": "error"}
+
+
+@pytest.mark.anyio
+async def test_tracing_disabled_is_noop():
+    with tracing.span("ignored") as current:
+        assert current is None
+    assert await Service().execute() == 1
+
+
+@pytest.mark.anyio
+async def test_request_trace_covers_use_case_repository_and_handlers(
+    span_exporter, authenticated_client
+):
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    response = await authenticated_client.post(
+        "/api/v1/teams",
+        json={"team_name": "Traced"},
+        headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.headers["x-trace-id"] == trace_id
+    names = [item.name for item in span_exporter.trace(trace_id)]
+    assert names[0] == "POST /api/v1/teams"
+    assert "CreateTeamUseCase.execute" in names
+    assert "TeamSQLAlchemyUnitOfWork.commit" in names
+    assert any(name.startswith("SQLAlchemy") for name in names)
+    assert any(name.endswith("Handler.handle") for name in names)
+
+
+@pytest.mark.anyio
+async def test_opentelemetry_export_keeps_parent_links():
+    export = pytest.importorskip("opentelemetry.sdk.trace.export")
+    in_memory = pytest.importorskip(
+        "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+    )
+
+    memory = in_memory.InMemorySpanExporter()
+    tracing.configure(tracing.OpenTelemetrySpanExporter(
+        processor=export.SimpleSpanProcessor(memory)
+    ))
+    try:
+        with tracing.span("root"):
+            await Service().execute()
+    finally:
+        tracing.configure(None)
+
+    spans = {item.name: item for item in memory.get_finished_spans()}
+    root, execute, inner = (
+        spans["root"], spans["Service.execute"], spans["inner"]
+    )
+    assert root.parent is None
+    assert execute.parent is not None and inner.parent is not None
+    assert execute.parent.span_id == root.context.span_id
+    assert inner.parent.span_id == execute.context.span_id
+    assert len({item.context.trace_id for item in spans.values()}) == 1
@@ -116,3 +116,54 @@ async def test_uow_rollback_on_exception(
         )
         teams = result.scalars().all()
         assert len(teams) == 0
+
+
+@pytest.mark.anyio
+async def test_uow_borrowed_session_is_not_closed(
+    async_session_factory: async_sessionmaker[AsyncSession],
+    event_bus: EventBus
+):
+    """Test that a UoW given an external session uses it, commits on it,
+    and leaves closing to the session owner."""
+    async with async_session_factory() as session:
+        async with TeamSQLAlchemyUnitOfWork(
+            session_factory=async_session_factory,
+            bus=event_bus,
+            provider_cls=TeamRepositoryProvider,
+            session=session,
+        ) as uow:
+            assert uow.session is session
+            team_orm = mappers.TeamMapper.to_orm(
+                models.Team(id=None, name="Shared", members=[])
+            )
+            uow.session.add(team_orm)
+            await uow.commit()
+
+        # Session is still usable after the UoW exits
+        result = await session.execute(select(orm_models.TeamOrm))
+        assert [t.name for t in result.scalars().all()] == ["Shared"]
+
+
+@pytest.mark.anyio
+async def test_uow_borrowed_session_rolls_back_on_exception(
+    async_session_factory: async_sessionmaker[AsyncSession],
+    event_bus: EventBus
+):
+    """Test that the UoW still owns the transaction on a borrowed session."""
+    async with async_session_factory() as session:
+        with pytest.raises(ValueError):
+            async with TeamSQLAlchemyUnitOfWork(
+                session_factory=async_session_factory,
+                bus=event_bus,
+                provider_cls=TeamRepositoryProvider,
+                session=session,
+            ) as uow:
+                uow.session.add(
+                    mappers.TeamMapper.to_orm(
+                        models.Team(id=None, name="Lost", members=[])
+                    )
+                )
+                raise ValueError("Test exception")
+
+        result = await session.execute(select(orm_models.TeamOrm))
+        assert result.scalars().all() == []
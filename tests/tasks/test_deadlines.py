@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.custom_types import task_status
+from app.core.infrastructure.event import DomainEvent, EventHandler
+from app.core.shared.events import tasks as task_event
+from app.tasks import handlers, orm_models
+from app.tasks.deadlines import DeadlineScheduler
+from app.tasks.unit_of_work import (
+    TaskRepositoryProvider,
+    TaskSQLAlchemyUnitOfWork,
+)
+
+
+NOW = datetime(2030, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class _Collect(EventHandler[DomainEvent]):
+    def __init__(self):
+        self.events: list[DomainEvent] = []
+
+    async def handle(self, event: DomainEvent) -> None:
+        self.events.append(event)
+
+
+@pytest.fixture
+async def fired(event_bus):
+    collect = _Collect()
+    await event_bus.subscribe(task_event.TaskDeadlineApproaching, collect)
+    await event_bus.subscribe(task_event.TaskOverdue, collect)
+    return collect.events
+
+
+def _scheduler(async_session_factory, event_bus) -> DeadlineScheduler:
+    return DeadlineScheduler(
+        TaskSQLAlchemyUnitOfWork(
+            async_session_factory, event_bus, TaskRepositoryProvider
+        ),
+        lead=timedelta(hours=1),
+        horizon=timedelta(hours=2),
+        catch_up=timedelta(hours=1),
+    )
+
+
+async def _add_tasks(async_session_factory, *rows: dict) -> None:
+    async with async_session_factory() as session:
+        session.add_all([
+            orm_models.TaskOrm(
+                supervisor_id=10, executor_id=20, team_id=30,
+                title="Task", description="Desc", **row,
+            )
+            for row in rows
+        ])
+        await session.commit()
+
+
+@pytest.mark.anyio
+async def test_each_timer_fires_once_across_workers(
+        async_session_factory, event_bus, fired
+):
+    await _add_tasks(
+        async_session_factory,
+        {"id": 1, "deadline": NOW + timedelta(minutes=30)},
+        {"id": 2, "deadline": NOW + timedelta(minutes=30),
+         "status": task_status.TaskStatus.DONE},
+        {"id": 3, "deadline": NOW + timedelta(minutes=30), "deleted": True},
+        {"id": 4, "deadline": NOW + timedelta(days=3)},
+    )
+    workers = [
+        _scheduler(async_session_factory, event_bus) for _ in range(2)
+    ]
+    for worker in workers:
+        await worker.load(NOW)
+        assert len(worker) == 2
+
+    for now in (NOW, NOW + timedelta(minutes=31)):
+        for worker in workers:
+            await worker.fire_due(now)
+
+    assert [(type(event), event.task_id) for event in fired] == [
+        (task_event.TaskDeadlineApproaching, 1),
+        (task_event.TaskOverdue, 1),
+    ]
+    assert fired[1].deadline == NOW + timedelta(minutes=30)
+
+
+@pytest.mark.anyio
+async def test_task_events_rearm_and_cancel_timers(
+        async_session_factory, event_bus, fired
+):
+    await _add_tasks(
+        async_session_factory,
+        {"id": 1, "deadline": NOW + timedelta(minutes=30)},
+        {"id": 2, "deadline": NOW + timedelta(minutes=40)},
+    )
+    scheduler = _scheduler(async_session_factory, event_bus)
+    rearm = handlers.DeadlineTimerHandler(scheduler)
+    await scheduler.load(NOW)
+
+    def updated(task_id: int, status: str) -> task_event.TaskUpdated:
+        return task_event.TaskUpdated(
+            task_id=task_id, team_id=30, supervisor_id=10, executor_id=20,
+            status=status, deadline=NOW + timedelta(minutes=40),
+        )
+
+    await rearm.handle(updated(1, "done"))
+    await rearm.handle(updated(2, "in_progress"))
+    for now in (NOW, NOW + timedelta(hours=1)):
+        await scheduler.fire_due(now)
+
+    assert [(type(event), event.task_id) for event in fired] == [
+        (task_event.TaskDeadlineApproaching, 2),
+        (task_event.TaskOverdue, 2),
+    ]
+
+
+@pytest.mark.anyio
+async def test_timer_skips_task_finished_elsewhere(
+        async_session_factory, event_bus, fired
+):
+    await _add_tasks(
+        async_session_factory,
+        {"id": 1, "deadline": NOW + timedelta(minutes=90)},
+    )
+    scheduler = _scheduler(async_session_factory, event_bus)
+    await scheduler.load(NOW)
+    async with async_session_factory() as session:
+        task = await session.get(orm_models.TaskOrm, 1)
+        task.status = task_status.TaskStatus.DONE
+        await session.commit()
+
+    await scheduler.fire_due(NOW + timedelta(hours=2))
+
+    assert fired == []
@@ -0,0 +1,89 @@
+import json
+import os
+import tracemalloc
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import insert
+
+from app.tasks import export, orm_models
+from app.tasks.unit_of_work import (
+    TaskRepositoryProvider,
+    TaskSQLAlchemyUnitOfWork,
+)
+
+
+# 1_000_000 reproduces the full-size check; the default keeps the suite
+# fast while still far above what fits under the ceiling if materialised.
+ROWS = int(os.environ.get("EXPORT_MEMORY_TEST_ROWS", 20_000))
+MEMORY_CEILING = 8 * 1024 * 1024
+
+
+def _uow(async_session_factory, event_bus) -> TaskSQLAlchemyUnitOfWork:
+    return TaskSQLAlchemyUnitOfWork(
+        async_session_factory, event_bus, TaskRepositoryProvider
+    )
+
+
+@pytest.mark.anyio
+async def test_export_encodes_tasks_then_comments(
+        async_session_factory, event_bus
+):
+    deadline = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    async with async_session_factory() as session:
+        session.add_all([
+            orm_models.TaskOrm(
+                id=1, supervisor_id=10, executor_id=None, team_id=30,
+                deadline=deadline, title="Plan", description='Say "hi", go',
+            ),
+            orm_models.TaskOrm(
+                id=2, supervisor_id=10, team_id=31, deadline=deadline,
+                title="Other team", description="-",
+            ),
+            orm_models.CommentOrm(id=5, author_id=11, task_id=1, text="ok"),
+        ])
+        await session.commit()
+
+    records = export.export_records(_uow(async_session_factory, event_bus), 30)
+    lines = "".join([
+        chunk async for chunk in export.encode(records, "ndjson")
+    ]).splitlines()
+
+    rows = [json.loads(line) for line in lines]
+    assert [(row["record"], row["id"]) for row in rows] == [
+        ("task", 1), ("comment", 5),
+    ]
+    assert rows[0]["status"] == "open"
+    assert rows[0]["description"] == 'Say "hi", go'
+    assert rows[1]["team_id"] == 30
+
+
+@pytest.mark.anyio
+async def test_export_memory_stays_flat(async_session_factory, event_bus):
+    deadline = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    row = {
+        "supervisor_id": 10, "executor_id": 20, "team_id": 30,
+        "deadline": deadline, "title": "Task", "description": "x" * 100,
+    }
+    async with async_session_factory() as session:
+        for start in range(0, ROWS, 50_000):
+            await session.execute(
+                insert(orm_models.TaskOrm),
+                [row] * min(50_000, ROWS - start),
+            )
+        await session.commit()
+
+    exported = 0
+    tracemalloc.start()
+    try:
+        records = export.export_records(
+            _uow(async_session_factory, event_bus), 30
+        )
+        async for chunk in export.encode(records, "csv"):
+            exported += chunk.count("\n")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert exported == ROWS + 1
+    assert peak < MEMORY_CEILING
@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.custom_types import ids
+from app.core.infrastructure.event import EventHandler
+from app.core.shared.events import tasks as task_event
+from app.membership.models import RoleMask
+from app.tasks import importer, models, orm_models, use_cases
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+class _Batches(EventHandler[task_event.TaskCreated]):
+    def __init__(self):
+        self.sizes: list[int] = []
+
+    async def handle(self, event: task_event.TaskCreated) -> None:
+        self.sizes.append(1)
+
+    async def handle_many(self, events) -> None:
+        self.sizes.append(len(events))
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("size", [1, 7, 4096])
+async def test_csv_rows_parse_records_split_across_chunks(size):
+    data = (
+        '\ufeffteam_id,title,description\r\n'
+        '1,Plan,"Line one\r\nsaid ""hi"", then left"\r\n'
+        '\r\n'
+        '2,Ship,Plain'
+    ).encode()
+
+    rows = [row async for row in importer.csv_rows(_chunks(data, size))]
+
+    assert rows == [
+        {"team_id": "1", "title": "Plan",
+         "description": 'Line one\r\nsaid "hi", then left'},
+        {"team_id": "2", "title": "Ship", "description": "Plain"},
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("max_size", [importer.MAX_RECORD_SIZE, 30])
+async def test_csv_rows_report_a_stray_quote_and_resync(
+        monkeypatch, max_size
+):
+    monkeypatch.setattr(importer, "MAX_RECORD_SIZE", max_size)
+    data = (
+        "team_id,title,description\n"
+        "1,One,ok\n"
+        '2,"Two,broken\n'
+        "3,Three,ok\n"
+        "4,Four,ok\n"
+        "5,Five,ok\n"
+        "6,Six,ok\n"
+        + "7,Seven," + "x" * 40 + "\n"
+        "8,Eight,ok"
+    ).encode()
+
+    rows = [row async for row in importer.csv_rows(_chunks(data, 7))]
+
+    titles = [
+        "malformed" if use_cases.IMPORT_ROW_ERROR in row else row["title"]
+        for row in rows
+    ]
+    expected = ["One", "malformed", "Three", "Four", "Five", "Six"]
+    expected += ["Seven"] if max_size > 100 else ["malformed"]
+    assert titles == expected + ["Eight"]
+    assert rows[1][use_cases.IMPORT_ROW_ERROR].startswith("Malformed record")
+
+
+@pytest.mark.anyio
+async def test_import_commits_chunks_and_reports_bad_rows(
+        tasks_uow, event_bus
+):
+    batches = _Batches()
+    await event_bus.subscribe(task_event.TaskCreated, batches)
+    for team_id in (30, 31):
+        await tasks_uow.repos.team.save(
+            models.Team(id=ids.TeamId(team_id), members=[])
+        )
+    await tasks_uow.repos.membership.grant(30, [(10, RoleMask.MANAGER)])
+    await tasks_uow.repos.membership.grant(31, [(10, RoleMask.MEMBER)])
+    await tasks_uow.session.commit()
+
+    future = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    past = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+    good = {"team_id": "30", "title": "Task", "description": "-",
+            "deadline": future}
+    rows = [
+        good, good,
+        {**good, "deadline": past},
+        {**good, "deadline": "2030-01-01T12:00:00"},
+        good,
+        {**good, "team_id": "99"},
+        {**good, "team_id": "31"},
+        {**good, "title": ""},
+        {"record": "comment", "text": "skipped"},
+        good, good,
+        {use_cases.IMPORT_ROW_ERROR: "Malformed record"},
+    ]
+
+    async def source():
+        for row in rows:
+            yield row
+
+    report = await use_cases.ImportTaskUseCase(tasks_uow).execute(
+        actor_user_id=10, rows=source(), chunk_size=2
+    )
+
+    assert report.imported == 5
+    assert report.failed == 6
+    assert [error.row for error in report.errors] == [3, 4, 6, 7, 8, 12]
+    assert report.errors[0].error == "The deadline can't be in the past."
+    assert report.errors[2].error == "Team 99 not found"
+    assert report.errors[4].error.startswith("title:")
+    assert report.errors[5].error == "Malformed record"
+    assert batches.sizes == [2, 2, 1]
+    count = await tasks_uow.session.scalar(
+        select(func.count()).select_from(orm_models.TaskOrm)
+    )
+    assert count == 5
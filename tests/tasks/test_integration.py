@@ -1,8 +1,13 @@
+import csv
+import io
+import json
 from datetime import datetime, timezone, timedelta
 
 import pytest
 from fastapi import status
 
+from app.core.infrastructure import metrics
+
 
 async def _register_and_login(client, idx: int) -> tuple[int, str]:
     email = f"task_user_{idx}@example.com"
@@ -267,4 +272,468 @@ async def test_comments_allowed_only_for_team_members(client):
         headers={"Authorization": f"Bearer {manager_token}"},
     )
     assert list_response.status_code == status.HTTP_200_OK
-    assert len(list_response.json()) == 1
+    assert len(list_response.json()["items"]) == 1
+    assert list_response.json()["next_cursor"] is None
+
+
+@pytest.mark.anyio
+async def test_task_creation_increments_domain_counter(client):
+    _, admin_token = await _register_and_login(client, 90)
+    manager_id, manager_token = await _register_and_login(client, 91)
+    team_id = await _create_team(client, admin_token, "Metrics Team")
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=manager_id,
+        role="manager",
+    )
+    before = metrics.tasks_created_total.value()
+
+    response = await client.post(
+        "/api/v1/tasks",
+        json={
+            "team_id": team_id,
+            "title": "Count me",
+            "description": "Counted by metrics",
+            "deadline": (
+                datetime.now(timezone.utc) + timedelta(days=1)
+            ).isoformat(),
+        },
+        headers={"Authorization": f"Bearer {manager_token}"},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert metrics.tasks_created_total.value() == before + 1
+
+
+@pytest.mark.anyio
+async def test_search_ranks_matches_and_filters_by_access(client):
+    _, admin_token = await _register_and_login(client, 60)
+    manager_id, manager_token = await _register_and_login(client, 61)
+    _, outsider_token = await _register_and_login(client, 62)
+    team_id = await _create_team(client, admin_token, "Task Team Search")
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=manager_id,
+        role="manager",
+    )
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    deadline = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    task_ids = []
+    for title, description in (
+        ("Migrate database", "Move the invoices to the new cluster"),
+        ("Write release notes", "Mention the database migration"),
+        ("Plan offsite", "Book a venue"),
+    ):
+        response = await client.post("/api/v1/tasks", json={
+            "team_id": team_id,
+            "title": title,
+            "description": description,
+            "deadline": deadline,
+        }, headers=headers)
+        task_ids.append(response.json()["id"])
+    await client.post(
+        f"/api/v1/tasks/{task_ids[2]}/comments",
+        json={"text": "Needs a database of venues"},
+        headers=headers,
+    )
+    await client.patch(
+        f"/api/v1/tasks/{task_ids[1]}",
+        json={"title": "Write changelog"},
+        headers=headers,
+    )
+
+    response = await client.get(
+        "/api/v1/tasks/search", params={"q": "Database"}, headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] == 3
+    # Title match first, comment match last.
+    assert [item["id"] for item in data["items"]] == task_ids
+    ranks = [item["rank"] for item in data["items"]]
+    assert ranks == sorted(ranks, reverse=True)
+
+    page = (await client.get(
+        "/api/v1/tasks/search",
+        params={"q": "database", "limit": 1, "offset": 1},
+        headers=headers,
+    )).json()
+    assert [item["id"] for item in page["items"]] == [task_ids[1]]
+    assert page["total"] == 3
+
+    both_words = (await client.get(
+        "/api/v1/tasks/search",
+        params={"q": "migrate database", "team_id": team_id},
+        headers=headers,
+    )).json()
+    assert [item["id"] for item in both_words["items"]] == [task_ids[0]]
+
+    renamed = (await client.get(
+        "/api/v1/tasks/search", params={"q": "changelog"}, headers=headers
+    )).json()
+    assert [item["id"] for item in renamed["items"]] == [task_ids[1]]
+
+    outsider_headers = {"Authorization": f"Bearer {outsider_token}"}
+    hidden = (await client.get(
+        "/api/v1/tasks/search", params={"q": "database"},
+        headers=outsider_headers,
+    )).json()
+    assert hidden == {"items": [], "total": 0, "limit": 20, "offset": 0}
+    hidden_in_team = (await client.get(
+        "/api/v1/tasks/search",
+        params={"q": "database", "team_id": team_id},
+        headers=outsider_headers,
+    )).json()
+    assert hidden_in_team["items"] == []
+    assert hidden_in_team["total"] == 0
+
+    # Executors keep reading their task after leaving the team, with or
+    # without the team filter.
+    executor_id, executor_token = await _register_and_login(client, 63)
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=executor_id,
+        role="member",
+    )
+    await client.post(
+        f"/api/v1/tasks/{task_ids[0]}/executor/{executor_id}",
+        headers=headers,
+    )
+    await client.delete(
+        f"/api/v1/teams/{team_id}/members/{executor_id}",
+        params={"role": "member"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    executor_headers = {"Authorization": f"Bearer {executor_token}"}
+    for params in ({}, {"team_id": team_id}):
+        found = await client.get(
+            "/api/v1/tasks/search",
+            params={"q": "database", **params},
+            headers=executor_headers,
+        )
+        assert found.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in found.json()["items"]] == [
+            task_ids[0]
+        ]
+
+
+@pytest.mark.anyio
+async def test_task_stats_follow_status_executor_and_delete(client):
+    _, admin_token = await _register_and_login(client, 70)
+    manager_id, manager_token = await _register_and_login(client, 71)
+    member_id, _ = await _register_and_login(client, 72)
+    _, outsider_token = await _register_and_login(client, 73)
+    team_id = await _create_team(client, admin_token, "Task Team Stats")
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=manager_id,
+        role="manager",
+    )
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=member_id,
+        role="member",
+    )
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    deadline = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    task_ids = []
+    for number in range(3):
+        response = await client.post("/api/v1/tasks", json={
+            "team_id": team_id,
+            "title": f"Stats task {number}",
+            "description": "Desc",
+            "deadline": deadline,
+        }, headers=headers)
+        task_ids.append(response.json()["id"])
+    await client.post(
+        f"/api/v1/tasks/{task_ids[0]}/executor/{member_id}", headers=headers
+    )
+    await client.patch(
+        f"/api/v1/tasks/{task_ids[0]}",
+        json={"status": "in_progress"},
+        headers=headers,
+    )
+    await client.patch(
+        f"/api/v1/tasks/{task_ids[1]}", json={"status": "done"},
+        headers=headers,
+    )
+    await client.patch(
+        f"/api/v1/tasks/{task_ids[2]}", json={"deleted": True},
+        headers=headers,
+    )
+
+    team_stats = await client.get(
+        "/api/v1/tasks/stats", params={"team_id": team_id}, headers=headers
+    )
+    executor_stats = (await client.get(
+        "/api/v1/tasks/stats",
+        params={"team_id": team_id, "executor_id": member_id},
+        headers=headers,
+    )).json()
+
+    assert team_stats.status_code == status.HTTP_200_OK
+    assert team_stats.json() == {
+        "team_id": team_id,
+        "executor_id": None,
+        "open": 0,
+        "in_progress": 1,
+        "done": 1,
+        "overdue": 0,
+        "total": 2,
+    }
+    assert executor_stats["in_progress"] == 1
+    assert executor_stats["total"] == 1
+
+    for token in (outsider_token, admin_token):
+        forbidden = await client.get(
+            "/api/v1/tasks/stats",
+            params={"team_id": team_id},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.anyio
+async def test_bulk_create_and_update_tasks(client):
+    _, admin_token = await _register_and_login(client, 80)
+    manager_id, manager_token = await _register_and_login(client, 81)
+    member_id, member_token = await _register_and_login(client, 82)
+    team_id = await _create_team(client, admin_token, "Task Team Bulk")
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=manager_id,
+        role="manager",
+    )
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=member_id,
+        role="member",
+    )
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    deadline = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    items = [
+        {
+            "team_id": team_id,
+            "title": f"Sprint task {number}",
+            "description": "Desc",
+            "deadline": deadline,
+        }
+        for number in range(5)
+    ]
+
+    created = await client.post(
+        "/api/v1/tasks/bulk", json={"tasks": items}, headers=headers
+    )
+
+    assert created.status_code == status.HTTP_201_CREATED
+    task_ids = [item["id"] for item in created.json()["items"]]
+    assert len(set(task_ids)) == 5
+    assert [item["title"] for item in created.json()["items"]] == [
+        f"Sprint task {number}" for number in range(5)
+    ]
+
+    updated = await client.patch("/api/v1/tasks/bulk", json={"tasks": [
+        {"task_id": task_ids[2], "deleted": True},
+        {"task_id": task_ids[0], "status": "done"},
+        {"task_id": task_ids[1], "status": "in_progress", "title": "Renamed"},
+        {"task_id": task_ids[2], "title": "Gone"},
+    ]}, headers=headers)
+
+    assert updated.status_code == status.HTTP_200_OK
+    items = updated.json()["items"]
+    assert [item["id"] for item in items] == [
+        task_ids[2], task_ids[0], task_ids[1],
+    ]
+    assert (items[0]["title"], items[0]["deleted"]) == ("Gone", True)
+    assert items[2]["title"] == "Renamed"
+    stats = (await client.get(
+        "/api/v1/tasks/stats", params={"team_id": team_id}, headers=headers
+    )).json()
+    assert (stats["open"], stats["in_progress"], stats["done"]) == (2, 1, 1)
+    fetched = (await client.get(
+        f"/api/v1/tasks/{task_ids[1]}", headers=headers
+    )).json()
+    assert fetched["status"] == "in_progress"
+
+    forbidden = await client.post(
+        "/api/v1/tasks/bulk",
+        json={"tasks": items},
+        headers={"Authorization": f"Bearer {member_token}"},
+    )
+    assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+    missing = await client.patch("/api/v1/tasks/bulk", json={"tasks": [
+        {"task_id": task_ids[3], "status": "done"},
+        {"task_id": 999_999, "status": "done"},
+    ]}, headers=headers)
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+    stats = (await client.get(
+        "/api/v1/tasks/stats", params={"team_id": team_id}, headers=headers
+    )).json()
+    assert stats["total"] == 4
+
+
+@pytest.mark.anyio
+async def test_export_streams_team_tasks_and_comments(client):
+    _, admin_token = await _register_and_login(client, 90)
+    manager_id, manager_token = await _register_and_login(client, 91)
+    _, outsider_token = await _register_and_login(client, 92)
+    team_id = await _create_team(client, admin_token, "Task Team Export")
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=manager_id,
+        role="manager",
+    )
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    deadline = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    task_id = (await client.post("/api/v1/tasks", json={
+        "team_id": team_id,
+        "title": "Export me",
+        "description": "Line one, with comma",
+        "deadline": deadline,
+    }, headers=headers)).json()["id"]
+    await client.post(
+        f"/api/v1/tasks/{task_id}/comments",
+        json={"text": "first"},
+        headers=headers,
+    )
+
+    response = await client.get(
+        "/api/v1/tasks/export", params={"team_id": team_id}, headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["record"], row["title"], row["text"]) for row in rows] == [
+        ("task", "Export me", ""),
+        ("comment", "", "first"),
+    ]
+    assert rows[0]["description"] == "Line one, with comma"
+
+    ndjson = await client.get(
+        "/api/v1/tasks/export",
+        params={"team_id": team_id, "format": "ndjson"},
+        headers=headers,
+    )
+    assert [
+        json.loads(line)["record"] for line in ndjson.text.splitlines()
+    ] == ["task", "comment"]
+
+    forbidden = await client.get(
+        "/api/v1/tasks/export",
+        params={"team_id": team_id},
+        headers={"Authorization": f"Bearer {outsider_token}"},
+    )
+    assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+
+
+
+@pytest.mark.anyio
+async def test_import_creates_tasks_from_csv_body(client):
+    _, admin_token = await _register_and_login(client, 93)
+    manager_id, manager_token = await _register_and_login(client, 94)
+    team_id = await _create_team(client, admin_token, "Task Team Import")
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=manager_id,
+        role="manager",
+    )
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    deadline = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    body = (
+        "team_id,title,description,deadline\n"
+        f'{team_id},Imported,"Multi\nline",{deadline}\n'
+        f"{team_id},Late,-,2000-01-01T00:00:00+00:00\n"
+    )
+
+    response = await client.post(
+        "/api/v1/tasks/import",
+        content=body.encode(),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "imported": 1,
+        "failed": 1,
+        "errors": [
+            {"row": 2, "error": "The deadline can't be in the past."},
+        ],
+    }
+    listed = await client.get(
+        "/api/v1/tasks", params={"team_id": team_id}, headers=headers
+    )
+    assert [
+        (item["title"], item["description"])
+        for item in listed.json()["items"]
+    ] == [("Imported", "Multi\nline")]
+
+
+@pytest.mark.anyio
+async def test_comments_are_paged_with_cursor(client):
+    _, admin_token = await _register_and_login(client, 95)
+    manager_id, manager_token = await _register_and_login(client, 96)
+    team_id = await _create_team(client, admin_token, "Task Team Comments")
+    await _add_member(
+        client,
+        team_id=team_id,
+        admin_token=admin_token,
+        member_id=manager_id,
+        role="manager",
+    )
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    deadline = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    task_id = (await client.post("/api/v1/tasks", json={
+        "team_id": team_id,
+        "title": "Chatty",
+        "description": "Many comments",
+        "deadline": deadline,
+    }, headers=headers)).json()["id"]
+    for number in range(3):
+        await client.post(
+            f"/api/v1/tasks/{task_id}/comments",
+            json={"text": f"comment {number}"},
+            headers=headers,
+        )
+    url = f"/api/v1/tasks/{task_id}/comments"
+
+    first = (await client.get(url, params={"limit": 2}, headers=headers)).json()
+    second = (await client.get(
+        url, params={"limit": 2, "cursor": first["next_cursor"]},
+        headers=headers,
+    )).json()
+    future = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+    newer = (await client.get(
+        url, params={"since": future}, headers=headers
+    )).json()
+
+    assert [item["text"] for item in first["items"]] == [
+        "comment 0", "comment 1",
+    ]
+    assert [item["text"] for item in second["items"]] == ["comment 2"]
+    assert second["next_cursor"] is None
+    assert newer == {"items": [], "next_cursor": None}
+
+    unknown = await client.get(
+        url, params={"cursor": 10_000}, headers=headers
+    )
+    assert unknown.status_code == status.HTTP_400_BAD_REQUEST
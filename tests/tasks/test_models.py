@@ -108,3 +108,28 @@ class TestTask:
                 task.id, "text", ids.CommentId(1)
             )
             assert comment.id == ids.CommentId(1)
+
+
+class TestTeam:
+
+    def test_membership_index_follows_changes(self):
+        team_id, user_id = ids.TeamId(1), ids.UserId(2)
+        team = tasks_models.Team(team_id, [])
+
+        team.add_member(user_id, role.UserTaskRole.MEMBER)
+        assert team.is_member(user_id)
+        assert team.has_member(user_id, role.UserTaskRole.MEMBER)
+
+        team.change_role(
+            user_id, role.UserTaskRole.MEMBER, role.UserTaskRole.MANAGER
+        )
+        assert not team.has_member(user_id, role.UserTaskRole.MEMBER)
+        assert team.get_member(user_id, role.UserTaskRole.MANAGER) == (
+            tasks_models.MemberTask(
+                user_id, team_id, role.UserTaskRole.MANAGER
+            )
+        )
+
+        team.remove_member(user_id, role.UserTaskRole.MANAGER)
+        assert not team.is_member(user_id)
+        assert team.members == ()
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import select
 
 from app.tasks import (
@@ -9,7 +9,8 @@ from app.tasks import (
 )
 from app.tasks.unit_of_work import TaskSQLAlchemyUnitOfWork
 
-from app.core.custom_types import ids, role
+from app.core.custom_types import ids, role, task_status
+from app.membership.models import RoleMask
 
 
 @pytest.mark.anyio
@@ -52,250 +53,6 @@ async def test_get_user(tasks_uow: TaskSQLAlchemyUnitOfWork):
     assert user_1.username == "leonya"
 
 
-@pytest.mark.anyio
-async def test_save_creates_new_member(tasks_uow: TaskSQLAlchemyUnitOfWork):
-    repo = tasks_uow.repos.member
-    async_session = tasks_uow.session
-
-    member = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-
-    await repo.save(member)
-    await async_session.commit()
-
-    result = await async_session.execute(
-        select(orm_models.TaskMemberOrm)
-        .where(
-            orm_models.TaskMemberOrm.user_id == 1,
-            orm_models.TaskMemberOrm.team_id == 1
-        )
-    )
-    orm_member = result.scalar_one()
-
-    assert orm_member.user_id == 1
-    assert orm_member.team_id == 1
-    assert orm_member.role == role.UserTaskRole.MEMBER
-
-
-@pytest.mark.anyio
-async def test_save_updates_existing_member(
-        tasks_uow: TaskSQLAlchemyUnitOfWork
-):
-    repo = tasks_uow.repos.member
-    async_session = tasks_uow.session
-
-    member = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-
-    await repo.save(member)
-    await async_session.commit()
-
-    same_member = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-
-    await repo.save(same_member)
-    await async_session.commit()
-
-    result = await async_session.execute(
-        select(orm_models.TaskMemberOrm)
-        .where(
-            orm_models.TaskMemberOrm.user_id == 1,
-            orm_models.TaskMemberOrm.team_id == 1,
-            orm_models.TaskMemberOrm.role == role.UserTaskRole.MEMBER
-        )
-    )
-    all_members = result.scalars().all()
-    assert len(all_members) == 1
-
-
-@pytest.mark.anyio
-async def test_save_creates_multiple_roles_for_same_user_and_team(
-        tasks_uow: TaskSQLAlchemyUnitOfWork
-):
-    """We check that a user can have multiple roles in one team"""
-    repo = tasks_uow.repos.member
-    async_session = tasks_uow.session
-
-    member1 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-    await repo.save(member1)
-
-    member2 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MANAGER
-    )
-    await repo.save(member2)
-    await async_session.commit()
-
-    members = await repo.get_by_user_and_team(1, 1)
-
-    assert len(members) == 2
-    roles = {member.role for member in members}
-    assert roles == {role.UserTaskRole.MEMBER, role.UserTaskRole.MANAGER}
-
-
-@pytest.mark.anyio
-async def test_get_by_user_returns_all_roles(
-        tasks_uow: TaskSQLAlchemyUnitOfWork
-):
-    """We check that get_by_user returns all user roles in all commands"""
-    repo = tasks_uow.repos.member
-    async_session = tasks_uow.session
-
-    member1 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-    member2 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MANAGER
-    )
-    member3 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(2),
-        role=role.UserTaskRole.MEMBER
-    )
-
-    await repo.save(member1)
-    await repo.save(member2)
-    await repo.save(member3)
-    await async_session.commit()
-
-    members = await repo.get_by_user(1)
-
-    assert len(members) == 3
-
-
-@pytest.mark.anyio
-async def test_get_by_user(tasks_uow: TaskSQLAlchemyUnitOfWork):
-    repo = tasks_uow.repos.member
-    async_session = tasks_uow.session
-
-    member1 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-    member2 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(2),
-        role=role.UserTaskRole.MANAGER
-    )
-
-    await repo.save(member1)
-    await repo.save(member2)
-    await async_session.commit()
-
-    members = await repo.get_by_user(1)
-
-    assert len(members) == 2
-    assert all(member.user_id == 1 for member in members)
-    team_ids = {member.team_id for member in members}
-    assert team_ids == {1, 2}
-
-
-@pytest.mark.anyio
-async def test_get_by_user_empty_result(tasks_uow: TaskSQLAlchemyUnitOfWork):
-    repo = tasks_uow.repos.member
-
-    members = await repo.get_by_user(999)
-
-    assert members == []
-
-
-@pytest.mark.anyio
-async def test_get_by_user_and_team(tasks_uow: TaskSQLAlchemyUnitOfWork):
-    repo = tasks_uow.repos.member
-    async_session = tasks_uow.session
-
-    member = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-
-    await repo.save(member)
-    await async_session.commit()
-
-    members = await repo.get_by_user_and_team(1, 1)
-
-    assert len(members) == 1
-    assert members[0].user_id == 1
-    assert members[0].team_id == 1
-    assert members[0].role == role.UserTaskRole.MEMBER
-
-
-@pytest.mark.anyio
-async def test_get_by_user_and_team_empty_result(
-        tasks_uow: TaskSQLAlchemyUnitOfWork
-):
-    repo = tasks_uow.repos.member
-    async_session = tasks_uow.session
-
-    member = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-
-    await repo.save(member)
-    await async_session.commit()
-
-    members = await repo.get_by_user_and_team(1, 999)
-
-    assert members == []
-
-
-@pytest.mark.anyio
-async def test_get_by_user_and_team_filters_correctly(
-        tasks_uow: TaskSQLAlchemyUnitOfWork
-):
-    repo = tasks_uow.repos.member
-    async_session = tasks_uow.session
-
-    member1 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-    member2 = models.MemberTask(
-        user_id=ids.UserId(1),
-        team_id=ids.TeamId(2),
-        role=role.UserTaskRole.MANAGER
-    )
-    member3 = models.MemberTask(
-        user_id=ids.UserId(2),
-        team_id=ids.TeamId(1),
-        role=role.UserTaskRole.MEMBER
-    )
-
-    await repo.save(member1)
-    await repo.save(member2)
-    await repo.save(member3)
-    await async_session.commit()
-
-    members = await repo.get_by_user_and_team(1, 1)
-
-    assert len(members) == 1
-    assert members[0].user_id == 1
-    assert members[0].team_id == 1
-
-
 @pytest.mark.anyio
 async def test_save_creates_new_team(
         tasks_uow: TaskSQLAlchemyUnitOfWork
@@ -368,18 +125,10 @@ async def test_get_by_id_returns_team(tasks_uow: TaskSQLAlchemyUnitOfWork):
     repo = tasks_uow.repos.team
     async_session = tasks_uow.session
 
-    team = models.Team(
-        id=ids.TeamId(200),
-        members=[
-            models.MemberTask(
-                user_id=ids.UserId(1),
-                team_id=ids.TeamId(200),
-                role=role.UserTaskRole.MANAGER
-            )
-        ]
-    )
+    team = models.Team(id=ids.TeamId(200), members=[])
 
     await repo.save(team)
+    await tasks_uow.repos.membership.grant(200, [(1, RoleMask.MANAGER)])
     await async_session.commit()
 
     found_team = await repo.get_by_id(200)
@@ -403,44 +152,29 @@ async def test_get_by_id_returns_none_if_not_found(
 
 
 @pytest.mark.anyio
-async def test_save_team_with_multiple_members(
+async def test_get_by_id_reads_members_from_membership(
         tasks_uow: TaskSQLAlchemyUnitOfWork
 ):
     repo = tasks_uow.repos.team
     async_session = tasks_uow.session
 
-    team = models.Team(
-        id=ids.TeamId(300),
-        members=[
-            models.MemberTask(
-                user_id=ids.UserId(1),
-                team_id=ids.TeamId(300),
-                role=role.UserTaskRole.MANAGER
-            ),
-            models.MemberTask(
-                user_id=ids.UserId(2),
-                team_id=ids.TeamId(300),
-                role=role.UserTaskRole.MEMBER
-            ),
-            models.MemberTask(
-                user_id=ids.UserId(3),
-                team_id=ids.TeamId(300),
-                role=role.UserTaskRole.MEMBER
-            )
-        ]
-    )
-
-    await repo.save(team)
+    await repo.save(models.Team(id=ids.TeamId(300), members=[]))
+    await tasks_uow.repos.membership.grant(300, [
+        (1, RoleMask.MANAGER | RoleMask.MEMBER),
+        (2, RoleMask.MEMBER),
+        (3, RoleMask.ADMIN),
+    ])
     await async_session.commit()
 
     found_team = await repo.get_by_id(300)
 
     assert found_team is not None
     assert found_team.id == 300
-    assert len(found_team.members) == 3
-
-    user_ids = {member.user_id for member in found_team.members}
-    assert user_ids == {1, 2, 3}
+    assert {(m.user_id, m.role) for m in found_team.members} == {
+        (1, role.UserTaskRole.MEMBER),
+        (1, role.UserTaskRole.MANAGER),
+        (2, role.UserTaskRole.MEMBER),
+    }
 
 
 @pytest.mark.anyio
@@ -523,7 +257,7 @@ async def test_save_creates_new_comment(tasks_uow: TaskSQLAlchemyUnitOfWork):
 
 
 @pytest.mark.anyio
-async def test_get_by_task_id_returns_comments(
+async def test_get_page_by_task_returns_task_comments(
         tasks_uow: TaskSQLAlchemyUnitOfWork
 ):
     repo = tasks_uow.repos.comment
@@ -554,7 +288,7 @@ async def test_get_by_task_id_returns_comments(
     await repo.save(comment_other_task)
     await async_session.commit()
 
-    comments = await repo.get_by_task_id(10)
+    comments = await repo.get_page_by_task(10, limit=10)
 
     assert len(comments) == 2
     texts = {c._text for c in comments}
@@ -564,6 +298,41 @@ async def test_get_by_task_id_returns_comments(
         assert isinstance(c, models.Comment)
 
 
+@pytest.mark.anyio
+async def test_get_page_by_task_orders_by_created_then_id(
+        tasks_uow: TaskSQLAlchemyUnitOfWork
+):
+    base = datetime(2030, 1, 1, 12, 0, tzinfo=timezone.utc)
+    created = {1: 2, 2: 0, 3: 1, 4: 1, 5: 3}
+    tasks_uow.session.add_all([
+        orm_models.CommentOrm(
+            id=comment_id, task_id=10, author_id=1, text=f"c{comment_id}",
+            created_dttm=base + timedelta(minutes=minutes),
+        )
+        for comment_id, minutes in created.items()
+    ] + [
+        orm_models.CommentOrm(
+            id=6, task_id=20, author_id=1, text="other", created_dttm=base,
+        ),
+    ])
+    await tasks_uow.session.commit()
+    repo = tasks_uow.repos.comment
+
+    first = await repo.get_page_by_task(10, limit=2)
+    rest = await repo.get_page_by_task(10, limit=10, after_id=first[-1].id)
+    newer = await repo.get_page_by_task(
+        10, limit=10, since=base + timedelta(minutes=1)
+    )
+    foreign = await repo.get_page_by_task(10, limit=10, after_id=6)
+
+    assert [c.id for c in first] == [2, 3]
+    assert [c.id for c in rest] == [4, 1, 5]
+    assert [c.id for c in newer] == [1, 5]
+    assert foreign == []
+    assert await repo.has_comment(10, 5)
+    assert not await repo.has_comment(10, 6)
+
+
 @pytest.mark.anyio
 async def test_save_creates_new_task(tasks_uow: TaskSQLAlchemyUnitOfWork):
     repo = tasks_uow.repos.task
@@ -787,3 +556,56 @@ async def test_get_tasks_by_team(tasks_uow: TaskSQLAlchemyUnitOfWork):
 
     assert len(tasks) == 2
     assert {task.id for task in tasks} == {1, 2}
+
+
+@pytest.mark.anyio
+async def test_task_counters_add_merges_deltas(
+        tasks_uow: TaskSQLAlchemyUnitOfWork
+):
+    repo = tasks_uow.repos.counter
+    open_, done = task_status.TaskStatus.OPEN, task_status.TaskStatus.DONE
+
+    await repo.add([
+        models.TaskCounter(ids.TeamId(30), ids.UserId(20), open_, 1),
+        models.TaskCounter(ids.TeamId(30), ids.UserId(20), open_, 1),
+        models.TaskCounter(ids.TeamId(30), ids.UserId(0), done, 1),
+    ])
+    await repo.add([
+        models.TaskCounter(ids.TeamId(30), ids.UserId(20), open_, -1),
+        models.TaskCounter(ids.TeamId(30), ids.UserId(20), done, 1),
+    ])
+
+    team = await repo.get_counts(30)
+    executor = await repo.get_counts(30, 20)
+
+    assert team == {
+        open_: 1, task_status.TaskStatus.IN_PROGRESS: 0, done: 2,
+    }
+    assert executor[open_] == 1 and executor[done] == 1
+
+
+@pytest.mark.anyio
+async def test_count_overdue_skips_done_and_deleted(
+        tasks_uow: TaskSQLAlchemyUnitOfWork
+):
+    repo = tasks_uow.repos.task
+    async_session = tasks_uow.session
+
+    def task(id, deadline, executor_id=20, **kwargs):
+        return orm_models.TaskOrm(
+            id=id, supervisor_id=10, executor_id=executor_id, team_id=30,
+            deadline=deadline, title="Task", description="Desc", **kwargs,
+        )
+
+    async_session.add_all([
+        task(1, datetime(2030, 1, 1)),
+        task(2, datetime(2030, 1, 1), executor_id=21),
+        task(3, datetime(2030, 1, 1), status=task_status.TaskStatus.DONE),
+        task(4, datetime(2030, 1, 1), deleted=True),
+        task(5, datetime(2030, 3, 1)),
+    ])
+    await async_session.commit()
+
+    now = datetime(2030, 2, 1)
+    assert await repo.count_overdue(30, now=now) == 2
+    assert await repo.count_overdue(30, executor_id=20, now=now) == 1
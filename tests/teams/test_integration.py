@@ -1,7 +1,10 @@
 import pytest
+from sqlalchemy import event, select
 
 from fastapi import status
 
+from app.membership.orm_models import MembershipOrm
+
 
 @pytest.mark.anyio
 async def test_get_team_as_member(authenticated_client, test_team):
@@ -212,3 +215,245 @@ async def test_register_event_creates_teams_user(client):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert create_team_response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.anyio
+async def test_authenticated_request_uses_single_connection(
+    test_app, client
+):
+    """User lookup and the UoW share one request-scoped session."""
+    token = await _register_and_login(client, 40)
+    headers = {"Authorization": f"Bearer {token}"}
+    team_response = await client.post(
+        "/api/v1/teams", json={"team_name": "Pool"}, headers=headers
+    )
+    team_id = team_response.json()["team_id"]
+
+    engine = test_app.state.async_session.kw["bind"]
+    checkouts = []
+    listener = lambda *args: checkouts.append(args)  # noqa: E731
+    event.listen(engine.sync_engine, "checkout", listener)
+    try:
+        response = await client.get(
+            f"/api/v1/teams/{team_id}", headers=headers
+        )
+    finally:
+        event.remove(engine.sync_engine, "checkout", listener)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(checkouts) == 1
+
+
+@pytest.mark.anyio
+async def test_list_members_pages_filters_and_counts(client):
+    admin_token = await _register_and_login(client, 70)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+    team_response = await client.post(
+        "/api/v1/teams", json={"team_name": "Big Team"}, headers=admin_headers
+    )
+    team_id = team_response.json()["team_id"]
+
+    member_ids = []
+    for idx in (71, 72, 73):
+        token = await _register_and_login(client, idx)
+        me = await client.get(
+            "/api/v1/users/me", headers={"Authorization": f"Bearer {token}"}
+        )
+        member_ids.append(me.json()["id"])
+        await client.post(
+            f"/api/v1/teams/{team_id}/members",
+            json={"target_user_id": member_ids[-1], "role": "member"},
+            headers=admin_headers,
+        )
+
+    team = (await client.get(f"/api/v1/teams/{team_id}", headers=admin_headers)).json()
+    assert team["members_count"] == 4
+    assert team["members"] == []
+    assert team["is_admin"] is True
+
+    url = f"/api/v1/teams/{team_id}/members"
+    first = (await client.get(url, params={"limit": 3}, headers=admin_headers)).json()
+    assert len(first["items"]) == 3
+    assert first["next_cursor"] is not None
+    last = (await client.get(
+        url, params={"limit": 3, "cursor": first["next_cursor"]},
+        headers=admin_headers,
+    )).json()
+    assert len(last["items"]) == 1
+    assert last["next_cursor"] is None
+
+    members = (await client.get(
+        url, params={"role": "member"}, headers=admin_headers
+    )).json()
+    assert [m["user_id"] for m in members["items"]] == member_ids
+    unknown_role = await client.get(
+        url, params={"role": "owner"}, headers=admin_headers
+    )
+    assert unknown_role.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    found = (await client.get(
+        url, params={"search": "USER72"}, headers=admin_headers
+    )).json()
+    assert [m["username"] for m in found["items"]] == ["user72"]
+
+    outsider_token = await _register_and_login(client, 74)
+    forbidden = await client.get(
+        url, headers={"Authorization": f"Bearer {outsider_token}"}
+    )
+    assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.anyio
+async def test_list_my_teams_query_count_does_not_grow_with_teams(
+    client, assert_max_queries
+):
+    owner_token = await _register_and_login(client, 80)
+    owner_headers = {"Authorization": f"Bearer {owner_token}"}
+    member_token = await _register_and_login(client, 81)
+    member_headers = {"Authorization": f"Bearer {member_token}"}
+    member_id = (await client.get("/api/v1/users/me", headers=member_headers)).json()["id"]
+
+    team_ids = []
+    for number in range(6):
+        response = await client.post(
+            "/api/v1/teams", json={"team_name": f"T{number}"}, headers=owner_headers
+        )
+        team_ids.append(response.json()["team_id"])
+        await client.post(
+            f"/api/v1/teams/{team_ids[-1]}/members",
+            json={"target_user_id": member_id, "role": "manager" if number % 2 else "member"},
+            headers=owner_headers,
+        )
+
+    with assert_max_queries(4):
+        response = await client.get(
+            "/api/v1/teams", params={"limit": 4, "offset": 1}, headers=member_headers
+        )
+
+    data = response.json()
+    assert data["total"] == 6
+    assert [team["id"] for team in data["items"]] == team_ids[1:5]
+    assert [team["roles"] for team in data["items"]] == [
+        ["manager"], ["member"], ["manager"], ["member"]
+    ]
+    assert all(team["members_count"] == 2 for team in data["items"])
+    assert not any(team["is_admin"] for team in data["items"])
+
+    beyond = (await client.get(
+        "/api/v1/teams", params={"offset": 10}, headers=member_headers
+    )).json()
+    assert beyond["items"] == []
+    assert beyond["total"] == 6
+
+
+@pytest.mark.anyio
+async def test_capabilities_are_cached_and_invalidated_by_membership_events(
+    test_app, client, assert_max_queries
+):
+    admin_token = await _register_and_login(client, 90)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+    user_token = await _register_and_login(client, 91)
+    user_headers = {"Authorization": f"Bearer {user_token}"}
+    user_id = (await client.get("/api/v1/users/me", headers=user_headers)).json()["id"]
+    team_id = (await client.post(
+        "/api/v1/teams", json={"team_name": "Cached"}, headers=admin_headers
+    )).json()["team_id"]
+    url = f"/api/v1/teams/{team_id}/capabilities/me"
+    cache = test_app.state.capability_cache
+
+    assert (await client.get(url, headers=user_headers)).json()["is_member"] is False
+    await client.post(
+        f"/api/v1/teams/{team_id}/members",
+        json={"target_user_id": user_id, "role": "member"},
+        headers=admin_headers,
+    )
+    caps = (await client.get(url, headers=user_headers)).json()
+    assert caps["is_member"] is True
+    assert caps["available_roles"] == ["member"]
+
+    hits = cache.stats.hits
+    with assert_max_queries(0):
+        assert (await client.get(url, headers=user_headers)).json() == caps
+    assert cache.stats.hits == hits + 1
+
+    # Admin grants emit their own event and invalidate as well.
+    await client.post(
+        f"/api/v1/teams/{team_id}/members",
+        json={"target_user_id": user_id, "role": "admin"},
+        headers=admin_headers,
+    )
+    caps = (await client.get(url, headers=user_headers)).json()
+    assert caps["is_admin"] is True
+    assert caps["available_roles"] == ["admin", "member"]
+
+    await client.delete(
+        f"/api/v1/teams/{team_id}/members/{user_id}",
+        params={"role": "admin"},
+        headers=admin_headers,
+    )
+    await client.patch(
+        f"/api/v1/teams/{team_id}/members/{user_id}/role",
+        json={"old_role": "member", "new_role": "manager"},
+        headers=admin_headers,
+    )
+    caps = (await client.get(url, headers=user_headers)).json()
+    assert caps["is_admin"] is False
+    assert caps["is_manager"] is True
+    assert caps["create_task"] is True
+
+
+@pytest.mark.anyio
+async def test_bulk_add_members_projects_into_membership(
+    test_app, client
+):
+    admin_token = await _register_and_login(client, 100)
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+    team_id = (await client.post(
+        "/api/v1/teams", json={"team_name": "Department"}, headers=admin_headers
+    )).json()["team_id"]
+    user_ids = []
+    for idx in (101, 102, 103):
+        token = await _register_and_login(client, idx)
+        me = await client.get(
+            "/api/v1/users/me", headers={"Authorization": f"Bearer {token}"}
+        )
+        user_ids.append(me.json()["id"])
+    url = f"/api/v1/teams/{team_id}/members/bulk"
+
+    response = await client.post(url, json={"members": [
+        {"target_user_id": user_ids[0], "role": "member"},
+        {"target_user_id": user_ids[1], "role": "manager"},
+        {"target_user_id": user_ids[2], "role": "member"},
+        {"target_user_id": user_ids[0], "role": "member"},
+    ]}, headers=admin_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [m["user_id"] for m in data["added"]] == user_ids
+    assert data["skipped"] == [{"target_user_id": user_ids[0], "role": "member"}]
+
+    async with test_app.state.async_session() as session:
+        memberships = (await session.execute(
+            select(MembershipOrm.user_id, MembershipOrm.roles)
+            .where(MembershipOrm.team_id == team_id)
+        )).all()
+    admin_id = (await client.get(
+        "/api/v1/users/me", headers=admin_headers
+    )).json()["id"]
+    assert sorted(memberships) == sorted([
+        (admin_id, 4), (user_ids[0], 1), (user_ids[1], 2), (user_ids[2], 1)
+    ])
+
+    team = (await client.get(f"/api/v1/teams/{team_id}", headers=admin_headers)).json()
+    assert team["members_count"] == 4
+
+    member_token = await _register_and_login(client, 104)
+    forbidden = await client.post(url, json={"members": [
+        {"target_user_id": user_ids[0], "role": "manager"},
+    ]}, headers={"Authorization": f"Bearer {member_token}"})
+    assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+
+    unknown = await client.post(url, json={"members": [
+        {"target_user_id": 999_999, "role": "member"},
+    ]}, headers=admin_headers)
+    assert unknown.status_code == status.HTTP_404_NOT_FOUND
@@ -6,6 +6,7 @@ from app.teams.custom_exception import (
     TeamIdMissingException,
 )
 from app.core.custom_types import ids, role
+from app.core.shared.events import teams as team_event
 
 import pytest
 
@@ -26,6 +27,88 @@ class TestTeam:
         assert new_team.is_admin(admin_id)
         assert new_team.get_member(admin_id, role.UserRole.ADMIN) == member
 
+    def test_membership_index_follows_changes(self):
+        team_id = ids.TeamId(1)
+        admin_id, user_id = ids.UserId(1), ids.UserId(2)
+        team = management.create_team(admin_id, team_id)
+
+        team.add_member(user_id, role.UserRole.MEMBER)
+        team.add_member(user_id, role.UserRole.MANAGER)
+        assert team.is_member(user_id)
+        assert team.has_member(user_id, role.UserRole.MANAGER)
+
+        team.change_role(
+            user_id, role.UserRole.MEMBER, role.UserRole.ADMIN
+        )
+        assert team.is_admin(user_id)
+        assert not team.has_member(user_id, role.UserRole.MEMBER)
+        # Changing to a role the user already has drops the old entry.
+        team.change_role(
+            user_id, role.UserRole.MANAGER, role.UserRole.ADMIN
+        )
+        assert team.members == (
+            team_models.Member(admin_id, team_id, role.UserRole.ADMIN),
+            team_models.Member(user_id, team_id, role.UserRole.ADMIN),
+        )
+
+        team.remove_member(user_id, role.UserRole.ADMIN)
+        assert not team.is_member(user_id)
+        assert not team.is_admin(user_id)
+        with pytest.raises(MemberNotFoundException):
+            team.get_member(user_id, role.UserRole.ADMIN)
+
+    def test_admin_add_and_remove_record_admin_events(self):
+        team = management.create_team(ids.UserId(1), ids.TeamId(1))
+
+        team.add_member(ids.UserId(2), role.UserRole.ADMIN)
+        team.remove_member(ids.UserId(2), role.UserRole.ADMIN)
+
+        assert team.pull_events() == [
+            team_event.AdminAddTeam(team_id=1, user_id=2),
+            team_event.AdminRemoveTeam(team_id=1, user_id=2),
+        ]
+
+
+    def test_role_change_across_admin_records_admin_events(self):
+        team = management.create_team(ids.UserId(1), ids.TeamId(1))
+        team.add_member(ids.UserId(2), role.UserRole.MEMBER)
+        team.pull_events()
+
+        team.change_role(ids.UserId(2), role.UserRole.MEMBER, role.UserRole.ADMIN)
+        team.change_role(ids.UserId(2), role.UserRole.ADMIN, role.UserRole.MANAGER)
+
+        assert team.pull_events() == [
+            team_event.MemberRemoveTeam(team_id=1, user_id=2, role="member"),
+            team_event.AdminAddTeam(team_id=1, user_id=2),
+            team_event.MemberAddTeam(team_id=1, user_id=2, role="manager"),
+            team_event.AdminRemoveTeam(team_id=1, user_id=2),
+        ]
+
+
+    def test_add_members_records_one_batched_event(self):
+        team = management.create_team(ids.UserId(1), ids.TeamId(1))
+        team.add_member(ids.UserId(2), role.UserRole.MEMBER)
+
+        added = team.add_members([
+            (ids.UserId(2), role.UserRole.MEMBER),
+            (ids.UserId(3), role.UserRole.MEMBER),
+            (ids.UserId(4), role.UserRole.MANAGER),
+            (ids.UserId(3), role.UserRole.MEMBER),
+            (ids.UserId(5), role.UserRole.ADMIN),
+        ])
+
+        assert [(m.user_id, m.role) for m in added] == [
+            (3, role.UserRole.MEMBER),
+            (4, role.UserRole.MANAGER),
+            (5, role.UserRole.ADMIN),
+        ]
+        assert team.pull_events()[1:] == [
+            team_event.MembersAddTeam(
+                team_id=1, members=((3, "member"), (4, "manager"))
+            ),
+            team_event.AdminAddTeam(team_id=1, user_id=5),
+        ]
+
 
 class TestActionAdmin:
 
@@ -252,3 +252,49 @@ async def test_user_repository_save(teams_uow: TeamSQLAlchemyUnitOfWork):
 
     assert len(users) == 2
     assert {u.id for u in users} == {1, 2}
+
+
+@pytest.mark.anyio
+async def test_get_page_by_team_filters_and_pages(
+        teams_uow: TeamSQLAlchemyUnitOfWork
+):
+    async_session = teams_uow.session
+    names = ["anna", "bob", "an_drew", "andy", "carl"]
+    async_session.add_all(
+        orm_models.TeamUserOrm(id=user_id, username=name)
+        for user_id, name in enumerate(names, start=1)
+    )
+    team_orm = orm_models.TeamOrm(name="Paged")
+    team_orm.members = [
+        orm_models.MemberOrm(
+            user_id=user_id,
+            role=(role.UserRole.ADMIN if user_id == 1 else role.UserRole.MEMBER).value,
+        )
+        for user_id in range(1, len(names) + 1)
+    ]
+    async_session.add(team_orm)
+    await async_session.commit()
+    repo = teams_uow.repos.member
+
+    first = await repo.get_page_by_team(team_orm.id, limit=2)
+    rest = await repo.get_page_by_team(
+        team_orm.id, limit=10, after_id=first[-1].id
+    )
+    assert [m.username for m in first + rest] == names
+
+    members = await repo.get_page_by_team(
+        team_orm.id, limit=10, role=role.UserRole.MEMBER
+    )
+    assert [m.user_id for m in members] == [2, 3, 4, 5]
+
+    found = await repo.get_page_by_team(team_orm.id, limit=10, search="AN")
+    assert [m.username for m in found] == ["anna", "an_drew", "andy"]
+    # LIKE wildcards in the search text are matched literally.
+    found = await repo.get_page_by_team(team_orm.id, limit=10, search="n_")
+    assert [m.username for m in found] == ["an_drew"]
+
+    summary = await teams_uow.repos.team.get_summary(team_orm.id)
+    assert summary is not None
+    assert summary.members_count == len(names)
+    assert summary.members == []
+    assert await teams_uow.repos.member.get_roles(1, team_orm.id) == ["admin"]